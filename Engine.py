@@ -9,6 +9,7 @@ import os
 from random import choice, randint
 import string
 import textwrap
+import time
 
 
 import numpy as np
@@ -17,37 +18,48 @@ import tcod.tileset
 
 from AlertMode import AlertEnum
 from components.AI import FollowAI
-from components.Particle import Particle, ParticleSystem
+from components.Particle import ParticleStore
 from components.Position import Position
 from GameMessages import Message
 from DeathFunctions import kill_player, kill_mob
 from Entity import Entity
+from FrameScheduler import FrameScheduler
 from FOVFunctions import definite_enemy_fov, initialize_fov, recompute_fov
 from GameStates import GameStates
 from InputHandlers import handle_debug_menu, handle_no_action, handle_player_turn_keys, \
     handle_player_dead_keys, handle_targeting_keys, handle_inventory_keys, handle_level_up_menu, \
     handle_character_screen, no_key_action, handle_dialogue, handle_event_message
 from loader_functions.InitializeNewGame import get_constants, get_game_variables
-from loader_functions.DataLoaders import load_game, save_game
-from loader_functions.JsonReader import obtain_particles, obtain_tile_set
-from map_objects.GameMapUtils import get_blocking_entities_at_location, get_map_object_at_location
+from loader_functions.AssetRegistry import asset_path
+from loader_functions.AutoSave import AutoSaver
+from loader_functions.DataLoaders import DEFAULT_SLOT, list_save_slots, load_game, obtain_free_slot, \
+    obtain_save_path, save_game, snapshot_game, update_save_index
+from map_objects.FloorPregenerator import FloorPregenerator
+from map_objects.GameMapUtils import get_blocking_entities_at_location, get_closest_visible_enemy, \
+    get_map_object_at_location
+from map_objects.ParticlePropagation import obtain_spread_cells, PROPAGATION_RULES
+from map_objects.TileRegistry import TILES
 from Menus import character_screen, debug_menu, inventory_menu, level_up_menu, map_screen, menu, message_box, \
     select_level
-from RenderFunctions import draw_entity, draw_particle_entity, obtain_viewport_dimensions, RenderOrder, render_bar, render_viewport, render_tileset
+from PanelCache import PanelCompositor
+from RenderFunctions import draw_entity, obtain_viewport_dimensions, RenderOrder, render_bar, render_viewport, render_tileset
 
 TITLE = 'Complete the Mission'
 AUTHOR = 'Sunnigen'
 CONSTANTS = get_constants()
-TILESET = tcod.tileset.load_tilesheet('assets/dejavu_wide16x16_gs_tc.png', 32, 8, tcod.tileset.CHARMAP_TCOD)
-ROOT_CONSOLE = tcod.Console(CONSTANTS['screen_width'], CONSTANTS['screen_height'])
+FONTS = {
+    8: 'prestige8x8_gs_tc.png',
+    10: 'arial10x10.png',
+    16: 'dejavu_wide16x16_gs_tc.png'
+}
+TILESETS = {}  # font size: decoded tilesheet, only decoded once
+TILESET = None  # Created in main() so Importing the Engine (Headless Tools) doesn't Touch Fonts or Consoles
+ROOT_CONSOLE = None
 current_screen = None
 NUM_KEYS = [tcod.event.K_1, tcod.event.K_2, tcod.event.K_3, tcod.event.K_4, tcod.event.K_5, tcod.event.K_6,
             tcod.event.K_7, tcod.event.K_8, tcod.event.K_9]
 
 
-PARTICLES = obtain_particles()
-TILE_SET = obtain_tile_set()
-
 
 class Controller(tcod.event.EventDispatch):
     """
@@ -63,6 +75,10 @@ class Controller(tcod.event.EventDispatch):
     def on_draw(self):
         pass
 
+    def is_animating(self):
+        # Screens that Change without Input Return True so the Main Loop Keeps Drawing Frames
+        return False
+
     def ev_keydown(self, event: tcod.event.KeyDown):
         pass
 
@@ -80,28 +96,47 @@ class Title(Controller):
     """
     cursor_position = 0
     menu_options = ['New Game', 'Continue', 'Quit']
+    save_slots = []  # [(slot, save index entry)], most recent first
+    slot_cursor = 0
 
     def __init__(self, **kwargs):
         super(Title, self).__init__(**kwargs)
-        self.background_image = tcod.image_load('assets/menu_background.png')
+        self.background_image = tcod.image_load(asset_path('menu_background.png'))
 
-        # Check if Existing Game Exists
-        try:
-            a,b,c,d,e,f,g = load_game()
-        except FileNotFoundError:
-            print('TODO: Blank out "Continue"')
+        # Check if Existing Game Exists, only the Save Index is Read
+        self.refresh_save_slots()
 
     def on_enter(self):
         self.cursor_position = 0
+        self.refresh_save_slots()
+
+    def refresh_save_slots(self):
+        self.save_slots = list_save_slots()
+        self.slot_cursor = 0
+        if self.save_slots:
+            self.menu_options = ['New Game', 'Continue', 'Quit']
+        else:
+            self.menu_options = ['New Game', 'Quit']
+        self.cursor_position = min(self.cursor_position, len(self.menu_options) - 1)
 
+    def selected_slot(self):
+        if not self.save_slots:
+            return None
+        return self.save_slots[self.slot_cursor][0]
 
     def move_cursor(self, inc):
         self.cursor_position = (self.cursor_position + inc) % len(self.menu_options)
 
+    def move_slot_cursor(self, inc):
+        if self.save_slots:
+            self.slot_cursor = (self.slot_cursor + inc) % len(self.save_slots)
+
     def ev_keydown(self, event: tcod.event.KeyDown):
         actions = {
             tcod.event.K_DOWN: partial(self.move_cursor, 1),
             tcod.event.K_UP: partial(self.move_cursor, -1),
+            tcod.event.K_LEFT: partial(self.move_slot_cursor, -1),
+            tcod.event.K_RIGHT: partial(self.move_slot_cursor, 1),
             tcod.event.K_KP_ENTER: partial(change_screen, self.menu_options[self.cursor_position]),
             tcod.event.K_RETURN: partial(change_screen, self.menu_options[self.cursor_position]),
             tcod.event.K_ESCAPE: partial(self.ev_quit, event)
@@ -138,10 +173,199 @@ class Title(Controller):
                            alignment=tcod.CENTER)
 
         menu(ROOT_CONSOLE, '', self.menu_options, 24, screen_width, screen_height, self.cursor_position)
+        self.draw_save_slots(screen_width, screen_height)
         # render_tileset(ROOT_CONSOLE)
 
+    def draw_save_slots(self, screen_width, screen_height):
+        # Slot to Continue, Left/Right Cycles through Slots
+        for i, (slot, entry) in enumerate(self.save_slots):
+            if entry.get('legacy'):
+                description = '%s: old save' % slot
+            else:
+                description = '%s: %s, Depth %s, Lv %s, Turn %s, %s, %sKB' % (
+                    slot, entry.get('name'), entry.get('dungeon_level'), entry.get('player_level'),
+                    entry.get('turn_count'), time.strftime('%Y-%m-%d %H:%M', time.localtime(entry.get('saved_at', 0))),
+                    ceil(entry.get('file_size', 0) / 1024))
+            if i == self.slot_cursor:
+                description = '< %s >' % description
+            ROOT_CONSOLE.print(int(screen_width / 2), int(screen_height / 2) + 4 + i, description,
+                               fg=tcod.white if i == self.slot_cursor else tcod.grey,
+                               bg_blend=tcod.BKGND_DEFAULT,
+                               alignment=tcod.CENTER)
+
+
+
+class Simulation:
+    """
+    Turn pipeline of the Game screen, split from on_draw so turns can be advanced without a tcod context or a root
+    console (benchmarks, soak tests, balance runs). Game.on_draw calls step() and then draws the result.
+
+    Turn results are dispatched through TURN_RESULTS, so the mixing class must provide the Game handlers.
+    """
+
+    def step(self, action=None):
+        """
+        Run one pass of the turn pipeline. "action" is a player action as returned by the MENU_HANDLING input
+        handlers, e.g. self.wait or partial(self.move, 1, 0). Returns the resulting game state.
+        """
+        if action:
+            action()
+
+        # Log Events that Occured During Player Turn
+        # Analyze Actions User Results and Propagate Resulting Events
+        self.dispatch_turn_results(self.player_turn_results)
+        self.player_turn_results = []
+
+        # Enemy Turn to Act
+        if self.game_state == GameStates.ENEMY_TURN:
+            self.enemy_turn()
+
+        self.update_alert_mode()
+        self.update_particles()
+        self.check_game_events()
+
+        if self.fov_recompute:
+            self.update_fov()
+
+        return self.game_state
+
+    def step_many(self, n, action=None):
+        """
+        Run up to n full turns, repeating "action" each turn (the player waits when no action is given).
+        Stops early if the player dies. Returns the number of turns run.
+        """
+        turns = 0
+        for _ in range(n):
+            if self.game_state == GameStates.PLAYER_DEAD:
+                break
+
+            self.step(action or self.wait)
+            turns += 1
+
+        return turns
+
+    def dispatch_turn_results(self, turn_results):
+        for turn_result_dict in turn_results:
+            for result_key, result_val in turn_result_dict.items():
+                result_event = TURN_RESULTS.get(result_key, no_key_action)
+                result_event(self, result_val)  # pass dict.values()
+
+    def enemy_turn(self):
+        bool_spotted = -1
+        self.fov_recompute = True
+        for entity in self.entities:
+            if entity.ai:
+
+                # Pick Closest Enemy Entity and Attack
+                # Note: This doesn't take into account, if obstacles block FOV to see entity as all entities are
+                #       sharing the same FOV map. Entities will be able to target through walls if ally target on
+                #       other side has that entity in its FOV.
+
+                # Check if Current Target is Dead
+                if entity.ai.current_target:
+                    if hasattr(entity.ai.current_target, "render_order"):
+                        if entity.ai.current_target.render_order == RenderOrder.CORPSE:
+                            entity.ai.current_target = None
+
+                # Pick the Closest Visible Enemy within FOV Range
+                min_distance, entity_target = get_closest_visible_enemy(self.game_map.entity_index, entity,
+                                                                        self.player)
+                if entity_target:
+                    entity.ai.target_not_within_fov_max = min_distance + min_distance
+                    entity.ai.current_target = entity_target
+                    entity.ai.encounter.target_list.add(entity_target)
+
+                # Free/Retreat AI
+                enemy_turn_results = entity.ai.take_turn(entity.fighter.fov_mask, self.game_map, self.entities)
+
+                # Activate Actions/Events from Enemy Turn
+                for enemy_turn_result_dict in enemy_turn_results:
+                    for result_key, result_val in enemy_turn_result_dict.items():
+
+                        # Don't Dislay Messages if Entity not Within Player FOV
+                        # TODO: FOV should depend on action position, not the entity position itself.
+                        if result_key == 'message':
+                            if self.player.fighter.sees(entity.position.x, entity.position.y):
+
+                                result_event = TURN_RESULTS.get(result_key, no_key_action)
+                                result_event(self, result_val)  # pass dict.values()
+                        else:
+                            result_event = TURN_RESULTS.get(result_key, no_key_action)
+                            result_event(self, result_val)  # pass dict.values()
+
+                # Check if Player is Dead as a Result
+                if self.game_state == GameStates.PLAYER_DEAD:
+                    break
+        else:
+            self.game_state = GameStates.PLAYER_TURN
+
+        # Iterate through Encounters
+        for e in self.game_map.encounters:
+            e.unite()
+
+        # Update Turn Count
+        self.game_map.turn_count += 1
+
+        # Decrement Alert Counter if Not Spotted
+        self.alert_counter += bool_spotted
+
+        if self.alert_counter < 1:
+            self.alert_counter = 0
+
+    def update_alert_mode(self):
+        if self.alert_counter < 1:
+            if self.alert_mode == AlertEnum.SPOTTED:
+                self.alert_mode = AlertEnum.WARNING
+
+            elif self.alert_mode == AlertEnum.WARNING:
+                self.alert_mode = AlertEnum.NORMAL
+
+        elif 0 < self.alert_counter < 6:
+            self.alert_mode = AlertEnum.WARNING
+
+    def update_particles(self):
+        # Update Particles Life Time Counter
+        self.particles.age(1)
+
+        # Spread Propagating Particles (Fire, Lightning) One Cellular Automaton Step
+        for particle_system, propagate_property, xs, ys in list(self.particles.propagation_fronts()):
+            self.propagate_particles(particle_system, propagate_property, xs, ys)
+
+        # Remove Particles Past their lifetime and Particle Systems without Particles
+        self.particles.compact()
+
+    def check_game_events(self):
+        # Check for Game Events Activations
+        for game_event in self.game_map.game_events:
+
+            if game_event.check_conditions():
+                print('\n', game_event)
+                game_event_results = game_event.activate_event(self.entities, self.particles)
+                self.dispatch_turn_results(game_event_results)
+
+        # Remove Game Events if Conditions All Conditions Are True
+        self.game_map.game_events = [g for g in self.game_map.game_events if not g.check_conditions()]
+
+    def update_fov(self):
+        # Update FOV for Player
+        self.fov_map.fov[:] = recompute_fov(self.fov_map, self.player, self.game_map.temporary_vision,
+                                            CONSTANTS['fov_light_walls'], CONSTANTS['fov_algorithm'])
 
-class Game(Controller):
+        # Player Sees Whatever the FOV Map Shows, Both Indexed [y][x]
+        self.player.fighter.fov_mask = self.fov_map.fov
+
+        # Remove Temporary Vision for Next Turn
+        for x, y in self.game_map.temporary_vision:
+            self.fov_map.transparent[y][x] = TILES.transparent[self.game_map.tileset_tiles[y][x]]
+
+        self.game_map.temporary_vision = []
+
+        # Update and Combine FOV for Entities
+        self.enemy_fov_map = definite_enemy_fov(self.game_map, self.fov_map, self.game_map.entrances, self.entities,
+                                                CONSTANTS['fov_light_walls'], CONSTANTS['fov_algorithm'])
+
+
+class Game(Simulation, Controller):
     """
     Game screen that houses GUI, level, message logs, etc.
     """
@@ -164,18 +388,14 @@ class Game(Controller):
     mouse_pos = None  # mouse position relative to game map
     normal_mouse_pos = None  # mouse position relative to screen
 
-    panel = None
+    panels = None  # PanelCompositor, Message Log/Side/Popup/Dialogue/Event Message Panels
     top_panel = None
     event_panel = None
-    side_panel = None
-    popup_panel = None
 
-    particles = []
+    particles = None  # ParticleStore
     particle_systems = []
 
     # Dialogue Panel
-    dialogue_panel = None
-    event_message_panel = None
     current_dialogue = ''
     total_dialogue = []
     entity_dialogue = None
@@ -195,19 +415,33 @@ class Game(Controller):
     alert_counter = 0
     activate_alert = False
 
+    # Save Slot and Background Autosave
+    save_slot = DEFAULT_SLOT
+    autosaver = None
+    last_autosave_turn = 0
+    pregenerator = None  # Builds the Next Floor in a Worker Process
 
     def __init__(self, **kwargs):
         super(Game, self).__init__(**kwargs)
-        # Preload Existing Game
+        # Saves are Loaded when the Player Continues, not at Startup
+
+    def load_saved_game(self, slot=DEFAULT_SLOT):
+        # Returns False if the Slot has no Save
         try:
-            self.player, self.entities, self.particles, self.particle_systems, self.game_map, self.message_log, self.game_state = load_game()
+            self.player, self.entities, self.particles, self.particle_systems, self.game_map, self.message_log, self.game_state = load_game(slot)
             self.game_map.player = self.player  # connect player from screen to player from game_map
+            self.entities = self.game_map.restore_spatial_indexes(self.entities)
+            if not isinstance(self.particles, ParticleStore):
+                self.particles = ParticleStore.from_entities(self.particles)
+            self.game_map.upgrade_layers()
             self.game_map.transparent[self.player.position.y][self.player.position.x] = True  # unblock current position
             self.initialize_loaded_game()  # perform checks to ensure game is "truly" loaded
+            self.initialize_save_slot(slot)
+            self.pregenerate_next_floor()
         except FileNotFoundError:
-            pass
+            return False
 
-        # self.dialogue_panel =
+        return True
 
     def reset_mouse_targets(self):
         self.mouse_target_type = None
@@ -218,9 +452,19 @@ class Game(Controller):
     def on_enter(self):
         pass
 
+    def exit_program(self):
+        # Let a Background Autosave Finish its Rename before the Process Exits
+        if self.autosaver:
+            self.autosaver.flush()
+        if self.pregenerator:
+            self.pregenerator.shutdown()
+        super(Game, self).exit_program()
+
     def exit_current_game(self, parameter):
         # Save and Exit Current Game
-        save_game(self.player, self.entities, self.particles, self.particle_systems, self.game_map, self.message_log, self.game_state)
+        self.autosaver.flush()
+        save_game(self.player, self.entities, self.particles, self.particle_systems, self.game_map, self.message_log, self.game_state,
+                  slot=self.save_slot)
         change_screen(parameter)
 
     def ev_keydown(self, event: tcod.event.KeyDown):
@@ -250,7 +494,7 @@ class Game(Controller):
         # Block Player from Moving Through Obstacle
         if self.game_map.is_within_map(destination_x, destination_y):
 
-            map_object_entity = get_map_object_at_location(self.game_map.map_objects, destination_x, destination_y)
+            map_object_entity = get_map_object_at_location(self.game_map.map_object_index, destination_x, destination_y)
 
             # Check if Map is Walkable
             if not self.game_map.is_blocked(destination_x, destination_y):
@@ -259,8 +503,8 @@ class Game(Controller):
                 tech = "side_impact"
                 # tech = choice(["side_impact", "spin_impact", "far_impact", "blast_impact","dragons_breath_impact", None])
                 targets, targetted_spaces = get_blocking_entities_at_location(
-                    self.entities, destination_x, destination_y, self.player.position.x, self.player.position.y,
-                    technique_name=tech)
+                    self.game_map.entity_index, destination_x, destination_y, self.player.position.x,
+                    self.player.position.y, technique_name=tech)
 
                 # print("# Attack Entity or Move")
                 # print("targets: ", targets)
@@ -302,7 +546,7 @@ class Game(Controller):
                         # self.game_state = GameStates.ENEMY_TURN
                     # Spawn Hit Particles for Non-Target Spaces
                     for (x, y) in targetted_spaces:
-                        if not self.game_map.is_blocked(x, y) and (x, y) in self.player.fighter.curr_fov_map:
+                        if not self.game_map.is_blocked(x, y) and self.player.fighter.sees(x, y):
                             self.player_turn_results.append({"spawn_particle": ["hit_blank", x, y, None]})
 
                 else:
@@ -381,7 +625,7 @@ class Game(Controller):
                     #         # Spawn Hit Particles for Non-Target Spaces
                     #     print("targetted_spaces : ", targetted_spaces)
                     #     for (x, y) in targetted_spaces:
-                    #         if not self.game_map.is_blocked(x, y) and (x, y) in self.player.fighter.curr_fov_map:
+                    #         if not self.game_map.is_blocked(x, y) and self.player.fighter.sees(x, y):
                     #             self.player_turn_results.append({"spawn_particle": ["hit_blank", x, y, None]})
 
 
@@ -396,7 +640,7 @@ class Game(Controller):
 
 
 
-                    self.game_map.tile_cost[self.player.position.y][self.player.position.x] = TILE_SET.get("%s" % self.game_map.tileset_tiles[self.player.position.y][self.player.position.x]).get('tile_cost')
+                    self.game_map.tile_cost[self.player.position.y][self.player.position.x] = TILES.tile_cost[self.game_map.tileset_tiles[self.player.position.y][self.player.position.x]]
                     # self.update_mouse_pos(dx, dy)
                     self.player.position.move(dx, dy)
                     self.fov_recompute = True
@@ -434,8 +678,9 @@ class Game(Controller):
         tiles_to_check = [(self.player.position.x + 1, self.player.position.y), (self.player.position.x - 1, self.player.position.y),
                           (self.player.position.x, self.player.position.y + 1), (self.player.position.x, self.player.position.y - 1)]
 
-        for map_object_entity in self.game_map.map_objects:
-            if (map_object_entity.position.x, map_object_entity.position.y) in tiles_to_check:
+        for x, y in tiles_to_check:
+            map_object_entity = self.game_map.map_object_index.first_at(x, y)
+            if map_object_entity:
                 # "Wait" Interaction with Map Object Entity
                 wait_results = self.player.fighter.interact(map_object_entity, interact_type='wait',
                                                             target_inventory=self.player.inventory,
@@ -501,8 +746,8 @@ class Game(Controller):
         # Player is Attempting to Pick Up Item
         # Loop through each entity, check if same tile as player and is an item
 
-        for entity in self.entities:
-            if entity.position.x == self.player.position.x and entity.position.y == self.player.position.y and entity.item:
+        for entity in self.game_map.entity_index.at(self.player.position.x, self.player.position.y):
+            if entity.item:
                 pickup_results = self.player.inventory.add_item(entity)
                 self.player_turn_results.extend(pickup_results)
                 break
@@ -544,12 +789,13 @@ class Game(Controller):
     def take_stairs(self):
         # Player Found Goal and Advances to Next Level
         # TODO: Incorporate "Stairs" as a Map Object Entity with Interact/Wait functions
-        for entity in self.game_map.map_objects:
-            if entity.stairs and entity.position.x == self.player.position.x and entity.position.y == self.player.position.y:
-                self.entities, self.particles, self.particle_systems = self.game_map.next_floor(self.player, self.message_log, CONSTANTS)
+        for entity in self.game_map.map_object_index.at(self.player.position.x, self.player.position.y):
+            if entity.stairs:
+                self.advance_floor()
                 self.fov_map = initialize_fov(self.game_map)
                 self.enemy_fov_map = np.zeros(self.fov_map.transparent.shape, dtype=bool)
                 self.fov_recompute = True
+                self.autosave()
                 self.game_message()  # start message
                 break
         self.player_turn_results.append({'message': Message('There are no stairs here.', tcod.yellow)})
@@ -600,116 +846,61 @@ class Game(Controller):
             self.exit_current_game('title')
 
     def spawn_particle(self, particle_request):
-        # print('\nspawn particle:', particle_request)
-
         p_index, p_x, p_y, particle_system = particle_request
+        self.particles.spawn(p_index, p_x, p_y, particle_system)
+
+    def propagate_particles(self, particle_system, propagate_property, xs, ys):
+        rule = PROPAGATION_RULES.get(propagate_property)
+        if not rule:
+            return
+
+        p_index, damage, new_tile = rule
+        spread_xs, spread_ys = obtain_spread_cells(self.game_map, particle_system, propagate_property, xs, ys)
+        if not len(spread_xs):
+            return
+
+        # Damage the First Fighter Standing on Each New Cell
+        damage_results = []
+        for x, y in zip(spread_xs.tolist(), spread_ys.tolist()):
+            for entity in self.game_map.entity_index.at(x, y):
+                if entity.fighter:
+                    damage_results.extend(entity.fighter.take_damage(damage))
+                    break
+
+        # One Batch of Particle Spawns
+        self.particles.spawn_many(p_index, spread_xs, spread_ys, particle_system)
+
+        # One Batch of Tile Changes, Map Objects Change through their Entity
+        if new_tile is not None:
+            plain_tiles = []
+            for x, y in zip(spread_xs.tolist(), spread_ys.tolist()):
+                map_object = self.game_map.obtain_map_objects(x, y)
+                if map_object:
+                    if map_object.inventory:
+                        # Drop First so Items have a Position before Entering the Entity Index
+                        for drop_result in map_object.inventory.drop_all_items():
+                            self.entities.append(drop_result.get('item_dropped'))
+
+                    self.change_map_object([map_object, new_tile])
+                else:
+                    plain_tiles.append((y, x))
+
+            if plain_tiles:
+                self.change_tiles(plain_tiles, new_tile)
 
-        p_stats = PARTICLES.get(p_index)
-        p_name = p_stats.get("name")
-        p_lifetime = p_stats.get("lifetime")
-        p_char = p_stats.get("glyph")
-        p_fg = p_stats.get("fg")
-        p_bg = p_stats.get("bg")
-        p_within_fov = p_stats.get("within_fov")
-        p_propagate = p_stats.get("propagate", False)
-        p_propagate_property = p_stats.get("propagate_property", None)
-        p_forever = p_stats.get("forever", False)
-
-        # if particle_system:
-        #     print('\tparticle_system:')
-        #     print(particle_system.particle_list, particle_system.coordinates)
-
-        if not particle_system:
-            particle_system = ParticleSystem()
-            # print('Creating new particle there are %s particles and %s coordinates:' % (
-            #     len(particle_system.particle_list), len(particle_system.coordinates)))
-
-        if particle_system not in self.particle_systems:
-            # print('\nnew particle system there are %s particles and %s coordinates:' % (
-            #     len(particle_system.particle_list), len(particle_system.coordinates)))
-            self.particle_systems.append(particle_system)
-
-        position_component = Position(x=p_x, y=p_y)
-        particle_component = Particle(lifetime=p_lifetime, char=p_char, fg=p_fg, bg=p_bg, forever=p_forever,
-                                      propagate=p_propagate, propagate_property=p_propagate_property,
-                                      within_fov=p_within_fov, particle_system=particle_system)
-        particle_entity = Entity(char=p_char, color=p_fg, name=p_name, json_index=p_index, position=position_component,
-                                 particle=particle_component, render_order=RenderOrder.PARTICLE)
-        particle_system.particle_list.append(particle_component)
-        particle_system.coordinates.append((p_x, p_y))
-        self.particles.append(particle_entity)
-
-    def propagate_particle(self, particle_dict):
-        # print('\npropagate_particle', particle_dict)
-        for particle, val_list in particle_dict.items():
-            # print(val_list[0])
-            if val_list[0]:
-                center_x, center_y = particle.owner.position.x, particle.owner.position.y
-                directions = [(center_x - 1, center_y),
-                              (center_x + 1, center_y),
-                              (center_x, center_y + 1),
-                              (center_x, center_y - 1)]
-
-                # Propagate in all (4) Cardinal Directions
-                # print('# Propagate in all (4) Cardinal Directions')
-                for dx, dy in directions:
-
-                    # Check if Particle System Doesn't Already Have a Particle at Location
-                    # print('# Check if Particle System Doesn\'t Already Have a Particle at Location')
-                    particle_system = particle.particle_system
-                    # if particle_system:
-                    if (dx, dy) in particle_system.coordinates:
-                        continue
-
-                    tile = self.game_map.tileset_tiles[dy][dx]
-                    tile_stats = TILE_SET.get("{}".format(tile))
-                    tile_property = tile_stats.get('properties')
-                    # tile_name = tile_stats.get('name')
-                    if [val_list[1]] == tile_property:
-                        # print('spawning fire particle at (%s, %s)' % (dx, dy))
-                        # print('tile:', tile_name)
-                        # print('tile_property:', tile_property)
-
-                        if val_list[1] == 'flammable':
-
-                            # Check if Entity Exists on tile
-                            for entity in self.entities:
-                                if entity.position and entity.fighter:
-                                    if (entity.position.x, entity.position.y) == (dx, dy):
-                                        entity.fighter.take_damage(25)
-                                        break
-
-                            self.spawn_particle(('fire', dx, dy, particle_system))
-
-                            map_object = self.game_map.obtain_map_objects(dx, dy)
-
-                            new_tile = 4
-                            if map_object:
-                                if map_object.inventory:
-                                    for item in map_object.inventory.items:
-                                        self.entities.append(item)
-
-                                    map_object.inventory.drop_all_items()
-
-                                self.change_map_object([map_object, new_tile])
-                            else:
-                                new_tile_stats = TILE_SET.get('{}'.format(new_tile))
-                                scorched_ground = new_tile_stats.get("glyph")
-                                self.game_map.tileset_tiles[dy][dx] = new_tile
-                                self.game_map.tile_cost[dy][dx] = new_tile_stats.get("tile_cost")
-                                self.game_map.walkable[dy][dx] = new_tile_stats.get("walkable")
-                                self.game_map.transparent[dy][dx] = new_tile_stats.get("transparent")
-                                self.fov_map.transparent[dy][dx] = new_tile_stats.get("fov")
-                                self.enemy_fov_map[dy][dx] = new_tile_stats.get("fov")
-
-                        elif val_list[1] == 'conductor':
-                            for entity in self.entities:
-                                if entity.position and entity.fighter:
-                                    if (entity.position.x, entity.position.y) == (dx, dy):
-                                        entity.fighter.take_damage(40)
-                                        break
-                            self.spawn_particle(('lightning', dx, dy, particle_system))
+        # Fighters Burnt or Shocked to Death Die like Any Other
+        self.dispatch_turn_results(damage_results)
 
+    def change_tiles(self, cells, new_tile):
+        # Change Several Plain Tiles (no Map Object) at Once, "cells" are (y, x)
+        ys, xs = np.array(cells).T
+        self.game_map.tileset_tiles[ys, xs] = new_tile
+        self.game_map.tile_cost[ys, xs] = TILES.tile_cost[new_tile]
+        self.game_map.walkable[ys, xs] = TILES.walkable[new_tile]
+        self.game_map.transparent[ys, xs] = TILES.transparent[new_tile]
+        self.fov_map.transparent[ys, xs] = TILES.fov[new_tile]
+        self.enemy_fov_map[ys, xs] = TILES.fov[new_tile]
+        self.game_map.bump_transparency_version()
 
     @staticmethod
     def toggle_full_screen():
@@ -815,11 +1006,12 @@ class Game(Controller):
 
             self.game_map.walkable[entity.position.y][entity.position.x] = True
             self.game_map.transparent[entity.position.y][entity.position.x] = True
-            self.game_map.tile_cost[entity.position.y][entity.position.x] = self.game_map.tile_set.get(
-                "%s" % self.game_map.tileset_tiles[entity.position.y][entity.position.x]).get('tile_cost')
+            self.game_map.bump_transparency_version()
+            self.game_map.tile_cost[entity.position.y][entity.position.x] = \
+                TILES.tile_cost[self.game_map.tileset_tiles[entity.position.y][entity.position.x]]
 
         # Display Message if Within Player FOV
-        if self.fov_map.fov[entity.position.x][entity.position.y]:
+        if self.fov_map.fov[entity.position.y][entity.position.x]:
             self.display_message(message)
 
     def change_map_object(self, map_object_entity_args):
@@ -829,16 +1021,16 @@ class Game(Controller):
         y, x = map_object_entity.position.y, map_object_entity.position.x
 
         # Change Map Object Entity
-        map_object_entity.change_entity(self.game_map.tile_set.get("%s" % new_json_index), new_json_index)
+        map_object_entity.change_entity(TILES.stats(new_json_index), new_json_index)
 
         # Update Game Map
         self.game_map.tileset_tiles[y][x] = new_json_index
-        tile_stats = TILE_SET.get('%s' % new_json_index)
-        self.game_map.tile_cost[y][x] = tile_stats.get("tile_cost")
-        self.game_map.walkable[y][x] = tile_stats.get("walkable")
-        self.game_map.transparent[y][x] = tile_stats.get("transparent")
-        self.fov_map.transparent[y][x] = tile_stats.get("fov")
-        self.enemy_fov_map[y][x] = tile_stats.get("fov")
+        self.game_map.tile_cost[y][x] = TILES.tile_cost[new_json_index]
+        self.game_map.walkable[y][x] = TILES.walkable[new_json_index]
+        self.game_map.transparent[y][x] = TILES.transparent[new_json_index]
+        self.fov_map.transparent[y][x] = TILES.fov[new_json_index]
+        self.enemy_fov_map[y][x] = TILES.fov[new_json_index]
+        self.game_map.bump_transparency_version()
         self.game_state = GameStates.ENEMY_TURN
 
     def temporary_vision(self, door_entity):
@@ -894,11 +1086,12 @@ class Game(Controller):
 
     def go_to_next_level(self):
         # Debug Go to Next Level
-        self.entities, self.particles, self.particle_systems = self.game_map.next_floor(self.player, self.message_log, CONSTANTS)
+        self.advance_floor()
         self.fov_map = initialize_fov(self.game_map)
         self.fov_recompute = True
         self.game_state = GameStates.PLAYER_TURN
         self.revive_player()
+        self.autosave()
         self.game_message()  # start message
 
     def change_font_size(self, font_size):
@@ -1002,15 +1195,14 @@ class Game(Controller):
 
             self.mouse_pos = new_x, new_y
 
-    def initialize_game(self, level):
+    def initialize_game(self, level, slot=DEFAULT_SLOT):
         print('initialize_game : ', level)
         # Initialize Game Variables
         self.player, self.entities, self.particles, self.particle_systems, self.game_map, self.message_log, \
             self.game_state, dungeon_level = get_game_variables(CONSTANTS, level=level)
-        self.panel = tcod.console.Console(CONSTANTS['screen_width'], CONSTANTS['panel_height'])
         self.top_panel = tcod.console.Console(CONSTANTS['screen_width'], CONSTANTS['top_gui_height'])
         self.event_panel = tcod.console.Console(CONSTANTS['viewport_width'] * 2, CONSTANTS['viewport_height'] * 2)
-        self.side_panel = tcod.console.Console(CONSTANTS['side_panel_width'], CONSTANTS['side_panel_height'] * 2)
+        self.initialize_panels()
 
         self.fov_recompute = True
         self.fov_map = initialize_fov(self.game_map)
@@ -1023,13 +1215,66 @@ class Game(Controller):
         self.previous_game_state = self.game_state
         self.targeting_item = None
         self.alert_mode = AlertEnum.NORMAL
+        self.initialize_save_slot(slot)
+        self.pregenerate_next_floor()
+
+    def initialize_save_slot(self, slot):
+        # Autosaves go to the Game's Slot and Keep the Title Screen's Save Index Up to Date
+        if self.autosaver:
+            self.autosaver.flush()
+        self.save_slot = slot
+        self.autosaver = AutoSaver(obtain_save_path(slot), on_save=partial(update_save_index, slot))
+        self.last_autosave_turn = self.game_map.turn_count
+
+    def autosave(self):
+        # Snapshot on the Main Thread, Serialize and fsync on the AutoSaver's Worker Thread
+        self.last_autosave_turn = self.game_map.turn_count
+        self.autosaver.request(snapshot_game(self.player, self.entities, self.particles, self.particle_systems,
+                                             self.game_map, self.message_log, self.game_state))
+
+    def advance_floor(self):
+        # Use the Pre-Generated Floor if the Worker Finished it, Otherwise Generate it Now
+        floor = self.pregenerator.take(self.game_map, self.player) if self.pregenerator else None
+        if floor:
+            self.game_map, self.entities, self.particles, self.particle_systems = floor
+            self.game_map.announce_floor(self.player, self.message_log)
+        else:
+            self.entities, self.particles, self.particle_systems = self.game_map.next_floor(self.player,
+                                                                                            self.message_log, CONSTANTS)
+        self.pregenerate_next_floor()
+
+    def pregenerate_next_floor(self):
+        if not CONSTANTS['pregenerate_floors']:
+            return
+        if self.pregenerator is None:
+            self.pregenerator = FloorPregenerator(CONSTANTS)
+        self.pregenerator.request(self.game_map, self.player)
+
+    def check_autosave(self):
+        # Periodic Autosave, only at the Start of a Player Turn so Saves are Never Mid-Turn (or of a Dead Player)
+        interval = CONSTANTS['autosave_interval']
+        if not interval or self.game_state != GameStates.PLAYER_TURN or self.player_turn_results:
+            return
+        if self.game_map.turn_count - self.last_autosave_turn >= interval:
+            self.autosave()
 
     def initialize_loaded_game(self):
-        self.panel = tcod.console.Console(CONSTANTS['screen_width'], CONSTANTS['panel_height'])
         self.top_panel = tcod.console.Console(CONSTANTS['screen_width'], CONSTANTS['top_gui_height'])
+        self.event_panel = tcod.console.Console(CONSTANTS['viewport_width'] * 2, CONSTANTS['viewport_height'] * 2)
+        self.initialize_panels()
         self.fov_map = initialize_fov(self.game_map)
         self.enemy_fov_map = np.zeros(self.fov_map.transparent.shape, dtype=bool)
 
+    def is_animating(self):
+        # Pending Turns, Live Particles, Alert Frame Lerp and Dialogue Typing all Need Frames without Input
+        if self.player_turn_results or self.game_state == GameStates.ENEMY_TURN:
+            return True
+        if self.particles:
+            return True
+        if self.alert_mode not in (None, AlertEnum.NORMAL):
+            return True
+        return self.game_state == GameStates.DIALOGUE and bool(self.total_dialogue)
+
     def on_draw(self):
         global ROOT_CONSOLE, TURN_RESULTS
         # """
@@ -1120,189 +1365,9 @@ class Game(Controller):
         # """
         # return
 
-        # Log Events that Occured During Player Turn
-        # Analyze Actions User Results and Propagate Resulting Events
-        for player_turn_result_dict in self.player_turn_results:
-            for result_key, result_val in player_turn_result_dict.items():
-                result_event = TURN_RESULTS.get(result_key, no_key_action)
-                result_event(self, result_val)  # pass dict.values()
-        self.player_turn_results = []
-
-        # # Elevate to Alert Mode
-        # if self.alert_mode == AlertEnum.WARNING and entity.ai.current_target == self.player:
-        #     self.alert_mode = AlertEnum.SPOTTED
-
-        # Enemy Turn to Act
-        bool_spotted = -1
-        if self.game_state == GameStates.ENEMY_TURN:
-            self.fov_recompute = True
-            for entity in self.entities:
-                if entity.ai:
-
-                    # Pick Closest Enemy Entity and Attack
-                    # Note: This doesn't take into account, if obstacles block FOV to see entity as all entities are
-                    #       sharing the same FOV map. Entities will be able to target through walls if ally target on
-                    #       other side has that entity in its FOV.
-
-                    # Check if Current Target is Dead
-                    if entity.ai.current_target:
-                        # if hasattr(entity.ai.current_target, "fighter"):
-                        if hasattr(entity.ai.current_target, "render_order"):
-                            if entity.ai.current_target.render_order == RenderOrder.CORPSE:
-                                entity.ai.current_target = None
-
-                    # If Entity doesn't have a Current Target
-                    # TODO: Condense this disgusting IF structure:
-                    #       1. Check if no current target
-                    #       2. AI exist or is Player
-                    #       3. Within Distance
-                    #       4. Within FOV
-                    #       5. Add Target and Dist Val to Dictionary
-                    #       6. Pick min distance value
-                    # if not entity.ai.current_target:
-                    close_entities = {}
-                    for other_entity in self.entities:
-
-                        # Check if AI
-                        if other_entity.ai or other_entity is self.player:
-
-                            # Check if Enemy Faction
-                            if entity.faction.check_enemy(other_entity.faction.faction_name):
-
-                                # Check within Distance and Entity's FOV
-                                distance = int(entity.position.distance_to(other_entity.position.x, other_entity.position.y)) + 1
-                                if distance <= entity.fighter.fov_range and \
-                                        (other_entity.position.y, other_entity.position.x) in entity.fighter.curr_fov_map:
-                                        # self.enemy_fov_map[other_entity.position.y][other_entity.position.x]:
-
-                                    # Add Target to Dict of Possible Targets by Distance
-                                    close_entities[distance] = other_entity
-
-                    # close_entities = {int(entity.position.distance_to(other_entity.position.x, other_entity.position.y)) + 1:other_entity for other_entity in self.entities \
-                    #                   if (other_entity.ai or other_entity is self.player) and }
-                    # If Possible Targets, Finally Select The Closest Target
-                    if close_entities:
-                        min_distance = min(close_entities.keys())
-                        entity_target = close_entities[min_distance]
-                        entity.ai.target_not_within_fov_max = min_distance + min_distance
-                        entity.ai.current_target = entity_target
-                        entity.ai.encounter.target_list.add(entity_target)
-
-                    # Elevate to Alert Mode
-                    # if self.alert_counter > 6 and entity.ai.current_target == self.player:
-                    #     self.alert_mode = AlertEnum.SPOTTED
-                    #     self.alert_counter = 10
-                    #
-                    # # Check if Player is Spotted
-                    # if (self.player.position.y, self.player.position.x) in entity.fighter.curr_fov_map and \
-                    #         entity.faction.check_enemy(self.player.faction.faction_name):
-                    #     bool_spotted = 1
-                    #
-                    # # Seek Player if Alert Mode is Escalated
-                    # if self.alert_mode == AlertEnum.SPOTTED and self.alert_counter == 11:
-                    #     if not entity.ai.current_target and entity.faction.check_enemy(self.player.faction.faction_name):
-                    #         entity.ai.current_target = self.player
-                    #         entity.ai.path = []
-
-                    # Free/Retreat AI
-                    enemy_turn_results = entity.ai.take_turn(entity.fighter.curr_fov_map, self.game_map, self.entities)
-
-                    # Activate Actions/Events from Enemy Turn
-                    for enemy_turn_result_dict in enemy_turn_results:
-                        for result_key, result_val in enemy_turn_result_dict.items():
-
-                            # Don't Dislay Messages if Entity not Within Player FOV
-                            # TODO: FOV should depend on action position, not the entity position itself.
-                            if result_key == 'message':
-                                if (entity.position.y, entity.position.x) in self.player.fighter.curr_fov_map:
-
-                                    result_event = TURN_RESULTS.get(result_key, no_key_action)
-                                    result_event(self, result_val)  # pass dict.values()
-                            else:
-                                result_event = TURN_RESULTS.get(result_key, no_key_action)
-                                result_event(self, result_val)  # pass dict.values()
-
-                    # Check if Player is Dead as a Result
-                    if self.game_state == GameStates.PLAYER_DEAD:
-                        break
-            else:
-                self.game_state = GameStates.PLAYER_TURN
-
-            # Iterate through Encounters
-            for e in self.game_map.encounters:
-                e.unite()
-
-            # Update Turn Count
-            self.game_map.turn_count += 1
-
-            # Decrement Alert Counter if Not Spotted
-            self.alert_counter += bool_spotted
-
-            if self.alert_counter < 1:
-                self.alert_counter = 0
-
-        if self.alert_counter < 1:
-            if self.alert_mode == AlertEnum.SPOTTED:
-                self.alert_mode = AlertEnum.WARNING
-
-            elif self.alert_mode == AlertEnum.WARNING:
-                self.alert_mode = AlertEnum.NORMAL
-
-        elif 0 < self.alert_counter < 6:
-            self.alert_mode = AlertEnum.WARNING
-
-        # elif self.alert_counter > 5:
-        #     self.alert_mode = AlertEnum.SPOTTED
-
-        # Update Particles Life Time Counter
-        particle_results = []
-        for p in self.particles:
-            particle_results.append(p.particle.update(1))
-
-        for result in particle_results:
-            self.propagate_particle(result)
-
-        # Remove Particles Past their lifetime
-        self.particles = [p for p in self.particles if p.particle.lifetime > 0]
-
-        # Remove Particle Systems if No Particles
-        self.particle_systems = [p_sys for p_sys in self.particle_systems if len(p_sys.particle_list) > 0]
-
-        # Check for Game Events Activations
-        for game_event in self.game_map.game_events:
-
-            if game_event.check_conditions():
-                print('\n', game_event)
-                game_event_results = game_event.activate_event(self.entities, self.particles)
-
-                for game_event_result_dict in game_event_results:
-
-                    for result_key, result_val in game_event_result_dict.items():
-                        result_event = TURN_RESULTS.get(result_key, no_key_action)
-                        result_event(self, result_val)  # pass dict.values()
-
-        # Remove Game Events if Conditions All Conditions Are True
-        self.game_map.game_events = [g for g in self.game_map.game_events if not g.check_conditions()]
-
-        if self.fov_recompute:
-            # Update FOV for Player
-            self.fov_map.fov[:] = recompute_fov(self.fov_map, self.player, self.game_map.temporary_vision,
-                                                        CONSTANTS['fov_light_walls'], CONSTANTS['fov_algorithm'])
-
-            # Obtain all True Coordinates from fov_map and assign to Player
-            curr_fov_map = np.where(self.fov_map.fov==True)
-            self.player.fighter.curr_fov_map = list(zip(curr_fov_map[0], curr_fov_map[1]))
-
-            # Remove Temporary Vision for Next Turn
-            for x, y in self.game_map.temporary_vision:
-                fov_boolean = TILE_SET.get('%s' % self.game_map.tileset_tiles[y][x]).get('transparent')
-                self.fov_map.transparent[y][x] = fov_boolean
-
-            self.game_map.temporary_vision = []
-            
-            # Update and Combine FOV for Entities
-            self.enemy_fov_map = definite_enemy_fov(self.game_map, self.fov_map, self.game_map.entrances, self.entities,
-                                               CONSTANTS['fov_light_walls'], CONSTANTS['fov_algorithm'])
+        # Advance the Turn Pipeline, then Draw the Result
+        self.step()
+        self.check_autosave()
 
         # Actual Drawing
         self.event_panel.clear()
@@ -1324,9 +1389,8 @@ class Game(Controller):
 
         # Sort Draw Order to Sort by Render Order Enum Value and if Within Screen,
         entities_under_mouse = []
-        # _entities_in_render_order = [entity for entity in self.entities + self.particles if entity.position]
         entities_in_render_order = sorted(
-            [entity for entity in self.entities + self.particles if view_x_start <= entity.position.x < view_x_end and view_y_start <= entity.position.y < view_y_end and entity.position],
+            [entity for entity in self.entities if entity.position and view_x_start <= entity.position.x < view_x_end and view_y_start <= entity.position.y < view_y_end],
             key=lambda x: x.render_order.value
         )
         # Draw all entities in the list
@@ -1335,15 +1399,15 @@ class Game(Controller):
             # Find Entity Under Mouse since we're looping :D
             if self.mouse_pos:
                 if entity.position.x == self.mouse_pos[0] and entity.position.y == self.mouse_pos[1] and \
-                        self.fov_map.fov[self.mouse_pos[0]][self.mouse_pos[1]] and not entity.particle:
+                        self.fov_map.fov[self.mouse_pos[1]][self.mouse_pos[0]]:
                     entities_under_mouse.append(entity)
 
-            if entity.particle:
-                draw_particle_entity(self.event_panel, entity, self.fov_map, self.reveal_all, view_x_start,
-                                     view_y_start, viewport_width_start, viewport_height_start)
-            else:
-                draw_entity(self.event_panel, entity, self.fov_map, self.game_map, self.reveal_all, view_x_start, view_x_end,
-                            view_y_start, view_y_end, viewport_width_start, viewport_height_start)
+            draw_entity(self.event_panel, entity, self.fov_map, self.game_map, self.reveal_all, view_x_start, view_x_end,
+                        view_y_start, view_y_end, viewport_width_start, viewport_height_start)
+
+        # Particles Render Above Everything, Drawn as One Batch
+        self.particles.draw(self.event_panel, self.fov_map.fov, self.reveal_all, view_x_start, view_x_end, view_y_start,
+                            view_y_end, viewport_width_start, viewport_height_start)
 
         # Alert Mode GUI
         if self.alert_mode != AlertEnum.NORMAL:
@@ -1405,14 +1469,9 @@ class Game(Controller):
                 if frame_y < 1:
                     frame_y = 1
 
-            popup_panel = tcod.console.Console(info_pane_width, line_count+1)
-            popup_panel.print_box(x=1, y=1, width=info_pane_width - 2, height=line_count+1, string=info[2:])
-
-            popup_panel.draw_frame(x=0, y=0, width=info_pane_width, height=line_count+1, title='', fg=frame_color,
-                                   bg=tcod.black, clear=False, bg_blend=tcod.BKGND_SCREEN)
-
-            popup_panel.blit(dest=self.event_panel, dest_x=frame_x, dest_y=frame_y, src_x=0, src_y=0,
-                             width=info_pane_width, height=line_count+1)
+            self.panels.get('popup').ensure_size(info_pane_width, line_count + 1)
+            self.panels.draw('popup', self.event_panel, frame_x, frame_y, (info, line_count, frame_color), info,
+                             info_pane_width, line_count, frame_color, width=info_pane_width, height=line_count + 1)
 
         # Frame
         self.event_panel.draw_frame(0, 0, self.event_panel.width, self.event_panel.height,
@@ -1433,17 +1492,12 @@ class Game(Controller):
             # frame_y = (self.event_panel.height // 2) - pane_height // 2
             frame_x = 2
             frame_y = 2
-            self.dialogue_panel = tcod.console.Console(self.dialogue_pane_width, self.dialogue_line_count)
-            self.dialogue_panel.clear()
-
-            self.dialogue_panel.draw_frame(x=0, y=0, width=self.dialogue_pane_width, height=self.dialogue_line_count,
-                                           title='', fg=frame_color, bg=tcod.black, clear=True, bg_blend=tcod.BKGND_SCREEN)
-            self.dialogue_panel.print_box(x=1, y=1, width=self.dialogue_pane_width - 2,
-                                          height=self.dialogue_line_count,
-                                          string='{}\n\n{}'.format(dialogue_name, self.current_dialogue))
-
-            self.dialogue_panel.blit(dest=self.event_panel, dest_x=frame_x, dest_y=frame_y, src_x=0, src_y=0,
-                                     width=self.dialogue_pane_width, height=self.dialogue_line_count)
+            dialogue_text = '{}\n\n{}'.format(dialogue_name, self.current_dialogue)
+            self.panels.get('dialogue').ensure_size(self.dialogue_pane_width, self.dialogue_line_count)
+            self.panels.draw('dialogue', self.event_panel, frame_x, frame_y,
+                             (dialogue_text, self.dialogue_pane_width, self.dialogue_line_count, frame_color),
+                             dialogue_text, self.dialogue_pane_width, self.dialogue_line_count, frame_color,
+                             width=self.dialogue_pane_width, height=self.dialogue_line_count)
             # self.end_dialogue()
 
         if self.game_state == GameStates.EVENT_MESSAGE:
@@ -1453,75 +1507,125 @@ class Game(Controller):
             event_message_panel_height = CONSTANTS.get("viewport_height")
             # event_message_panel_height = ceil(len(msg) / event_message_panel_width) + new_lines
 
-            self.event_message_panel = tcod.console.Console(event_message_panel_width, event_message_panel_height)
-            self.event_message_panel.clear()
-
             # msg = "".join(choice(string.ascii_letters) for _ in range(randint(25, 50)))
 
-
-
-            self.event_message_panel.draw_frame(x=0, y=0, width=event_message_panel_width,
-                                                height=event_message_panel_height
-                                                , title='', fg=frame_color, bg=tcod.black,
-                                                clear=True, bg_blend=tcod.BKGND_SCREEN)
-            self.event_message_panel.print_box(x=1, y=1, width=event_message_panel_width-2,
-                                               height=event_message_panel_height-2, string=msg,
-                                               alignment=tcod.CENTER)
-            self.event_message_panel.blit(dest=self.event_panel, dest_x=CONSTANTS.get("viewport_width") - event_message_panel_width//2,
-                                          dest_y=CONSTANTS.get("viewport_height") - (event_message_panel_height//2),
-                                          src_x=0, src_y=0, width=event_message_panel_width, height=event_message_panel_height)
+            self.panels.draw('event_message', self.event_panel,
+                             CONSTANTS.get("viewport_width") - event_message_panel_width // 2,
+                             CONSTANTS.get("viewport_height") - (event_message_panel_height // 2),
+                             (msg, frame_color), msg, frame_color,
+                             width=event_message_panel_width, height=event_message_panel_height)
 
         # Actual Game Screen
         self.event_panel.blit(dest=ROOT_CONSOLE, dest_x=0, dest_y=0, src_x=0, src_y=0,
                               width=self.event_panel.width, height=self.event_panel.height)
         # Draw Console to Screen
         # Player UI Panel
-        self.panel.clear()
-        self.panel.draw_frame(0, 0, CONSTANTS['screen_width'], CONSTANTS['panel_height'], fg=frame_color, clear=False,
-                              bg_blend=tcod.BKGND_NONE)
+        self.panels.draw('messages', ROOT_CONSOLE, 0, CONSTANTS['panel_y'], (self.message_log.version, frame_color),
+                         frame_color, width=CONSTANTS['screen_width'], height=CONSTANTS['panel_height'])
+
+        # Side Panel for Enemy Display Status Effects etc.
+        fighter = self.player.fighter
+        side_panel_key = (fighter.hp, fighter.max_hp, fighter.power, fighter.defense, self.player.level.current_xp,
+                          self.player.level.experience_to_next_level, self.game_map.turn_count, id(self.game_map),
+                          self.game_map.transparency_version, self.mouse_pos, frame_color)
+        self.panels.draw('side', ROOT_CONSOLE, CONSTANTS['viewport_width'] * 2, 0, side_panel_key, frame_color,
+                         width=CONSTANTS['side_panel_width'], height=CONSTANTS['side_panel_height'])
+
+        # Entity Display
+        # # tcod.console_clear(top_panel)
+        # top_panel.clear()
+        # tcod.console_set_default_foreground(top_panel, tcod.light_gray)
+        # test = ''
+        #
+        # for i in range(1, 1000):
+        #     test += "%c%c%c%c " % (tcod.COLCTRL_FORE_RGB, random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)) + \
+        #        random.choice(string.ascii_letters) + "%c" % tcod.COLCTRL_STOP
+        #     if i % screen_width == 0:
+        #         test += " \n"
+        # # x: int, y: int, string: str, fg: Optional[Tuple[int, int, int]] = None, bg: Optional[
+        #     # Tuple[int, int, int]] = None, bg_blend: int = 1, alignment: int =
+        # top_panel.print(x=0, y=0, string=test, fg=tcod.light_gray)
+        #
+        # tcod.console_blit(top_panel, 0, 0, screen_width, top_gui_height, 0, 0, top_gui_y)
+
+        IN_GAME_MENU = {GameStates.SHOW_INVENTORY:
+                            partial(inventory_menu, ROOT_CONSOLE,
+                                    'Press the key next to an item to use it, or Esc to cancel.\n',
+                                    self.player, 50, CONSTANTS['screen_width'], CONSTANTS['screen_height']),
+                        GameStates.DROP_INVENTORY:
+                            partial(inventory_menu, ROOT_CONSOLE,
+                                    'Press the key next to an item to drop it, or Esc to cancel.\n',
+                                    self.player, 50, CONSTANTS['screen_width'], CONSTANTS['screen_height']),
+                        GameStates.DEBUG_MENU:
+                            partial(debug_menu, ROOT_CONSOLE, 'Debug Menu\n', 30, CONSTANTS['screen_width'],
+                                    CONSTANTS['screen_height']),
+                        GameStates.LEVEL_UP:
+                            partial(level_up_menu, ROOT_CONSOLE, 'Level up! Choose a stat to raise:', self.player, 30,
+                                    CONSTANTS['screen_width'], CONSTANTS['screen_height']),
+                        GameStates.CHARACTER_SCREEN:
+                            partial(character_screen, self.player, 30, 10, CONSTANTS['screen_width'],
+                                    CONSTANTS['screen_height']),
+                        GameStates.READ:
+                            partial(map_screen, ROOT_CONSOLE, self.entities, self.game_map, "Dungeon Map",
+                                    int(self.game_map.width * 0.75), int(self.game_map.height * 0.75),
+                                    CONSTANTS['screen_width'], CONSTANTS['screen_height'], CONSTANTS['panel_height'])
+        }
+
+        IN_GAME_MENU.get(self.game_state, no_key_action)()
+        self.fov_recompute = False
+
+    def initialize_panels(self):
+        # Persistent UI Consoles, Re-rendered only when the State they Display Changes
+        self.panels = PanelCompositor()
+        self.panels.add('messages', CONSTANTS['screen_width'], CONSTANTS['panel_height'], self.render_message_panel)
+        self.panels.add('side', CONSTANTS['side_panel_width'], CONSTANTS['side_panel_height'], self.render_side_panel)
+        self.panels.add('popup', 16, 1, self.render_popup_panel)
+        self.panels.add('dialogue', self.dialogue_pane_width, 1, self.render_dialogue_panel)
+        self.panels.add('event_message', ceil(CONSTANTS.get("viewport_width") * 1.5), CONSTANTS.get("viewport_height"),
+                        self.render_event_message_panel)
+
+    def render_message_panel(self, console, frame_color):
+        console.draw_frame(0, 0, CONSTANTS['screen_width'], CONSTANTS['panel_height'], fg=frame_color, clear=False,
+                           bg_blend=tcod.BKGND_NONE)
 
         # Print the game Messages, one line at a time
         y = 1
         for message in self.message_log.messages:
-            self.panel.print(self.message_log.x, y, message.text, fg=message.color)
+            console.print(self.message_log.x, y, message.text, fg=message.color)
             y += 1
 
-        self.panel.blit(dest=ROOT_CONSOLE, dest_x=0, dest_y=CONSTANTS['panel_y'], src_x=0, src_y=0,
-                        width=CONSTANTS['screen_width'], height=CONSTANTS['panel_height'],)
-
-        # Side Panel for Enemy Display Status Effects etc.
-        self.side_panel.clear()
-        self.side_panel.draw_frame(0, 0, CONSTANTS['side_panel_width'], CONSTANTS['side_panel_height'], fg=frame_color,
-                                   clear=False, bg_blend=tcod.BKGND_DEFAULT)
+    def render_side_panel(self, console, frame_color):
+        console.draw_frame(0, 0, CONSTANTS['side_panel_width'], CONSTANTS['side_panel_height'], fg=frame_color,
+                           clear=False, bg_blend=tcod.BKGND_DEFAULT)
 
         # Display Character Level
         # self.side_panel.print(CONSTANTS['bar_width'] // 2 + 1, 1, "{}".format(self.alert_mode),
         #                       fg=tcod.light_gray, bg_blend=tcod.BKGND_NONE, alignment=tcod.CENTER)
         # Render HP Bar
-        render_bar(self.side_panel, 1, 2, CONSTANTS['bar_width'], 'HP', self.player.fighter.hp,
+        render_bar(console, 1, 2, CONSTANTS['bar_width'], 'HP', self.player.fighter.hp,
                    self.player.fighter.max_hp, tcod.light_red, tcod.darker_red)
 
         # Render XP Bar
-        render_bar(self.side_panel, 1, 3, CONSTANTS['bar_width'], 'XP', self.player.level.current_xp,
+        render_bar(console, 1, 3, CONSTANTS['bar_width'], 'XP', self.player.level.current_xp,
                    self.player.level.experience_to_next_level, tcod.darker_yellow, tcod.darkest_yellow)
 
         # Display ATT/DEF
-        self.side_panel.print(1, 5, 'STR: %s\nDEF: %s' % (self.player.fighter.power, self.player.fighter.defense),
-                              fg=tcod.light_gray, bg_blend=tcod.BKGND_NONE, alignment=tcod.LEFT)
+        console.print(1, 5, 'STR: %s\nDEF: %s' % (self.player.fighter.power, self.player.fighter.defense),
+                      fg=tcod.light_gray, bg_blend=tcod.BKGND_NONE, alignment=tcod.LEFT)
 
         # Display Turn Count
-        self.side_panel.print(1, 6, 'CurrentTurn:{}'.format(self.game_map.turn_count), fg=tcod.light_gray,
-                              bg_blend=tcod.BKGND_NONE, alignment=tcod.LEFT)
+        console.print(1, 6, 'CurrentTurn:{}'.format(self.game_map.turn_count), fg=tcod.light_gray,
+                      bg_blend=tcod.BKGND_NONE, alignment=tcod.LEFT)
         # Display Alert Counter
         # self.side_panel.print(1, 7, 'AlertCounter:{}'.format(self.alert_counter), fg=tcod.light_gray,
         #                       bg_blend=tcod.BKGND_NONE, alignment=tcod.LEFT)
 
         # Dislay Technique Slots
-        self.side_panel.print(2, 11, "1", fg=tcod.white,
-                              bg_blend=tcod.BKGND_NONE, alignment=tcod.CENTER)
+        console.print(2, 11, "1", fg=tcod.white,
+                      bg_blend=tcod.BKGND_NONE, alignment=tcod.CENTER)
 
-        self.side_panel.draw_frame(1, 10, 3, 3, fg=tcod.pink,
-                                   clear=False, bg_blend=tcod.BKGND_DEFAULT)
+        console.draw_frame(1, 10, 3, 3, fg=tcod.pink,
+                           clear=False, bg_blend=tcod.BKGND_DEFAULT)
 
 
         # Terrain Under Mouse Display
@@ -1530,7 +1634,7 @@ class Game(Controller):
 
             # Tile Data
             tile = self.game_map.tileset_tiles[mouse_y][mouse_x]
-            _tile = self.game_map.tile_set.get("%s" % tile)
+            _tile = TILES.stats(tile)
             name = "%s\nCost: %s\n(%s, %s)" % (_tile.get("name"), self.game_map.tile_cost[mouse_y][mouse_x],
                                                    mouse_x, mouse_y)
             # Room Type
@@ -1539,54 +1643,25 @@ class Game(Controller):
                 #                                 mouse_y + view_y_start + viewport_height_start):
                 if room.check_point_within_room(mouse_x, mouse_y):
                     name += "\nRoom: %s" % room.room_type
-            self.side_panel.print(1, CONSTANTS['side_panel_height'] - 5, string=name, fg=tcod.light_gray,
-                                  bg_blend=tcod.BKGND_NONE, alignment=tcod.LEFT)
+            console.print(1, CONSTANTS['side_panel_height'] - 5, string=name, fg=tcod.light_gray,
+                          bg_blend=tcod.BKGND_NONE, alignment=tcod.LEFT)
 
-        self.side_panel.blit(dest=ROOT_CONSOLE, dest_x=CONSTANTS['viewport_width'] * 2, dest_y=0, src_x=0, src_y=0,
-                             width=CONSTANTS['side_panel_width'], height=CONSTANTS['side_panel_height'], )
+    def render_popup_panel(self, console, info, info_pane_width, line_count, frame_color):
+        console.print_box(x=1, y=1, width=info_pane_width - 2, height=line_count+1, string=info[2:])
 
-       # Entity Display
-        # # tcod.console_clear(top_panel)
-        # top_panel.clear()
-        # tcod.console_set_default_foreground(top_panel, tcod.light_gray)
-        # test = ''
-        #
-        # for i in range(1, 1000):
-        #     test += "%c%c%c%c " % (tcod.COLCTRL_FORE_RGB, random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)) + \
-        #        random.choice(string.ascii_letters) + "%c" % tcod.COLCTRL_STOP
-        #     if i % screen_width == 0:
-        #         test += " \n"
-        # # x: int, y: int, string: str, fg: Optional[Tuple[int, int, int]] = None, bg: Optional[
-        #     # Tuple[int, int, int]] = None, bg_blend: int = 1, alignment: int =
-        # top_panel.print(x=0, y=0, string=test, fg=tcod.light_gray)
-        #
-        # tcod.console_blit(top_panel, 0, 0, screen_width, top_gui_height, 0, 0, top_gui_y)
+        console.draw_frame(x=0, y=0, width=info_pane_width, height=line_count+1, title='', fg=frame_color,
+                           bg=tcod.black, clear=False, bg_blend=tcod.BKGND_SCREEN)
 
-        IN_GAME_MENU = {GameStates.SHOW_INVENTORY:
-                            partial(inventory_menu, ROOT_CONSOLE,
-                                    'Press the key next to an item to use it, or Esc to cancel.\n',
-                                    self.player, 50, CONSTANTS['screen_width'], CONSTANTS['screen_height']),
-                        GameStates.DROP_INVENTORY:
-                            partial(inventory_menu, ROOT_CONSOLE,
-                                    'Press the key next to an item to drop it, or Esc to cancel.\n',
-                                    self.player, 50, CONSTANTS['screen_width'], CONSTANTS['screen_height']),
-                        GameStates.DEBUG_MENU:
-                            partial(debug_menu, ROOT_CONSOLE, 'Debug Menu\n', 30, CONSTANTS['screen_width'],
-                                    CONSTANTS['screen_height']),
-                        GameStates.LEVEL_UP:
-                            partial(level_up_menu, ROOT_CONSOLE, 'Level up! Choose a stat to raise:', self.player, 30,
-                                    CONSTANTS['screen_width'], CONSTANTS['screen_height']),
-                        GameStates.CHARACTER_SCREEN:
-                            partial(character_screen, self.player, 30, 10, CONSTANTS['screen_width'],
-                                    CONSTANTS['screen_height']),
-                        GameStates.READ:
-                            partial(map_screen, ROOT_CONSOLE, self.entities, self.game_map, "Dungeon Map",
-                                    int(self.game_map.width * 0.75), int(self.game_map.height * 0.75),
-                                    CONSTANTS['screen_width'], CONSTANTS['screen_height'], CONSTANTS['panel_height'])
-        }
+    def render_dialogue_panel(self, console, dialogue_text, dialogue_pane_width, dialogue_line_count, frame_color):
+        console.draw_frame(x=0, y=0, width=dialogue_pane_width, height=dialogue_line_count,
+                           title='', fg=frame_color, bg=tcod.black, clear=True, bg_blend=tcod.BKGND_SCREEN)
+        console.print_box(x=1, y=1, width=dialogue_pane_width - 2, height=dialogue_line_count, string=dialogue_text)
 
-        IN_GAME_MENU.get(self.game_state, no_key_action)()
-        self.fov_recompute = False
+    def render_event_message_panel(self, console, msg, frame_color):
+        console.draw_frame(x=0, y=0, width=console.width, height=console.height, title='', fg=frame_color,
+                           bg=tcod.black, clear=True, bg_blend=tcod.BKGND_SCREEN)
+        console.print_box(x=1, y=1, width=console.width-2, height=console.height-2, string=msg,
+                          alignment=tcod.CENTER)
 
 
 class GameMode(Controller):
@@ -1640,11 +1715,21 @@ class GameMode(Controller):
         menu(ROOT_CONSOLE, 'Select Level', self.menu_names, 40, screen_width, screen_height, self.cursor_position)
 
 
-SCREENS = {
-    'title': Title(name='title_screen'),
-    'gamemode': GameMode(name='game_mode_screen'),
-    'game': Game(name='game_screen')
-}
+SCREENS = {}
+
+
+def initialize_screens():
+    SCREENS['title'] = Title(name='title_screen')
+    SCREENS['gamemode'] = GameMode(name='game_mode_screen')
+    SCREENS['game'] = Game(name='game_screen')
+    return SCREENS
+
+
+def initialize_root_console(font_size=16):
+    global ROOT_CONSOLE, TILESET
+    TILESET = obtain_tileset(font_size)
+    ROOT_CONSOLE = tcod.Console(CONSTANTS['screen_width'], CONSTANTS['screen_height'])
+    return ROOT_CONSOLE
 
 
 def change_screen(parameter):
@@ -1652,10 +1737,12 @@ def change_screen(parameter):
 
     if parameter == 'New Game':
         current_screen = SCREENS.get('gamemode')
-        SCREENS.get('game').initialize_game('resinfaire')
+        SCREENS.get('game').initialize_game('resinfaire', obtain_free_slot())
         current_screen = SCREENS.get('game')
     elif parameter == 'Continue':
-        current_screen = SCREENS.get('game')
+        slot = SCREENS.get('title').selected_slot()
+        if slot and SCREENS.get('game').load_saved_game(slot):
+            current_screen = SCREENS.get('game')
     elif parameter == 'Quit':
         current_screen.exit_program()
     elif parameter == 'title':
@@ -1706,27 +1793,37 @@ TURN_RESULTS = {
 def main():
     global current_screen
     # Initialize Consoles
+    initialize_root_console()
+    initialize_screens()
     current_screen = SCREENS['title']
+    scheduler = FrameScheduler(fps_cap=CONSTANTS['fps_cap'])
 
     # Create Window based Around Console and Tileset
     with tcod.context.new_terminal(
             ROOT_CONSOLE.width, ROOT_CONSOLE.height, tileset=TILESET
     ) as context:
 
-        # Game Loop
+        # Game Loop, Blocks on Input when Idle, Capped Frame Rate while Animating
         while True:
             # User Events
-            handle_events(context)
+            handle_events(context, scheduler.wait_for_events(current_screen.is_animating()))
 
             # Rendering
             ROOT_CONSOLE.clear()
             current_screen.on_draw()
+            if CONSTANTS['show_frame_time']:
+                ROOT_CONSOLE.print(ROOT_CONSOLE.width - 1, 0, scheduler.readout(), fg=tcod.light_gray,
+                                   alignment=tcod.RIGHT)
             context.present(ROOT_CONSOLE)
+            scheduler.end_frame()
 
 
-def handle_events(context):
+def handle_events(context, events=None):
     global current_screen
-    for event in tcod.event.get():
+    if events is None:
+        events = tcod.event.get()
+
+    for event in events:
         context.convert_event(event)
         current_screen.dispatch(event)
 
@@ -1735,14 +1832,17 @@ def clear_console(con):
     con.clear(fg=(0, 0, 0), bg=(0, 0, 0))
 
 
+def obtain_tileset(font_size):
+    tileset = TILESETS.get(font_size)
+    if tileset is None and font_size in FONTS:
+        tileset = TILESETS[font_size] = tcod.tileset.load_tilesheet(asset_path(FONTS[font_size]), 32, 8,
+                                                                    tcod.tileset.CHARMAP_TCOD)
+    return tileset
+
+
 def change_font(con, font, constants):
     global TILESET
-    font_sizes = {
-        8: tcod.tileset.load_tilesheet('assets/prestige8x8_gs_tc.png', 32, 8, tcod.tileset.CHARMAP_TCOD),
-        10: tcod.tileset.load_tilesheet('assets/arial10x10.png', 32, 8, tcod.tileset.CHARMAP_TCOD),
-        16: tcod.tileset.load_tilesheet('assets/dejavu_wide16x16_gs_tc.png', 32, 8, tcod.tileset.CHARMAP_TCOD)
-    }
-    TILESET = font_sizes.get(font)
+    TILESET = obtain_tileset(font)
 
     return tcod.Console(constants['screen_width'], constants['screen_height'])
 
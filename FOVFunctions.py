@@ -5,20 +5,18 @@ from tcod.map import Map
 from tcod.map import compute_fov
 
 
-from loader_functions.JsonReader import obtain_tile_set
-
-
-TILE_SET = obtain_tile_set()
+CONE_MASKS = {}  # (direction_vector, radius): boolean cone mask, see obtain_cone_mask
 
 
 def initialize_fov(game_map):
+    # Every Layer is Indexed [y][x], Copy them Whole
     fov_map = Map(game_map.width, game_map.height)
-    for x in range(game_map.width):
-        for y in range(game_map.height):
-            # TODO: Verify if python 2D matrixes and numpy arrays are the same, but just reversed. :|
-            fov_map.transparent[y][x] = game_map.transparent[y][x]
-            fov_map.walkable[y][x] = game_map.walkable[y][x]
-            fov_map.fov[y][x] = game_map.fov[y][x]
+    fov_map.transparent[:] = game_map.transparent
+    fov_map.walkable[:] = game_map.walkable
+    fov_map.fov[:] = game_map.fov
+
+    # Fresh Transparency Map, Cached Mob FOVs No Longer Apply
+    game_map.bump_transparency_version()
     return fov_map
 
 
@@ -30,7 +28,7 @@ def recompute_fov(fov_map, player, temporary_vision, light_walls=True, algorithm
     for _x, _y in temporary_vision:
         fov_map.transparent[_y][_x] = True
 
-    return compute_fov(fov_map.transparent.T, (x, y), radius, light_walls, algorithm)
+    return compute_fov(fov_map.transparent, (y, x), radius, light_walls, algorithm)
 
 
 def enemy_recompute_fov(transparency_map, pov, radius, light_walls=True, algorithm=tcod.FOV_BASIC):
@@ -39,8 +37,7 @@ def enemy_recompute_fov(transparency_map, pov, radius, light_walls=True, algorit
 
 def definite_enemy_fov(game_map, fov_map, entrances, entities, light_walls=False, algorithm=0):
     new_enemy_fov_map = np.zeros(fov_map.transparent.shape, dtype=bool)
-    _new_enemy_fov_map = np.zeros(fov_map.transparent.shape, dtype=bool)
-    _entrances = entrances.copy()
+    enemy_transparency = None
 
     # TODO: Does it matter if AI cannot "see" the "wall"?
     light_walls = False
@@ -48,41 +45,68 @@ def definite_enemy_fov(game_map, fov_map, entrances, entities, light_walls=False
     # Cycle Through all Enemies and Combine FOV Map
     for e in entities:
         if e.ai and e.position:
-            # Obtain Facing Direction Vector and Temporarily Block Vision
-            temp_block = [(e.position.x, e.position.y)]
-
-            if (e.position.x, e.position.y) in _entrances:
-                _entrances.remove((e.position.x, e.position.y))
-
-            # TODO: Enable FOV for an open or closed door
-            for door_x, door_y in _entrances:
-                fov_map.transparent[door_y][door_x] = False
-                temp_block.append((door_x, door_y))
-
-            # Place FOV "walls" to look in specific direction
-            for vx, vy in [(i, j) for i in range(-1, 2) for j in range(-1, 2)]:
-                if not (vx, vy) in e.ai.direction_vector:  # don't block if within direction vector
-                    tx, ty = e.position.x + vx, e.position.y + vy
-                    if 0 < tx < fov_map.width and 0 < ty < fov_map.height:  # block if within map
-                        fov_map.transparent[ty][tx] = False
-                        temp_block.append((tx, ty))
-
-            # Temporarily Calculate Enemy-Individual FOV
-            _new_enemy_fov_map = enemy_recompute_fov(fov_map.transparent, (e.position.y, e.position.x),
-                                                     e.fighter.fov_range, light_walls, algorithm)
-
-            # Update Individual Fighter FOV
-            curr_fov_map = np.where(_new_enemy_fov_map==True)
-            e.fighter.curr_fov_map = list(zip(curr_fov_map[0], curr_fov_map[1]))
-            # e.fighter.curr_fov_map = _new_enemy_fov_map
-
-            # Remove Temporary Block
-            for vx, vy in temp_block:
-                tile = '%s' % game_map.tileset_tiles[vy][vx]
-                if TILE_SET.get(tile).get("transparent"):
-                    fov_map.transparent[vy][vx] = True
+            # Only Recompute when Position, Facing, Range or Map Transparency Changed Since Last Time
+            fov_cache_key = (e.position.x, e.position.y, tuple(e.ai.direction_vector), e.fighter.fov_range,
+                             game_map.transparency_version)
+            if e.fighter.fov_mask is None or e.fighter.fov_cache_key != fov_cache_key:
+                if enemy_transparency is None:
+                    enemy_transparency = obtain_enemy_transparency(fov_map, entrances)
+
+                e.fighter.fov_mask = compute_facing_fov(enemy_transparency, e.position.x, e.position.y,
+                                                        e.ai.direction_vector, e.fighter.fov_range, light_walls,
+                                                        algorithm)
+                e.fighter.fov_cache_key = fov_cache_key
 
             # Add to Main Enemy FOV Map
-            new_enemy_fov_map += _new_enemy_fov_map
+            new_enemy_fov_map |= e.fighter.fov_mask
 
     return new_enemy_fov_map
+
+
+def obtain_enemy_transparency(fov_map, entrances):
+    # Read-Only Overlay: Mobs cannot See Through Entrances (Doors), Shared FOV Map is Never Written
+    # Note: A Mob Standing in an Entrance still Sees Out, compute_fov Ignores the Transparency of the Origin
+    enemy_transparency = fov_map.transparent.copy()
+    for door_x, door_y in entrances:
+        enemy_transparency[door_y][door_x] = False
+
+    return enemy_transparency
+
+
+def obtain_cone_mask(direction_vector, radius):
+    """
+    Boolean (2 * radius + 1) square mask, centered on the mob, of every cell within 45 degrees of its facing.
+    The facing is the sum of the (up to 3) neighbour offsets in its direction vector. Masks are cached per facing.
+    """
+    key = (tuple(direction_vector), radius)
+    cone_mask = CONE_MASKS.get(key)
+    if cone_mask is None:
+        facing_x = sum(vx for vx, vy in direction_vector)
+        facing_y = sum(vy for vx, vy in direction_vector)
+        dy, dx = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+
+        # cos(angle)^2 >= cos(45)^2, in integers: 2 * dot^2 >= |d|^2 * |facing|^2
+        dot = dx * facing_x + dy * facing_y
+        cone_mask = (dot >= 0) & (2 * dot * dot >= (dx * dx + dy * dy) * (facing_x * facing_x + facing_y * facing_y))
+        cone_mask[radius, radius] = True
+        CONE_MASKS[key] = cone_mask
+
+    return cone_mask
+
+
+def compute_facing_fov(transparency, x, y, direction_vector, radius, light_walls=False, algorithm=0):
+    # Plain FOV on Unmodified Transparency, then Keep only the Cells in Front of the Mob
+    enemy_fov_map = enemy_recompute_fov(transparency, (y, x), radius, light_walls, algorithm)
+    cone_mask = obtain_cone_mask(direction_vector, radius)
+
+    # Clip Cone Window to Map Bounds
+    height, width = enemy_fov_map.shape
+    y_start, y_end = max(y - radius, 0), min(y + radius + 1, height)
+    x_start, x_end = max(x - radius, 0), min(x + radius + 1, width)
+
+    facing_fov_map = np.zeros(enemy_fov_map.shape, dtype=bool)
+    facing_fov_map[y_start:y_end, x_start:x_end] = \
+        enemy_fov_map[y_start:y_end, x_start:x_end] & \
+        cone_mask[y_start - y + radius:y_end - y + radius, x_start - x + radius:x_end - x + radius]
+
+    return facing_fov_map
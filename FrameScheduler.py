@@ -0,0 +1,69 @@
+import time
+
+import tcod
+
+
+class FrameScheduler:
+    """
+    Paces the main loop so an idle game doesn't burn a full core.
+
+    While nothing is animating the loop blocks in tcod.event.wait() until the player does something. While the current
+    screen reports it is animating (particles, alert-mode frame lerp, dialogue typing, ...) frames are produced at a
+    capped rate of fps_cap, sleeping away whatever is left of each frame's budget.
+
+    Frame times are measured around the work of each frame (events + draw + present, not the waiting) and smoothed, so
+    frame_time_ms/readout() report what a frame actually costs.
+    """
+    SMOOTHING = 0.1  # Weight of the Newest Sample in the Moving Average
+
+    def __init__(self, fps_cap=30, idle_timeout=None):
+        self.fps_cap = fps_cap
+        self.idle_timeout = idle_timeout  # None Blocks until the Next Event
+        self.frame_start = 0.0
+        self.next_frame = 0.0
+        self.frame_time = 0.0  # Seconds, Smoothed
+        self.frames = 0
+        self.idle_waits = 0
+
+    @property
+    def frame_budget(self):
+        if self.fps_cap and self.fps_cap > 0:
+            return 1.0 / self.fps_cap
+        return 0.0
+
+    @property
+    def frame_time_ms(self):
+        return self.frame_time * 1000.0
+
+    def wait_for_events(self, animating):
+        """
+        Return the events to handle this frame, blocking when idle and sleeping to the frame cap when animating.
+        """
+        if animating:
+            delay = self.next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            events = list(tcod.event.get())
+        else:
+            self.idle_waits += 1
+            events = list(tcod.event.wait(timeout=self.idle_timeout))
+
+        self.frame_start = time.perf_counter()
+        self.next_frame = self.frame_start + self.frame_budget
+        return events
+
+    def end_frame(self):
+        elapsed = time.perf_counter() - self.frame_start
+        if self.frames:
+            self.frame_time += (elapsed - self.frame_time) * self.SMOOTHING
+        else:
+            self.frame_time = elapsed
+        self.frames += 1
+        return elapsed
+
+    def readout(self):
+        return '{:.1f}ms'.format(self.frame_time_ms)
+
+    def __repr__(self):
+        return "FrameScheduler fps_cap={} frame_time={} frames={} idle_waits={}".format(
+            self.fps_cap, self.readout(), self.frames, self.idle_waits)
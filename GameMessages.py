@@ -12,7 +12,9 @@ class Message:
 class MessageLog:
     """
     - Holds a list of messages for scrolling
+    - version is bumped on every change, so the message panel knows when to re-render
     """
+    version = 0
 
     def __init__(self, x, width, height):
         self.messages = []
@@ -31,3 +33,5 @@ class MessageLog:
 
             # Add the new line as a Message object, with the text and the color
             self.messages.append(Message(line, message.color))
+
+        self.version += 1
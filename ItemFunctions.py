@@ -1,5 +1,5 @@
 from math import ceil
-from random import choice, randint
+import random
 
 import tcod
 
@@ -58,8 +58,10 @@ def heal(*args, **kwargs):
 def poison(*args, **kwargs):
     entity = args[0]
     amount = kwargs.get('amount')
+    game_map = kwargs.get('game_map')
+    rng = game_map.obtain_random_stream('combat') if game_map else random
     results = []
-    results.append({'consumed': True, 'message': Message('The liquid %s your throat!.' % choice(['stings', 'burns']),
+    results.append({'consumed': True, 'message': Message('The liquid %s your throat!.' % rng.choice(['stings', 'burns']),
                                                          tcod.darker_yellow)})
     results.append({'message': Message('Perhaps it wasn\'t a good idea to quaff it...', tcod.darker_yellow)})
     results.extend(entity.fighter.take_damage(amount))
@@ -82,7 +84,7 @@ def cast_lightning(*args, **kwargs):
 
     # Search Closest Entity
     for entity in entities:
-        if entity.fighter and entity != caster and (entity.position.x, entity.position.y) in caster.fighter.curr_fov_map:
+        if entity.fighter and entity != caster and caster.fighter.sees(entity.position.x, entity.position.y):
             distance = caster.position.distance_to(entity.position.x, entity.position.y)
 
             if distance < closest_distance and caster.faction.check_enemy(entity.faction.faction_name):
@@ -122,7 +124,7 @@ def cast_fireball(*args, **kwargs):
     results = []
 
     # Tile not within range
-    if not fov_map.fov[target_x][target_y]:
+    if not fov_map.fov[target_y][target_x]:
         results.append({'consumed': False, 'message': Message('You cannot target this area!', tcod.yellow)})
         return results
 
@@ -145,10 +147,9 @@ def cast_fireball(*args, **kwargs):
 
             if entity.inventory:
 
-                for item in entity.inventory.items:
-                    entities.append(item)
-
-                entity.inventory.drop_all_items()
+                # Drop First so Items have a Position before Entering the Entity Index
+                for drop_result in entity.inventory.drop_all_items():
+                    entities.append(drop_result.get('item_dropped'))
 
             results.append({"change_map_object": [entity, 2]})
 
@@ -173,6 +174,7 @@ def cast_fireball(*args, **kwargs):
 
 def cast_confuse(*args, **kwargs):
     entities = kwargs.get('entities')
+    game_map = kwargs.get('game_map')
     fov_map = kwargs.get('fov_map')
     target_x = kwargs.get('target_x')
     target_y = kwargs.get('target_y')
@@ -184,9 +186,9 @@ def cast_confuse(*args, **kwargs):
                                                               tcod.yellow)})
         return results
 
-    for entity in entities:
-        if entity.position.x == target_x and entity.position.y == target_y and entity.ai:
-            confused_ai = ConfusedAI(entity.ai, 10)
+    for entity in game_map.entity_index.at(target_x, target_y):
+        if entity.ai:
+            confused_ai = ConfusedAI(entity.ai, 10, rng=game_map.obtain_random_stream('combat'))
 
             confused_ai.owner = entity
             entity.ai = confused_ai
@@ -217,7 +219,8 @@ def cast_teleport(*args, **kwargs):
                         'message': Message('A bright light engulfs you for a moment.', tcod.light_green)})
 
         # 10% Chance of Teleporting to to a Random Location!
-        teleport_roll = randint(1, 10)
+        rng = game_map.obtain_random_stream('combat')
+        teleport_roll = rng.randint(1, 10)
         if teleport_roll == 1:
 
             # Attempt to Find a Random Location
@@ -225,8 +228,8 @@ def cast_teleport(*args, **kwargs):
             tries = 0
             random_x, random_y = None, None
             while tries < max_tries:
-                random_x = randint(1, game_map.width - 1)
-                random_y = randint(1, game_map.height - 1)
+                random_x = rng.randint(1, game_map.width - 1)
+                random_y = rng.randint(1, game_map.height - 1)
 
                 # print('\n', random_x, random_y)
                 # print(game_map.walkable[random_y][random_x], game_map.tile_cost[random_y][random_x], game_map.tileset_tiles[random_y][random_x])
@@ -242,12 +245,14 @@ def cast_teleport(*args, **kwargs):
                 results.append({'message': Message('You have teleported somewhere else entirely? You look around warily.', tcod.light_red)})
                 game_map.walkable[random_y][random_x] = True
                 game_map.transparent[random_y][random_x] = True
+                game_map.bump_transparency_version()
                 caster.position.x, caster.position.y = random_x, random_y
 
         else:
             results.append({'message': Message('You have teleported successfully!', tcod.light_green)})
             game_map.walkable[caster.position.y][caster.position.x] = True
             game_map.transparent[caster.position.y][caster.position.x] = True
+            game_map.bump_transparency_version()
             caster.position.x, caster.position.y = target_x, target_y
     else:
         results.extend([{'consumed': False, 'message': Message('But you can\'t focus on the location. Nothing appears to have happened.', tcod.yellow)}])
@@ -257,6 +262,7 @@ def cast_teleport(*args, **kwargs):
 def cast_blind(*args, **kwargs):
     blind_duration = 25
     entities = kwargs.get('entities')
+    game_map = kwargs.get('game_map')
     fov_map = kwargs.get('fov_map')
     target_x = kwargs.get('target_x')
     target_y = kwargs.get('target_y')
@@ -268,9 +274,9 @@ def cast_blind(*args, **kwargs):
                                                               tcod.yellow)})
         return results
 
-    for entity in entities:
-        if entity.position.x == target_x and entity.position.y == target_y and entity.ai:
-            blind_ai = BlindAI(entity.ai, blind_duration)
+    for entity in game_map.entity_index.at(target_x, target_y):
+        if entity.ai:
+            blind_ai = BlindAI(entity.ai, blind_duration, rng=game_map.obtain_random_stream('combat'))
 
             blind_ai.owner = entity
             entity.ai = blind_ai
@@ -63,7 +63,7 @@ def lock_door(*args, **kwargs):
     # blocking_entity = get_blocking_entities_at_location(entities, door_entity.position.x, door_entity.position.y)
     x = door_entity.position.x
     y = door_entity.position.y
-    if not any([entity for entity in entities if entity.position.x == x and entity.position.y == y]) and \
+    if not game_map.entity_index.is_occupied(x, y) and \
             game_map.is_within_map(x, y) and not game_map.is_blocked(x, y):
         results = [{"change_map_object": [door_entity, 5],
                     'message': Message('You close the {}.'.format(door_entity.name.lower()), tcod.yellow)}]
@@ -100,10 +100,9 @@ def break_container(*args, **kwargs):
                 "spawn_particle": ["hit", container_entity.position.x, container_entity.position.y, None],
                 'message': Message('You break open the {}...'.format(container_entity.name.lower()), tcod.yellow)}]
 
-    for item in container_entity.inventory.items:
-        entities.append(item)
-
-    container_entity.inventory.drop_all_items()
+    # Drop First so Items have a Position before Entering the Entity Index
+    for drop_result in container_entity.inventory.drop_all_items():
+        entities.append(drop_result.get('item_dropped'))
     return results
 
 
@@ -152,7 +151,8 @@ def open_gate(*args, **kwargs):
                         if ai_type == 1:
                             prisoner_entity.dialogue = Dialogue(['Lead the way boss!'])
                             # encounter =
-                            prisoner_entity.ai = FollowAI(follow_entity=player, encounter=prisoner_entity.ai.encounter)
+                            prisoner_entity.ai = FollowAI(follow_entity=player, encounter=prisoner_entity.ai.encounter,
+                                                          rng=game_map.obtain_random_stream('ai'))
                             prisoner_entity.ai.owner = prisoner_entity
                             # prisoner_entity.ai.encounter.main_target = game_map.stairs
                         else:
@@ -1,10 +1,12 @@
+import numpy as np
 import tcod
 from tcod.image import Image as TcodImage
 
 from EquipmentSlots import EQUIPMENT_SLOT_NAME
-from loader_functions.JsonReader import obtain_tile_set
+from map_objects.TileRegistry import TILES
+from PanelCache import CachedPanel
 
-TILE_SET = obtain_tile_set()
+MENU_WINDOWS = {}  # menu width: CachedPanel
 
 
 def picture(console, game_map, dungeon_map, header, map_width, map_height, screen_width, screen_height, panel_height):
@@ -47,9 +49,21 @@ def menu(console, header, options, width, screen_width, screen_height, cursor_po
     header_height = console.get_height_rect(0, 0, width, screen_height, header)
     height = len(options) + header_height
 
-    # create an off-screen console that represents the menu's window
-    window = tcod.console.Console(width, height)
+    # reuse the off-screen console that represents the menu's window, only re-rendered when its contents change
+    window = MENU_WINDOWS.get(width)
+    if window is None:
+        window = MENU_WINDOWS[width] = CachedPanel(width, height, render_menu_window)
+    window.ensure_size(width, height)
+    window.update((header, tuple(options), cursor_position, height), header, options, width, height, header_height,
+                  cursor_position)
+
+    # blit the contents of "window" to the root console
+    x = int(screen_width / 2 - width / 2)
+    y = int(screen_height / 2 - height / 2)
+    window.blit(console, x, y, width=width, height=height, fg_alpha=1.0, bg_alpha=0, key_color=None)
+
 
+def render_menu_window(window, header, options, width, height, header_height, cursor_position):
     # print the header, with auto-wrap
     # tcod.console_set_default_foreground(window, tcod.white)
     window.print_box(0, 0, width, height, header, alignment=tcod.LEFT)
@@ -73,12 +87,6 @@ def menu(console, header, options, width, screen_width, screen_height, cursor_po
         y += 1
         letter_index += 1
 
-    # blit the contents of "window" to the root console
-    x = int(screen_width / 2 - width / 2)
-    y = int(screen_height / 2 - height / 2)
-    window.blit(dest=console, dest_x=x, dest_y=y, src_x=0, src_y=0, width=width, height=height, fg_alpha=1.0,
-                bg_alpha=0, key_color=None)
-
 
 def inventory_menu(con, header, player, inventory_width, screen_width, screen_height):
     # show a menu with each item of the inventory as an option
@@ -135,11 +143,13 @@ def map_screen(console, entities, game_map, header, map_width, map_height, scree
     # TODO: Save processing time by keeping base map as image file and modify add entities before blitting?
     dungeon_map = TcodImage(width=game_map.map.width, height=game_map.map.height)
 
+    # Tile Colors for the Whole Map at Once: fg_color if the Tile Defines One, Otherwise its Background Color
+    tiles = game_map.tileset_tiles[:game_map.map.height, :game_map.map.width]
+    colors = np.where(TILES.has_fg_color[tiles][..., np.newaxis], TILES.fg_color[tiles], TILES.color[tiles]).tolist()
+
     for x in range(game_map.map.width):
         for y in range(game_map.map.height):
-            tile = TILE_SET.get("%s" % (game_map.tileset_tiles[y][x]))
-            color = tile.get("fg_color", tile["color"])
-            dungeon_map.put_pixel(x, y, color)
+            dungeon_map.put_pixel(x, y, colors[y][x])
 
     for entity in entities:
         if entity.stairs:
@@ -0,0 +1,93 @@
+import tcod
+
+
+class CachedPanel:
+    """
+    A UI Panel that owns a persistent off-screen Console and only re-renders it when dirty.
+
+    The panel is dirty when mark_dirty() was called or when the state key passed to update() differs from the one it
+    was last rendered with. The state key is any hashable/comparable value built from whatever the panel displays
+    (HP, message log version, hovered entity, frame color, ...). A clean panel costs a single blit per frame.
+    """
+
+    def __init__(self, width, height, render_function):
+        self.console = tcod.console.Console(width, height)
+        self.render_function = render_function
+        self.state_key = None
+        self.dirty = True
+        self.renders = 0
+
+    @property
+    def width(self):
+        return self.console.width
+
+    @property
+    def height(self):
+        return self.console.height
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def ensure_size(self, width, height):
+        # Grow the Console when Content Doesn't Fit, Never Shrink (Panels are Blitted by Region)
+        if width > self.console.width or height > self.console.height:
+            self.console = tcod.console.Console(max(width, self.console.width), max(height, self.console.height))
+            self.dirty = True
+
+    def update(self, state_key, *args, **kwargs):
+        if self.dirty or state_key != self.state_key:
+            self.console.clear()
+            self.render_function(self.console, *args, **kwargs)
+            self.state_key = state_key
+            self.dirty = False
+            self.renders += 1
+        return self.console
+
+    def blit(self, dest, dest_x, dest_y, width=None, height=None, **kwargs):
+        if width is None:
+            width = self.console.width
+        if height is None:
+            height = self.console.height
+        self.console.blit(dest=dest, dest_x=dest_x, dest_y=dest_y, src_x=0, src_y=0, width=width, height=height,
+                          **kwargs)
+
+    def __repr__(self):
+        return "CachedPanel {}x{} renders={}".format(self.console.width, self.console.height, self.renders)
+
+
+class PanelCompositor:
+    """
+    Named collection of CachedPanels, composited onto a destination Console in the order they are drawn.
+    """
+
+    def __init__(self):
+        self.panels = {}
+
+    def add(self, name, width, height, render_function):
+        panel = CachedPanel(width, height, render_function)
+        self.panels[name] = panel
+        return panel
+
+    def get(self, name):
+        return self.panels.get(name)
+
+    def draw(self, name, dest, dest_x, dest_y, state_key, *args, width=None, height=None, **kwargs):
+        # Re-render only if Dirty, then Blit the Cached Console
+        panel = self.panels[name]
+        panel.update(state_key, *args, **kwargs)
+        panel.blit(dest, dest_x, dest_y, width=width, height=height)
+        return panel
+
+    def mark_dirty(self, name):
+        self.panels[name].mark_dirty()
+
+    def mark_all_dirty(self):
+        for panel in self.panels.values():
+            panel.mark_dirty()
+
+    def __getstate__(self):
+        # Consoles are Rebuilt on Load, never Saved
+        return {'panels': {}}
+
+    def __repr__(self):
+        return "PanelCompositor {}".format(list(self.panels.values()))
@@ -1,8 +1,51 @@
-from random import randint
+import hashlib
+import random
 
+import tcod.random
 
-def random_choice_index(chances):
-    random_chance = randint(1, sum(chances))
+# Independent Streams so Drawing from One (e.g. Generating a Level) Never Shifts the Rolls of Another
+RANDOM_STREAMS = ['generation', 'ai', 'combat']
+
+
+def derive_seed(seed, *keys):
+    # Stable Across Processes and Runs, Unlike hash() of a str
+    digest = hashlib.blake2b(repr((seed,) + keys).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class RandomStreams:
+    """
+    One seeded random.Random per subsystem, all derived from a single game seed.
+
+    stream(name) is the long-running stream of a subsystem (AI decisions, combat rolls, ...) and is saved with the
+    game. level_stream(name, dungeon_level) is a fresh stream for one floor, so a floor's layout and spawns only depend
+    on (seed, dungeon_level): the same seed always builds the same floor, whichever process builds it and whatever was
+    rolled before.
+    """
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        self.seed = seed
+        self.streams = {name: random.Random(derive_seed(seed, name)) for name in RANDOM_STREAMS}
+
+    def stream(self, name):
+        return self.streams[name]
+
+    def level_stream(self, name, dungeon_level):
+        return random.Random(derive_seed(self.seed, name, dungeon_level))
+
+    def __repr__(self):
+        return "RandomStreams seed={}".format(self.seed)
+
+
+def tcod_random(rng):
+    # tcod's BSP Splits and Noise Draw from their own Generator, Seed it from rng
+    return tcod.random.Random(tcod.random.MERSENNE_TWISTER, seed=rng.getrandbits(31))
+
+
+def random_choice_index(chances, rng=random):
+    random_chance = rng.randint(1, sum(chances))
 
     running_sum = 0
     choice = 0
@@ -14,11 +57,11 @@ def random_choice_index(chances):
         choice += 1
 
 
-def random_choice_from_dict(choice_dict):
+def random_choice_from_dict(choice_dict, rng=random):
     choices = list(choice_dict.keys())
     chances = list(choice_dict.values())
 
-    return choices[random_choice_index(chances)]
+    return choices[random_choice_index(chances, rng)]
 
 
 def spawn_chance(table, dungeon_level):
@@ -1,10 +1,10 @@
-from random import choice
-
-from tcod import color_lerp
+import numpy as np
 import tcod
 
 from enum import Enum
 
+from map_objects.TileRegistry import TILES
+
 
 class RenderOrder(Enum):
     STAIRS = 1
@@ -37,134 +37,73 @@ def render_tile(console, x, y, bg_color, char, fg_color=tcod.white):
 
 def render_viewport(console, mouse_pos, mouse_targets, game_map, entities, fov_map, enemy_fov_map, fov_recompute, toggle_reveal_all,
                     view_x_start, view_x_end, view_y_start, view_y_end, viewport_width_start, viewport_height_start, default_tile=1):
-    # print('render_viewport', fov_recompute)
-    # if fov_recompute:
-    # Obtain all Center Coordinates
-
-    # Render Walls and Floors
-    lerp_color = (128, 64, 64)
-
-    for y in range(view_y_start, view_y_end):
-        for x in range(view_x_start, view_x_end):
-            try:
-                1 // (abs(y + 1) + y + 1)
-                1 // (abs(x + 1) + x + 1)
-                tile = game_map.tileset_tiles[y][x]
-                visible = fov_map.fov[x][y]  # Check if tile is visible at (x, y)
-                # enemy_fov = enemy_fov_map[y][x]  # Check if tile is visible to enemy at (x, y)
-                walkable = not game_map.walkable[y][x]
-                explored = game_map.explored[y][x]
-            except:
-            # except IndexError or ZeroDivisionError:
-            #     print('IndexError!')
-                # print(view_x_start, view_x_end)
-                # print(view_y_start, view_y_end)
-                # print(game_map.width, game_map.height)
-                # print('x/y:', x, y)
-                # print(len(game_map.tileset_tiles), len(game_map.tileset_tiles))
-                tile = default_tile
-                visible = False
-                # enemy_fov = False
-                walkable = False
-                explored = True
-
-                # sys.exit()
-
-            # wall = not game_map.walkable[y][x]  # Check if tile is a wall at (x, y)
-            # Add Highlight to Entity and Entity's FOV
-            enemy_fov = False
-            lerp_val = 0.5 * enemy_fov * walkable
-            # print('lerp_val:', lerp_val)
-                # if (x, y) in room_centers:
-                #     tile = 3
-            tile_fg_color = game_map.tile_set[str(tile)].get('fg_color', tcod.white)
-
-            # Select Tile
-            if toggle_reveal_all:
-                visible = True
-            if visible:
-                tile_color = game_map.tile_set[str(tile)].get('color')
-                tile_char = game_map.tile_set[str(tile)].get('glyph')
-
-                game_map.explored[y][x] = True
-
-                # if enemy_fov:  # Check if tile is visible to enemy at (x, y):
-                # TODO: Lerp the value based on distance from entity
-                lerp_val = 0.25 * enemy_fov * (not walkable)
-                # print('lerp_val', lerp_val, enemy_fov, walkable)
-                # lerp_val = 0.5
-
-            # Tile Has Been Seen Before, but not in Current FOV
-            elif explored or toggle_reveal_all == 1:
-                # Darken Color
-                tile_color = color_lerp(game_map.tile_set[str(tile)].get('color'), (0, 0, 0), 0.75)
-                tile_char = game_map.tile_set[str(tile)].get('glyph')
-                tile_fg_color = color_lerp(tile_fg_color, (0, 0, 0), 0.75)
-
-            # Unexplored Area
-            else:
-                tile = 0
-                tile_color = game_map.tile_set[str(tile)].get('color')
-                tile_char = game_map.tile_set[str(tile)].get('glyph')
-
-
-
-            # if 'wall' in tile_name:
-            #     mask_char_list = [35, 186, 186, 186, 205, 188, 187, 185, 205, 200, 201, 204, 205, 202, 203, 35]
-            #     tile_char = game_map.tile_set[tile_name].get(tile)
-            #     mask = 0
-            #     for c in [(x, y - 1, 1), (x, y + 1, 2), (x - 1, y, 4), (x + 1, y, 8)]:
-            #         c1, c2, c_ind = c[0], c[1], c[2]
-            #         if game_map.is_within_map(c1, c2):
-            #             if not game_map.walkable[c2][c1]:
-            #                 mask += c_ind
-            #
-            #     # let mut mask : u8 = 0;
-            #     #
-            #     #     if is_revealed_and_wall(map, x, y - 1) { mask +=1; }
-            #     #     if is_revealed_and_wall(map, x, y + 1) { mask +=2; }
-            #     #     if is_revealed_and_wall(map, x - 1, y) { mask +=4; }
-            #     #     if is_revealed_and_wall(map, x + 1, y) { mask +=7; }
-            #     #
-            #     #     walls:
-            #     #      0 => { 9 } // Pillar because no walls                      ○
-            #     #         1 => { 186 } // Wall only to the north                   ║
-            #     #         2 => { 186 } // Wall only to the south                  ║
-            #     #         3 => { 186 } // Wall to the north and south              ║
-            #     #         4 => { 205 } // Wall only to the west                   ═
-            #     #         5 => { 188 } // Wall to the north and west               ╝
-            #     #         6 => { 187 } // Wall to the south and west              ╗
-            #     #         7 => { 185 } // Wall to the north, south and west        ╣
-            #     #         8 => { 205 } // Wall only to the east                   ═
-            #     #         9 => { 200 } // Wall to the north and east               ╚
-            #     #         10 => { 201 } // Wall to the south and east             ╤
-            #     #         11 => { 204 } // Wall to the north, south and east       ╠
-            #     #         12 => { 205 } // Wall to the east and west              ═
-            #     #         13 => { 202 } // Wall to the east, west, and south       ╩
-            #     #         14 => { 203 } // Wall to the east, west, and north      ╦
-            #     try:
-            #         tile_char = mask_char_list[mask]
-            #     except:
-            #         print('mask:', mask)
-            # else:
-            #     tile_char = game_map.tile_set[tile_name].get('char')
-
-            # Normalize Position
-            correct_x = x - view_x_start - viewport_width_start
-            correct_y = y - view_y_start - viewport_height_start
-
-            # Highlight Mouse Position
-            # TODO: Area of affect or mouse path highlighting
-            # print("mouse_targets:", mouse_targets)
-
-            is_mouse_pos = (x, y) in mouse_targets
-            # is_mouse_pos = ((x, y) == mouse_pos) * ((x, y) in mouse_targets)
-            color_val = color_lerp(tuple(tile_color), lerp_color, lerp_val)  # highlight if within monster FOV
-            color_val = color_lerp(color_val, tcod.white, is_mouse_pos * 0.4)  # highlight if under mouse
-
-            render_tile(console, correct_x, correct_y, color_val, tile_char, fg_color=tile_fg_color)
-            # if not game_map.tileset_tiles[y][x] == 0 and game_map.explored[y][x]:
-            #     tile_char = game_map.tile_set[str(tile)].get('char')
+    """
+    Render Walls and Floors of the whole viewport at once: every layer is sliced to the viewport, run through the
+    TILES lookup tables, and written straight into console.rgb instead of printing tile by tile.
+    """
+    view_width = view_x_end - view_x_start
+    view_height = view_y_end - view_y_start
+    if view_width <= 0 or view_height <= 0:
+        return
+
+    # Cells Outside the Map Show the Default Tile, Unlit but Explored
+    tiles = np.full((view_height, view_width), default_tile, dtype=np.int32)
+    visible = np.zeros((view_height, view_width), dtype=bool)
+    explored = np.ones((view_height, view_width), dtype=bool)
+
+    # Part of the Viewport that Overlaps the Map
+    map_x_start, map_x_end = max(view_x_start, 0), min(view_x_end, game_map.width)
+    map_y_start, map_y_end = max(view_y_start, 0), min(view_y_end, game_map.height)
+    within_map = map_x_start < map_x_end and map_y_start < map_y_end
+    if within_map:
+        map_cells = slice(map_y_start, map_y_end), slice(map_x_start, map_x_end)
+        view_cells = slice(map_y_start - view_y_start, map_y_end - view_y_start), \
+            slice(map_x_start - view_x_start, map_x_end - view_x_start)
+
+        tiles[view_cells] = game_map.tileset_tiles[map_cells]
+        visible[view_cells] = fov_map.fov[map_cells]
+        explored[view_cells] = game_map.explored[map_cells]
+
+    if toggle_reveal_all:
+        visible[:] = True
+
+    # Whatever is Seen is Explored from now on
+    if within_map:
+        game_map.explored[map_cells] |= visible[view_cells]
+
+    # Select Tile: Lit, Seen Before but not in Current FOV (Darkened) or Unexplored (Tile 0)
+    darkened = ~visible & explored
+    shown_tiles = np.where(visible | explored, tiles, 0)
+
+    ch = TILES.glyph[shown_tiles]
+    bg = np.where(darkened[..., np.newaxis], TILES.dark_color[shown_tiles], TILES.color[shown_tiles])
+    fg = np.where(darkened[..., np.newaxis], TILES.dark_fg_color[tiles], TILES.fg_color[tiles])
+
+    # Highlight Mouse Position
+    # TODO: Area of affect or mouse path highlighting
+    mouse_mask = np.zeros((view_height, view_width), dtype=bool)
+    for mouse_target in mouse_targets:
+        if mouse_target:
+            x, y = mouse_target
+            if view_x_start <= x < view_x_end and view_y_start <= y < view_y_end:
+                mouse_mask[y - view_y_start, x - view_x_start] = True
+    bg[mouse_mask] = bg[mouse_mask] + (255 - bg[mouse_mask]) * 0.4
+
+    # Normalize Position onto the Console, Clipped to its Size
+    column_start, column_end = max(viewport_width_start, 0), min(view_width, console.width + viewport_width_start)
+    row_start, row_end = max(viewport_height_start, 0), min(view_height, console.height + viewport_height_start)
+    if column_start >= column_end or row_start >= row_end:
+        return
+
+    view_cells = slice(row_start, row_end), slice(column_start, column_end)
+    console_cells = slice(row_start - viewport_height_start, row_end - viewport_height_start), \
+        slice(column_start - viewport_width_start, column_end - viewport_width_start)
+
+    # Cells Land on their Own Column, Lined up with draw_entity (the Old Centered console.print Drew Each Tile One
+    # Column to the Left)
+    console.rgb["ch"][console_cells] = ch[view_cells]
+    console.rgb["fg"][console_cells] = fg[view_cells]
+    console.rgb["bg"][console_cells] = bg[view_cells]
 
 
 def render_tileset(console):
@@ -239,31 +178,10 @@ def draw_entity(console, entity, fov_map, game_map, toggle_reveal_all, view_x_st
     entity_y = entity.position.y - view_y_start - viewport_height_start
 
     # Render Entity if Within FOV or Stairs
-    if fov_map.fov[entity.position.x][entity.position.y] or toggle_reveal_all == 1:
+    if fov_map.fov[entity.position.y][entity.position.x] or toggle_reveal_all == 1:
         console.print(x=entity_x, y=entity_y, string="%s"%entity.char, fg=entity.color)
 
 
-def draw_particle_entity(console, particle_entity, fov_map, reveal_all, view_x_start, view_y_start, viewport_width_start,
-                         viewport_height_start):
-
-    # Obtain Coordinates Relative to Map Screen
-    entity_x = particle_entity.position.x - view_x_start - viewport_width_start
-    entity_y = particle_entity.position.y - view_y_start - viewport_height_start
-    particle = particle_entity.particle
-
-    # Print Particle BG, FG and Char on Map
-    if fov_map.fov[particle_entity.position.x][particle_entity.position.y] or reveal_all or not particle.within_fov:
-        c = ' '
-        if particle.char:
-            c = particle.char
-
-        bg = None
-        if particle.bg:
-            bg = choice(particle.bg)
-
-        console.print(x=entity_x, y=entity_y, string=c, fg=particle.fg, bg=bg)
-
-
 def clear_entity(con, entity, view_x_start, view_x_end, view_y_start, view_y_end):
     # Erase the character that represents this object
     entity_x = entity.position.x - view_x_start
@@ -0,0 +1,316 @@
+"""
+Level generation benchmark: every generator over a matrix of seeds and map sizes, run headlessly.
+
+    python benchmarks/generation_benchmark.py [--generators arena tunneling] [--sizes 45 100 250 500]
+                                              [--seeds 1 2 3] [--repeat 3] [--output results.json]
+                                              [--baseline generation_baseline.json] [--save-baseline]
+
+Each (generator, size, seed) case records wall time, peak memory (tracemalloc), entity, map object and room counts
+and the percentage of open floor. Timing and memory are taken in separate passes of the same seeded case, so the
+tracemalloc overhead never shows up in the wall time. Results are written as JSON and compared against the baseline
+(benchmarks/generation_baseline.json unless --baseline says otherwise, recorded with --save-baseline); the run exits
+with status 1 when a generator and size got slower or bigger than the thresholds allow, or a case newly fails.
+Timings are machine specific, so record the baseline on the machine that compares against it.
+
+Map generators draw from the floor's RandomStreams generation stream and grid generators from the random module seeded
+per case, so a case builds the same level on every run and the counts double as a check that a change to a generator
+didn't change its output.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import contextlib
+import importlib
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+
+PACKAGE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCHMARK_DIRECTORY = os.path.join(PACKAGE_DIRECTORY, 'benchmarks')
+sys.path.insert(0, PACKAGE_DIRECTORY)
+# tcod's libtcodpy Deprecation Warnings would Drown the Report
+warnings.simplefilter('ignore')
+
+from loader_functions.InitializeNewGame import create_player, get_constants  # noqa: E402
+from loader_functions.JsonReader import obtain_item_table, obtain_mob_table  # noqa: E402
+from map_objects.GameMap import GameMap  # noqa: E402
+from components.Particle import ParticleStore  # noqa: E402
+from RandomUtils import derive_seed  # noqa: E402
+
+# Generators in LevelRegistry, Played through GameMap: (dungeon_level, default_tile, open_map, mob tables)
+# Mirrors the Level Setup in GameMap.make_map, Without its Fixed Map Sizes
+MAP_GENERATORS = {
+    'arena': (0, 1, False, ('resinfaire_mobs', 'yendor_1_mobs', 'yendor_2_mobs')),
+    'resinfaire': (1, 13, False, ('resinfaire_mobs',)),
+    'yendor_outer': (4, 52, False, ('yendor_1_mobs',)),
+    'yendor_inner': (5, 52, False, ('yendor_2_mobs',)),
+    'undergrave': (6, 1, False, ()),
+    'overworld': (6, 0, True, ()),
+    'random_walk': (6, 1, False, ()),
+    'tunneling': (6, 1, False, ()),
+}
+# Standalone Generators that Carve a [x][y] Grid (1 Wall, 0 Floor) Rather than a GameMap, as "module:Class"
+GRID_GENERATORS = {
+    'room_addition': 'level_generation.RoomAddition:RoomAddition',
+    'maze_with_rooms': 'level_generation.MazeWithRooms:MazeWithRooms',
+    'bsp_tree': 'level_generation.BSPTree:BSPTreeAlgorithm',
+}
+GENERATORS = [*MAP_GENERATORS, *GRID_GENERATORS]
+
+DEFAULT_SIZES = [45, 100, 250, 500]
+DEFAULT_SEEDS = [1, 2, 3]
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIRECTORY, 'generation_results.json')
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIRECTORY, 'generation_baseline.json')
+
+# Regression Thresholds, as Ratios of the Baseline Median, Plus Absolute Floors so Tiny Cases don't Flap
+TIME_THRESHOLD = 1.25
+MEMORY_THRESHOLD = 1.25
+MIN_TIME_DELTA = 0.005  # Seconds
+MIN_MEMORY_DELTA = 256 * 1024  # Bytes
+
+
+def obtain_mob_tables(names):
+    if not names:
+        return obtain_mob_table()
+    mob_table = {}
+    for name in names:
+        mob_table.update(obtain_mob_table(name))
+    return mob_table
+
+
+def generate_map_level(name, size, seed, constants):
+    # Same Steps as GameMap.make_map for a Registry Generator, Returns (entities, map_objects, rooms, open floor %)
+    from level_generation.LevelRegistry import create_level_generator
+
+    dungeon_level, default_tile, open_map, mob_tables = MAP_GENERATORS[name]
+    game_map = GameMap(size, size, dungeon_level=dungeon_level, seed=seed)
+    player = create_player(constants)
+    entities = game_map.track_entities([player])
+    game_map.player = player
+    game_map.rooms = []
+    game_map.encounters = []
+    game_map.game_events = []
+    game_map.level = name
+    game_map.default_tile = default_tile
+    if open_map:
+        game_map.initialize_open_map()
+    else:
+        game_map.initialize_closed_map()
+
+    generator = game_map.map = create_level_generator(name)
+    generator.generate_level(game_map, dungeon_level, constants['max_rooms'], constants['room_min_size'],
+                             constants['room_max_size'], size, size, player, entities, ParticleStore(), [],
+                             obtain_item_table(), obtain_mob_tables(mob_tables), rng=game_map.obtain_level_stream())
+
+    rooms = game_map.rooms or getattr(generator, 'rooms', None) or []
+    return len(entities) - 1, len(game_map.map_objects), len(rooms), 100 * float(np.mean(game_map.walkable))
+
+
+def generate_grid_level(name, size, seed, constants):
+    # Grid Generators Draw from the random Module, Seeded for the Case by run_case
+    module_name, class_name = GRID_GENERATORS[name].split(':')
+    generator = getattr(importlib.import_module(module_name), class_name)()
+    generator.rng = random
+
+    if name == 'bsp_tree':
+        game_map = GameMap(size, size, seed=seed)
+        game_map.default_tile = 1
+        game_map.initialize_closed_map()
+        game_map.rooms = []
+        entities = game_map.track_entities([])
+        generator.generate_level(game_map, constants['max_rooms'], constants['room_min_size'],
+                                 constants['room_max_size'], size, size, entities, obtain_item_table(),
+                                 obtain_mob_table(), 0, 0)
+        return (len(entities), len(game_map.map_objects), len(generator.rooms),
+                100 * float(np.mean(game_map.walkable)))
+
+    if name == 'room_addition':
+        grid = [[1 for y in range(size)] for x in range(size)]
+        grid = generator.generate_level(grid, 0, constants['max_rooms'], constants['room_min_size'],
+                                        constants['room_max_size'], size, size, None, [], {}, {})
+    else:
+        grid = generator.generate(size, size)
+    return 0, 0, len(generator.rooms), 100 * float(np.mean(np.asarray(grid) == 0))
+
+
+def load_generators():
+    # Worker Initializer, Imports every Generator (and scipy/shapely) so the First Case doesn't Time the Imports
+    from level_generation.LevelRegistry import obtain_level_generator
+
+    for name in MAP_GENERATORS:
+        obtain_level_generator(name)
+    for qualified_name in GRID_GENERATORS.values():
+        importlib.import_module(qualified_name.split(':')[0])
+
+
+def run_case(name, size, seed, constants, trace_memory=False):
+    random.seed(derive_seed(seed, 'benchmark', name, size))
+    generate = generate_map_level if name in MAP_GENERATORS else generate_grid_level
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        # Generators Print their Progress, Kept out of the Report
+        with contextlib.redirect_stdout(io.StringIO()):
+            entities, map_objects, rooms, open_floor = generate(name, size, seed, constants)
+    finally:
+        wall_time = time.perf_counter() - start
+        peak_memory = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        if trace_memory:
+            tracemalloc.stop()
+
+    return {'wall_time': wall_time, 'peak_memory': peak_memory, 'entities': entities, 'map_objects': map_objects,
+            'rooms': rooms, 'open_floor': round(open_floor, 2)}
+
+
+def measure_case(name, size, seed, constants, repeat=1, trace_memory=True):
+    # Fastest of the Timed Runs, Plus the Counts and Peak Memory of a Traced Run
+    times = [run_case(name, size, seed, constants)['wall_time'] for _ in range(repeat)]
+    result = run_case(name, size, seed, constants, trace_memory=trace_memory)
+    result['wall_time'] = min(times)
+    return result
+
+
+def run_benchmark(generators, sizes, seeds, repeat=3, trace_memory=True):
+    """
+    Cases run one at a time in a worker process, so a generator that crashes the interpreter (qhull has segfaulted on
+    small Overworld maps) is recorded as a failed case instead of ending the benchmark.
+    """
+    constants = get_constants()
+    executor = ProcessPoolExecutor(max_workers=1, initializer=load_generators)
+    cases = []
+    for name in generators:
+        for size in sizes:
+            for seed in seeds:
+                case = {'generator': name, 'size': size, 'seed': seed}
+                try:
+                    case.update(executor.submit(measure_case, name, size, seed, constants, repeat,
+                                                trace_memory).result())
+                except BrokenProcessPool:
+                    case['error'] = 'worker process crashed'
+                    executor = ProcessPoolExecutor(max_workers=1, initializer=load_generators)
+                except Exception as error:
+                    case['error'] = '%s: %s' % (type(error).__name__, str(error).strip().split('\n')[0])
+                cases.append(case)
+                print(format_case(case), flush=True)
+    executor.shutdown()
+
+    return {'python': platform.python_version(), 'machine': platform.machine(), 'repeat': repeat,
+            'created': time.strftime('%Y-%m-%d %H:%M:%S'), 'cases': cases}
+
+
+def format_case(case):
+    label = '%-16s %4sx%-4s seed %-3s' % (case['generator'], case['size'], case['size'], case['seed'])
+    if 'error' in case:
+        return '%s  FAILED %s' % (label, case['error'])
+    memory = '%8.1fMB' % (case['peak_memory'] / 2 ** 20) if case['peak_memory'] is not None else '%10s' % '-'
+    return '%s %9.1fms %s  entities %4s  objects %5s  rooms %4s  open %5.1f%%' % (
+        label, case['wall_time'] * 1e3, memory, case['entities'], case['map_objects'], case['rooms'],
+        case['open_floor'])
+
+
+def summarize(results):
+    # {(generator, size): median wall time, median peak memory} over the Seeds that Succeeded
+    groups = {}
+    for case in results['cases']:
+        if 'error' not in case:
+            groups.setdefault((case['generator'], case['size']), []).append(case)
+
+    summary = {}
+    for key, cases in groups.items():
+        memories = [case['peak_memory'] for case in cases if case['peak_memory'] is not None]
+        summary[key] = (statistics.median(case['wall_time'] for case in cases),
+                        statistics.median(memories) if memories else None)
+    return summary
+
+
+def compare_results(results, baseline, time_threshold=TIME_THRESHOLD, memory_threshold=MEMORY_THRESHOLD):
+    """
+    Returns (regressions, notes): lines describing (generator, size) groups that got slower or bigger than the
+    thresholds allow, and cases whose output changed for the same seed or that newly fail.
+    """
+    regressions = []
+    notes = []
+    current = summarize(results)
+    previous = summarize(baseline)
+    for key, (wall_time, peak_memory) in sorted(current.items()):
+        if key not in previous:
+            continue
+        base_time, base_memory = previous[key]
+        if wall_time > base_time * time_threshold and wall_time - base_time > MIN_TIME_DELTA:
+            regressions.append('%s %sx%s: wall time %.1fms -> %.1fms (x%.2f)' % (
+                key[0], key[1], key[1], base_time * 1e3, wall_time * 1e3, wall_time / base_time))
+        if peak_memory is not None and base_memory and peak_memory > base_memory * memory_threshold and \
+                peak_memory - base_memory > MIN_MEMORY_DELTA:
+            regressions.append('%s %sx%s: peak memory %.1fMB -> %.1fMB (x%.2f)' % (
+                key[0], key[1], key[1], base_memory / 2 ** 20, peak_memory / 2 ** 20, peak_memory / base_memory))
+
+    base_cases = {(case['generator'], case['size'], case['seed']): case for case in baseline['cases']}
+    for case in results['cases']:
+        base_case = base_cases.get((case['generator'], case['size'], case['seed']))
+        if base_case is None:
+            continue
+        label = '%s %sx%s seed %s' % (case['generator'], case['size'], case['size'], case['seed'])
+        if 'error' in case and 'error' not in base_case:
+            regressions.append('%s: now fails, %s' % (label, case['error']))
+        elif 'error' not in case and 'error' not in base_case:
+            changed = [metric for metric in ('entities', 'map_objects', 'rooms', 'open_floor')
+                       if case[metric] != base_case[metric]]
+            if changed:
+                notes.append('%s: output changed (%s)' % (label, ', '.join(
+                    '%s %s -> %s' % (metric, base_case[metric], case[metric]) for metric in changed)))
+    return regressions, notes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--generators', nargs='+', default=GENERATORS, choices=GENERATORS)
+    parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES)
+    parser.add_argument('--seeds', nargs='+', type=int, default=DEFAULT_SEEDS)
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case, the fastest is kept')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='result file to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='also write the results as the baseline')
+    parser.add_argument('--time-threshold', type=float, default=TIME_THRESHOLD)
+    parser.add_argument('--memory-threshold', type=float, default=MEMORY_THRESHOLD)
+    args = parser.parse_args()
+    results = run_benchmark(args.generators, args.sizes, args.seeds, repeat=args.repeat,
+                            trace_memory=not args.no_memory)
+    with open(args.output, 'w') as results_file:
+        json.dump(results, results_file, indent=1)
+    print('\nresults written to %s' % args.output)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=1)
+        print('baseline written to %s' % args.baseline)
+        return 0
+
+    if not os.path.isfile(args.baseline):
+        print('no baseline at %s, record one with --save-baseline' % args.baseline)
+        return 0
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    regressions, notes = compare_results(results, baseline, args.time_threshold, args.memory_threshold)
+    for note in notes:
+        print('  note: %s' % note)
+    for regression in regressions:
+        print('  REGRESSION: %s' % regression)
+    print('%s regressions against %s' % (len(regressions), args.baseline))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Cold start benchmark: how long "import Engine" takes in a fresh interpreter, and which imports dominate it.
+
+    python benchmarks/startup_benchmark.py [--runs 5] [--top 15] [--module Engine]
+
+Each run is a new process started with "python -X importtime", the same data "python -X importtime -c 'import Engine'"
+prints, parsed and summarized. Importing the engine must not need a display, so this also works on headless machines.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+PACKAGE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr):
+    # {module: (self us, cumulative us)} from "import time: self | cumulative | module" lines
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        imports[module.strip()] = (int(self_us), int(cumulative_us))
+    return imports
+
+
+def run_once(module):
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-W', 'ignore', '-c', 'import %s' % module],
+                             cwd=PACKAGE_DIRECTORY, capture_output=True, text=True)
+    wall_time = time.perf_counter() - start
+    if process.returncode:
+        raise RuntimeError('import %s failed:\n%s' % (module, process.stderr[-2000:]))
+    return wall_time, parse_importtime(process.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--module', default='Engine')
+    args = parser.parse_args()
+
+    wall_times = []
+    import_times = []
+    imports = {}
+    for _ in range(args.runs):
+        wall_time, imports = run_once(args.module)
+        wall_times.append(wall_time)
+        import_times.append(imports.get(args.module, (0, 0))[1] / 1e6)
+
+    print('import %s over %s runs' % (args.module, args.runs))
+    print('  process wall time: median %.0fms, min %.0fms' % (statistics.median(wall_times) * 1e3,
+                                                               min(wall_times) * 1e3))
+    print('  import time:       median %.0fms, min %.0fms' % (statistics.median(import_times) * 1e3,
+                                                               min(import_times) * 1e3))
+    print('  modules imported:  %s' % len(imports))
+    print('\nslowest imports of the last run (cumulative ms, self ms):')
+    for module, (self_us, cumulative_us) in sorted(imports.items(), key=lambda item: -item[1][1])[:args.top]:
+        print('  %8.1f %8.1f  %s' % (cumulative_us / 1e3, self_us / 1e3, module))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,14 @@
-from random import choice, randint
+import random
 
 import tcod as libtcod
 
 from GameMessages import Message
 from loader_functions.JsonReader import obtain_mob_table
 from map_objects.GameMapUtils import get_map_object_at_location
+from map_objects.TileRegistry import TILES
 
 # from SpellFunctions import cast_mend, cast_thorn_spike, no_spell
 
-MOBS = obtain_mob_table()
-
 
 # DIRECTIONS = {
 #     'east': [(1, -1)],
@@ -39,15 +38,15 @@ DIRECTIONS = {
 }
 
 
-def get_random_direction():
-    return DIRECTIONS.get(choice(list(DIRECTIONS.keys())))
+def get_random_direction(rng=random):
+    return DIRECTIONS.get(rng.choice(list(DIRECTIONS.keys())))
 
 
-def get_next_direction():
-    return DIRECTIONS.get(choice(list(DIRECTIONS.keys())))
+def get_next_direction(rng=random):
+    return DIRECTIONS.get(rng.choice(list(DIRECTIONS.keys())))
 
 
-def get_direction(x1, y1, x2, y2):
+def get_direction(x1, y1, x2, y2, rng=random):
     # Calculate New Direction
     direction = None
     if y2 > y1:
@@ -71,7 +70,7 @@ def get_direction(x1, y1, x2, y2):
     if not direction:
         print('could not find direction!')
         print(x1, x2, y2, y2)
-        direction = choice(list(DIRECTIONS.keys()))
+        direction = rng.choice(list(DIRECTIONS.keys()))
     return DIRECTIONS.get(direction)
 
 
@@ -89,8 +88,9 @@ class AI:
     target_not_within_fov_counter = 0
     target_not_within_fov_max = 10
 
-    def __init__(self, encounter=None, *args, **kwargs):
-        self.direction_vector = get_random_direction()
+    def __init__(self, encounter=None, *args, rng=random, **kwargs):
+        # rng: Stream Drawn from while the Mob is Created (the Level's Generation Stream), Turns use the Map's 'ai' Stream
+        self.direction_vector = get_random_direction(rng)
         self.encounter = encounter
         if encounter:
             self.destination_room = encounter.main_room
@@ -105,6 +105,7 @@ class AI:
 
     def advance_on_current_target(self, entities, game_map, fov_map, dist, radius, results, target_x, target_y):
         mob = self.owner
+        rng = game_map.obtain_random_stream('ai')
 
         # Check to Cast Spell or Perform Skill
         can_cast_spells = getattr(self.owner.spellcaster, 'has_spells', None)
@@ -115,7 +116,7 @@ class AI:
                 # Check Self HP to Heal
                 if self.owner.fighter.hp <= self.owner.fighter.max_hp // 2 and self.owner.spellcaster.has_spell_type("restorative"):
                     try:
-                        spell_to_cast = choice([spell for spell in self.owner.spellcaster.spells if spell.type & {"restorative"} and spell.is_ready])
+                        spell_to_cast = rng.choice([spell for spell in self.owner.spellcaster.spells if spell.type & {"restorative"} and spell.is_ready])
                         target = self.owner
                     except IndexError:
                         # Empty sequence/no spells
@@ -124,7 +125,7 @@ class AI:
 
                 elif self.owner.faction.check_enemy(self.current_target.faction.faction_name):
                     try:
-                        spell_to_cast = choice([spell for spell in self.owner.spellcaster.spells if spell.type & {"offensive", "buff", "environment"} and spell.is_ready])
+                        spell_to_cast = rng.choice([spell for spell in self.owner.spellcaster.spells if spell.type & {"offensive", "buff", "environment"} and spell.is_ready])
                         target = self.current_target
                     except IndexError:
                         # Empty sequence/no spells
@@ -162,6 +163,10 @@ class AI:
                 results.extend(attack_results)
                 return results
 
+        # Target Stepped Off the End of the Path, Splice the Step On instead of Replanning
+        if self.current_target and self.path and not (target_y, target_x) in self.path:
+            self.repair_path(target_x, target_y)
+
         # Close distance to Target or Evade
         if (self.current_target and not self.path) or \
                 (self.last_target_position and not self.path) or \
@@ -179,26 +184,33 @@ class AI:
             game_map.next_floor_entities.append(self.owner)
 
             tile_index = game_map.tileset_tiles[self.owner.position.y][self.owner.position.x]
-            game_map.tile_cost[self.owner.position.y][self.owner.position.x] = game_map.tile_set.get(
-                '%s' % tile_index).get('tile_cost')
+            game_map.tile_cost[self.owner.position.y][self.owner.position.x] = TILES.tile_cost[tile_index]
             results.append({'message': Message('{} ascended to the next level!'.format(self.owner.name))})
 
         # Finally Move
         if len(self.path) > 0:
             results.extend(self.move_on_path(game_map, entities, results))
-            self.direction_vector = get_direction(self.owner.position.x, self.owner.position.y, target_x, target_y)
+            self.direction_vector = get_direction(self.owner.position.x, self.owner.position.y, target_x, target_y,
+                                                  rng)
 
         return results
 
+    def repair_path(self, target_x, target_y):
+        # Only a Single Step Next to the Old End of the Path can be Spliced, Anything Else is a Full Replan
+        last_y, last_x = self.path[-1]
+        if max(abs(target_x - last_x), abs(target_y - last_y)) == 1:
+            self.path.append((target_y, target_x))
+            return True
+        return False
+
     def move_on_path(self, game_map, entities, results):
-        print('\n\nmove_on_path')
-        print(self.path)
         mob = self.owner
         y, x = self.path[0]
-        self.direction_vector = get_direction(self.owner.position.x, self.owner.position.y, x, y)
+        self.direction_vector = get_direction(self.owner.position.x, self.owner.position.y, x, y,
+                                              game_map.obtain_random_stream('ai'))
 
         # Check if Entity can Interact with Map Object
-        map_object_entity = get_map_object_at_location(game_map.map_objects, x, y)
+        map_object_entity = get_map_object_at_location(game_map.map_object_index, x, y)
 
         if map_object_entity:
             interact_results = mob.fighter.interact(map_object_entity, interact_type='move',
@@ -226,7 +238,7 @@ class AI:
         # game_map.transparent[self.owner.y][sealf.owner.x] = True  # unblock previous position
         # game_map.transparent[y][x] = False  # block new position# Update Position
         tile_index = game_map.tileset_tiles[y][x]
-        game_map.tile_cost[self.owner.position.y][self.owner.position.x] = game_map.tile_set.get('%s' % tile_index).get('tile_cost')
+        game_map.tile_cost[self.owner.position.y][self.owner.position.x] = TILES.tile_cost[tile_index]
         game_map.tile_cost[y][x] = 99
 
         # Finally Update Entity Position
@@ -236,7 +248,7 @@ class AI:
         # Spawn Sound Particle if not in player FOV
         # print('# Spawn Sound Particle if not in player FOV')
         # print('{} pos: {}'.format(self.owner.name, self.owner.position))
-        if not (x, y) in game_map.player.fighter.curr_fov_map:
+        if not game_map.player.fighter.sees(x, y):
             results.append({"spawn_particle": ["sound", x, y, None]})
 
         return results
@@ -245,6 +257,7 @@ class AI:
         results = []
         mob = self.owner
         radius = self.owner.fighter.fov_range
+        rng = game_map.obtain_random_stream('ai')
 
         if self.current_target:
             self.wait_time = 0
@@ -254,7 +267,7 @@ class AI:
             dist = mob.position.distance_to(target_x, target_y)
 
             # Target is in FOV map and Within Entities FOV range
-            if (target_y, target_x) in fov_map and self.target_not_within_fov_counter <= self.target_not_within_fov_max:
+            if mob.fighter.sees(target_x, target_y) and self.target_not_within_fov_counter <= self.target_not_within_fov_max:
             # if (target_y, target_x) in fov_map and radius >= dist and self.target_not_within_fov_counter <= self.target_not_within_fov_max:
                 self.last_target_position = target_x, target_y
                 results = self.advance_on_current_target(entities, game_map, fov_map, dist, radius, results, target_x,
@@ -269,7 +282,7 @@ class AI:
 
             else:
                 # Cannot Find Entity
-                self.idle_guard()
+                self.idle_guard(rng)
 
         elif self.last_target_position:
             # Go to Last Position Where Previous Entity was Seen
@@ -282,23 +295,23 @@ class AI:
             if mob.position.distance(target_x, target_y) < 1.4 or self.check_if_stuck():
 
                 # Wait to check surroundings as if Looking for Lost Target
-                if self.check_if_waiting():
+                if self.check_if_waiting(rng):
                     self.last_target_position = None
                     self.path = []
                     self.wait_time = 0
         else:
-            self.idle_guard()
+            self.idle_guard(rng)
         return results
 
-    def check_if_waiting(self):
+    def check_if_waiting(self, rng=random):
         # Wait in Destination Room before Traveling Onward
         if self.wait_time < self.wait_time_max:
             # print('I am currently waiting! Wait time currently:', self.wait_time)
             self.wait_time += 1
             self.stuck_time = 0  # reset because no longer stuck
-            d = randint(0, 1)
+            d = rng.randint(0, 1)
             if d == 1:
-                self.direction_vector = get_random_direction()
+                self.direction_vector = get_random_direction(rng)
             return False
         return True
 
@@ -308,12 +321,12 @@ class AI:
         # print('I\'m definitely stuck. Changing destination')
         return True
 
-    def idle_guard(self):
+    def idle_guard(self, rng=random):
         self.current_target = None
         self.target_not_within_fov_counter = 0
-        d = randint(0, 1)
+        d = rng.randint(0, 1)
         if d == 1:
-            self.direction_vector = get_random_direction()
+            self.direction_vector = get_random_direction(rng)
             
 
 class DefensiveAI(AI):
@@ -334,6 +347,7 @@ class DefensiveAI(AI):
         results = []
         mob = self.owner
         radius = self.owner.fighter.fov_range
+        rng = game_map.obtain_random_stream('ai')
 
         if self.current_target:
             results = super(DefensiveAI, self).take_turn(fov_map, game_map, entities)
@@ -349,7 +363,7 @@ class DefensiveAI(AI):
             if mob.position.distance(target_x, target_y) < 1.4 or self.check_if_stuck():
 
                 # Wait to check surroundings as if Looking for Lost Target
-                if self.check_if_waiting():
+                if self.check_if_waiting(rng):
                     self.last_target_position = None
                     self.path = []
                     self.wait_time = 0
@@ -375,7 +389,7 @@ class DefensiveAI(AI):
         elif self.wait_time > self.wait_time_max:
             self.wait_time = 0
         else:
-            self.idle_guard()
+            self.idle_guard(rng)
 
         return results
     
@@ -389,10 +403,10 @@ class FollowAI(DefensiveAI):
     # follow_max_distance = 5
     wait_time_max = 2
 
-    def __init__(self, follow_entity, **kwargs):
+    def __init__(self, follow_entity, rng=random, **kwargs):
         self.follow_entity = follow_entity
-        self.follow_distance = randint(1, 2)
-        super(FollowAI, self).__init__(**kwargs)
+        self.follow_distance = rng.randint(1, 2)
+        super(FollowAI, self).__init__(rng=rng, **kwargs)
 
     def take_turn(self, fov_map, game_map, entities):
         
@@ -421,6 +435,7 @@ class PatrolAI(AI):
         results = []
         mob = self.owner
         radius = self.owner.fighter.fov_range
+        rng = game_map.obtain_random_stream('ai')
 
         # Seek/Attack Player if in Range, otherwise Patrol to other Rooms
         if self.current_target:
@@ -453,7 +468,7 @@ class PatrolAI(AI):
             if mob.position.distance(target_x, target_y) < 1.4 or self.check_if_stuck():
 
                 # Wait to check surroundings as if Looking for Lost Target
-                if self.check_if_waiting():
+                if self.check_if_waiting(rng):
                     self.last_target_position = None
                     self.path = []
                     self.wait_time = 0
@@ -464,9 +479,9 @@ class PatrolAI(AI):
 
             # Obtain coordinate to next room and move there
             if hasattr(game_map, 'sub_rooms'):
-                self.patrol(game_map.sub_rooms)
+                self.patrol(game_map.sub_rooms, rng)
             else:
-                self.patrol(game_map.rooms)
+                self.patrol(game_map.rooms, rng)
 
             # Establish a New Path or Continue on Existing Path
             if not self.path and self.wait_time < 1:
@@ -492,8 +507,8 @@ class PatrolAI(AI):
                 tries = 0
                 max_tries = 30
                 while tries < max_tries:
-                    room_x = randint(self.destination_room.x + 1, self.destination_room.x + self.destination_room.width - 1)
-                    room_y = randint(self.destination_room.y + 1, self.destination_room.y + self.destination_room.height - 1)
+                    room_x = rng.randint(self.destination_room.x + 1, self.destination_room.x + self.destination_room.width - 1)
+                    room_y = rng.randint(self.destination_room.y + 1, self.destination_room.y + self.destination_room.height - 1)
 
                     # Coordinates are Reachable and Not Obstructed by an Obstacle
                     if rooms_to_avoid:
@@ -538,7 +553,7 @@ class PatrolAI(AI):
         # print('false')
         return False
 
-    def patrol(self, game_map_rooms):
+    def patrol(self, game_map_rooms, rng=random):
         """
         Check:
         - If destination reached and wait time at destination exceeded
@@ -547,7 +562,7 @@ class PatrolAI(AI):
         # print('patrol')
         if self.check_if_at_destination():
             # print('should be going to check_if_waiting')
-            if self.check_if_waiting():
+            if self.check_if_waiting(rng):
                 self.change_room_number(game_map_rooms)
                 return None
             # print('I am waiting, wait time %s so far.' % self.wait_time)
@@ -596,9 +611,9 @@ class FleeAI(AI):
     goal_x = None
     goal_y = None
 
-    def __init__(self, previous_ai):
+    def __init__(self, previous_ai, rng=random):
         self.previous_ai = previous_ai
-        super(FleeAI, self).__init__(previous_ai.encounter)
+        super(FleeAI, self).__init__(previous_ai.encounter, rng=rng)
 
     def take_turn(self, fov_map, game_map, entities):
         results = []
@@ -627,26 +642,27 @@ class FleeAI(AI):
 
 
 class ConfusedAI(AI):
-    def __init__(self, previous_ai, duration=20):
+    def __init__(self, previous_ai, duration=20, rng=random):
         self.previous_ai = previous_ai
         self.duration = duration
-        super(ConfusedAI, self).__init__(previous_ai.encounter)
+        super(ConfusedAI, self).__init__(previous_ai.encounter, rng=rng)
 
     def take_turn(self, fov_map, game_map, entities):
         results = []
         mob = self.owner
+        rng = game_map.obtain_random_stream('ai')
 
         # Blind Mob AI
         if self.duration > 0:
-            random_x = mob.position.x + randint(0, 2) - 1
-            random_y = mob.position.y + randint(0, 2) - 1
+            random_x = mob.position.x + rng.randint(0, 2) - 1
+            random_y = mob.position.y + rng.randint(0, 2) - 1
 
             if random_x != mob.position.x and random_y != mob.position.y:
 
-                self.direction_vector = get_direction(mob.position.x, mob.position.y, random_x, random_y)
+                self.direction_vector = get_direction(mob.position.x, mob.position.y, random_x, random_y, rng)
                 mob.position.move_towards(random_x, random_y, game_map, entities)
             else:
-                self.direction_vector = get_next_direction()
+                self.direction_vector = get_next_direction(rng)
 
             self.duration -= 1
             results.append({"spawn_particle": ["confusion", mob.position.x, mob.position.y, None]})
@@ -659,10 +675,10 @@ class ConfusedAI(AI):
 
 
 class BlindAI(AI):
-    def __init__(self, previous_ai, duration=10):
+    def __init__(self, previous_ai, duration=10, rng=random):
         self.previous_ai = previous_ai
         self.duration = duration
-        super(BlindAI, self).__init__(previous_ai.encounter)
+        super(BlindAI, self).__init__(previous_ai.encounter, rng=rng)
 
     def take_turn(self, fov_map, game_map, entities):
         results = []
@@ -675,6 +691,6 @@ class BlindAI(AI):
         else:
             # Blind Wore Off Restore Default
             mob.ai = self.previous_ai
-            mob.fighter.fov_range = MOBS.get(mob.json_index).get('fov_range')
+            mob.fighter.fov_range = obtain_mob_table().get(mob.json_index).get('fov_range')
             results.append({'message': Message('The %s can see clearly now!' % mob.name, libtcod.red)})
         return results
@@ -1,7 +1,20 @@
 from loader_functions import JsonReader
 
 
-FACTIONS = JsonReader.obtain_factions()
+HOSTILE_FACTIONS = {}  # faction name: frozenset of its enemies, see obtain_hostile_factions
+HOSTILE_FACTIONS_SOURCE = None  # faction.json Table HOSTILE_FACTIONS was Built from
+
+
+def obtain_hostile_factions():
+    # Rebuilt only when the AssetRegistry Re-Parsed faction.json
+    global HOSTILE_FACTIONS_SOURCE
+    factions = JsonReader.obtain_factions()
+    if factions is not HOSTILE_FACTIONS_SOURCE:
+        HOSTILE_FACTIONS.clear()
+        HOSTILE_FACTIONS.update({faction_name: frozenset(faction.get("enemy"))
+                                 for faction_name, faction in factions.items()})
+        HOSTILE_FACTIONS_SOURCE = factions
+    return HOSTILE_FACTIONS
 
 
 class Faction:
@@ -11,13 +24,16 @@ class Faction:
         self.faction_name = faction_name
 
     def check_ally(self, other_faction):
-        return other_faction in FACTIONS.get(self.faction_name).get("ally")
+        return other_faction in JsonReader.obtain_factions().get(self.faction_name).get("ally")
 
     def check_enemy(self, other_faction):
-        return other_faction in FACTIONS.get(self.faction_name).get("enemy")
+        return other_faction in obtain_hostile_factions().get(self.faction_name)
+
+    def hostile_factions(self):
+        return obtain_hostile_factions().get(self.faction_name)
 
     def change_faction(self, new_faction):
-        if new_faction not in FACTIONS.keys():
+        if new_faction not in JsonReader.obtain_factions().keys():
             print('{} has an undefined faction! {} not in list of factions!'.format(self.owner.name, new_faction))
 
         self.faction_name = new_faction
@@ -4,6 +4,8 @@ from GameMessages import Message
 
 class Fighter:
     owner = None
+    fov_mask = None  # numpy 2d bool array of what fighter can actually see, indexed [y][x]
+    fov_cache_key = None  # (x, y, direction, fov_range, transparency version) fov_mask was computed for
 
     def __init__(self, hp, defense, power, attack_range=0.99, xp=0, fov_range=2, is_player=False, mob_level=None):
         self.base_max_hp = hp
@@ -18,9 +20,6 @@ class Fighter:
 
         self.is_player = is_player
 
-        # self.curr_fov = set()  # set containing coordinates of what fighter can actually see
-        self.curr_fov_map = []  # numpy 2d array of what fighter can actually see
-
         # Stats
         self.str = 0
         self.dex = 0
@@ -54,6 +53,14 @@ class Fighter:
             bonus = 0
         return self.base_defense + bonus
 
+    def sees(self, x, y):
+        # O(1) Visibility Check against the Fighter's Latest FOV
+        if self.fov_mask is None:
+            return False
+
+        height, width = self.fov_mask.shape
+        return 0 <= x < width and 0 <= y < height and bool(self.fov_mask[y, x])
+
     def take_damage(self, amount, attacking_entity=None):
         results = []
         self.hp = max(0, self.hp - amount)
@@ -82,7 +89,7 @@ class Fighter:
         else:
 
             # Check Critical Hit from Not in FOV
-            critical_hit_mod = 1 + (self.is_player * 3 * ((self.owner.position.y, self.owner.position.x) not in target.fighter.curr_fov_map))
+            critical_hit_mod = 1 + (self.is_player * 3 * (not target.fighter.sees(self.owner.position.x, self.owner.position.y)))
             damage = (self.power - target.fighter.defense) * critical_hit_mod
 
         if damage > 0:
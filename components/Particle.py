@@ -1,13 +1,282 @@
+import numpy as np
+
+from loader_functions.JsonReader import obtain_particles
+
+# Particle Flags
+FOREVER = 1
+PROPAGATE = 2
+WITHIN_FOV = 4
+HAS_FG = 8
+HAS_BG = 16
+MAX_BG_PALETTE = 4
+
+
+def obtain_particle_stats(p_index):
+    return obtain_particles().get(p_index)
+
+
 class ParticleSystem:
-    # coordinates = None
-    # particle_list = None
+    """
+    Group of particles spawned together (a fireball, a lightning bolt, ...). coordinates is the set of every cell the
+    system has covered so far, so propagation never spawns twice on the same cell.
+    """
+    coverage = None
 
     def __init__(self):
-        self.coordinates = []
-        self.particle_list = []
+        self.coordinates = set()
+        self.system_id = None
+        self.coverage = None  # Same cells as a [y][x] bool mask, allocated on first propagation
+
+    def cover(self, x, y):
+        self.coordinates.add((x, y))
+        if self.coverage is not None:
+            self.coverage[y, x] = True
+
+    def obtain_coverage(self, shape):
+        if self.coverage is None or self.coverage.shape != shape:
+            self.coverage = np.zeros(shape, dtype=bool)
+            if self.coordinates:
+                xs, ys = zip(*self.coordinates)
+                self.coverage[ys, xs] = True
+        return self.coverage
+
+
+class ParticleStore:
+    """
+    Pooled structure-of-arrays storage for every live particle on the floor.
+
+    Each particle is one row across the x, y, lifetime, kind, glyph, fg, system and flags arrays. Rows [0, count) are
+    live; aging, compaction and drawing are done on whole array slices instead of one Entity/Particle pair per particle.
+    Per-kind data (name, background palette, propagate property) lives in small tables indexed by kind.
+    """
+
+    def __init__(self, capacity=64):
+        self.count = 0
+        self.capacity = 0
+        self.x = self.y = self.lifetime = self.kind = self.glyph = self.fg = self.system = self.flags = None
+        self.allocate(capacity)
+
+        # Per-kind Tables, Indexed by Kind ID
+        self.kind_ids = {}  # particles.json key: kind id
+        self.kind_names = []
+        self.kind_propagate_property = []
+        self.kind_bg = np.zeros((0, MAX_BG_PALETTE, 3), dtype=np.uint8)
+        self.kind_bg_count = np.zeros(0, dtype=np.int32)
+
+        # Particle Systems, system id 0 is "No System"
+        self.systems = {}  # system id: ParticleSystem
+        self.next_system_id = 1
+
+    def allocate(self, capacity):
+        # Grow Every Per-particle Array, Keeping the Live Rows
+        def grow(array, dtype, *shape):
+            new_array = np.zeros((capacity,) + shape, dtype=dtype)
+            if array is not None:
+                new_array[:self.count] = array[:self.count]
+            return new_array
+
+        self.x = grow(self.x, np.int32)
+        self.y = grow(self.y, np.int32)
+        self.lifetime = grow(self.lifetime, np.float32)
+        self.kind = grow(self.kind, np.int16)
+        self.glyph = grow(self.glyph, np.int32)
+        self.fg = grow(self.fg, np.uint8, 3)
+        self.system = grow(self.system, np.int32)
+        self.flags = grow(self.flags, np.uint8)
+        self.capacity = capacity
+
+    def obtain_kind(self, p_index):
+        kind_id = self.kind_ids.get(p_index)
+        if kind_id is not None:
+            return kind_id
+
+        p_stats = obtain_particle_stats(p_index)
+        kind_id = len(self.kind_names)
+        self.kind_ids[p_index] = kind_id
+        self.kind_names.append(p_stats.get("name"))
+        self.kind_propagate_property.append(p_stats.get("propagate_property", None))
+
+        bg_palette = (p_stats.get("bg") or [])[:MAX_BG_PALETTE]
+        kind_bg = np.zeros((1, MAX_BG_PALETTE, 3), dtype=np.uint8)
+        if bg_palette:
+            kind_bg[0, :len(bg_palette)] = bg_palette
+        self.kind_bg = np.concatenate((self.kind_bg, kind_bg))
+        self.kind_bg_count = np.append(self.kind_bg_count, len(bg_palette)).astype(np.int32)
+        return kind_id
+
+    def register_system(self, particle_system):
+        if particle_system.system_id not in self.systems:
+            particle_system.system_id = self.next_system_id
+            self.systems[particle_system.system_id] = particle_system
+            self.next_system_id += 1
+        return particle_system.system_id
+
+    def spawn(self, p_index, x, y, particle_system=None, lifetime=None):
+        # Append a Particle of the Given particles.json Kind, Returns its ParticleSystem
+        p_stats = obtain_particle_stats(p_index)
+        if not particle_system:
+            particle_system = ParticleSystem()
+        system_id = self.register_system(particle_system)
+        particle_system.cover(x, y)
+
+        if self.count == self.capacity:
+            self.allocate(self.capacity * 2)
+
+        flags = 0
+        if p_stats.get("forever", False):
+            flags |= FOREVER
+        if p_stats.get("propagate", False):
+            flags |= PROPAGATE
+        if p_stats.get("within_fov", True) is not False:
+            flags |= WITHIN_FOV
+        if p_stats.get("fg"):
+            flags |= HAS_FG
+            self.fg[self.count] = p_stats.get("fg")
+        if p_stats.get("bg"):
+            flags |= HAS_BG
+
+        glyph = p_stats.get("glyph")
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.lifetime[i] = p_stats.get("lifetime") if lifetime is None else lifetime
+        self.kind[i] = self.obtain_kind(p_index)
+        self.glyph[i] = ord(glyph[0]) if glyph else ord(' ')
+        self.system[i] = system_id
+        self.flags[i] = flags
+        self.count += 1
+        return particle_system
+
+    def spawn_many(self, p_index, xs, ys, particle_system=None):
+        # Append one Particle of the Same Kind per (x, y), Returns their ParticleSystem
+        xs = np.asarray(xs, dtype=np.int32)
+        ys = np.asarray(ys, dtype=np.int32)
+        if not len(xs):
+            return particle_system
+
+        # First Spawn goes through spawn() to fill the Row Template, the Rest are Copies of it
+        particle_system = self.spawn(p_index, int(xs[0]), int(ys[0]), particle_system)
+        template = self.count - 1
+        extra = len(xs) - 1
+        if not extra:
+            return particle_system
+
+        while self.count + extra > self.capacity:
+            self.allocate(self.capacity * 2)
+
+        rows = slice(self.count, self.count + extra)
+        for array in (self.lifetime, self.kind, self.glyph, self.fg, self.system, self.flags):
+            array[rows] = array[template]
+        self.x[rows] = xs[1:]
+        self.y[rows] = ys[1:]
+        self.count += extra
+
+        for x, y in zip(xs[1:].tolist(), ys[1:].tolist()):
+            particle_system.cover(x, y)
+        return particle_system
+
+    def age(self, dt=1):
+        # Age every Live Particle by dt, "forever" Particles don't Age
+        n = self.count
+        if n:
+            self.lifetime[:n] -= dt * ((self.flags[:n] & FOREVER) == 0)
+
+    def propagation_fronts(self):
+        """
+        Group the propagating particles (including the ones that just expired) by particle system and kind.
+        Yields (particle_system, propagate_property, xs, ys) per group.
+        """
+        n = self.count
+        propagating = np.flatnonzero(self.flags[:n] & PROPAGATE)
+        if not len(propagating):
+            return
+
+        groups = np.stack((self.system[propagating], self.kind[propagating].astype(np.int32)), axis=1)
+        for system_id, kind_id in np.unique(groups, axis=0).tolist():
+            rows = propagating[(groups[:, 0] == system_id) & (groups[:, 1] == kind_id)]
+            yield self.systems[system_id], self.kind_propagate_property[kind_id], self.x[rows], self.y[rows]
+
+    def compact(self):
+        # Drop Expired Rows and Particle Systems Left Without Particles
+        n = self.count
+        alive = np.flatnonzero(self.lifetime[:n] > 0)
+        if len(alive) != n:
+            for array in (self.x, self.y, self.lifetime, self.kind, self.glyph, self.fg, self.system, self.flags):
+                array[:len(alive)] = array[alive]
+            self.count = len(alive)
+
+        live_systems = set(np.unique(self.system[:self.count]).tolist())
+        for system_id in [system_id for system_id in self.systems if system_id not in live_systems]:
+            self.systems[system_id].system_id = None
+            del self.systems[system_id]
+
+    def draw(self, console, fov, reveal_all, view_x_start, view_x_end, view_y_start, view_y_end, viewport_width_start,
+             viewport_height_start):
+        """
+        Batch draw every visible particle within the viewport onto console.rgb. Particles without a glyph print a
+        blank, without a fg keep the console's fg, and pick a random color of their kind's background palette.
+        """
+        n = self.count
+        if not n:
+            return
+
+        x, y, flags = self.x[:n], self.y[:n], self.flags[:n]
+        visible = (view_x_start <= x) & (x < view_x_end) & (view_y_start <= y) & (y < view_y_end)
+        if not reveal_all:
+            within_fov = (flags & WITHIN_FOV) != 0
+            visible &= ~within_fov | fov[np.clip(y, 0, fov.shape[0] - 1), np.clip(x, 0, fov.shape[1] - 1)]
+
+        screen_x = x - view_x_start - viewport_width_start
+        screen_y = y - view_y_start - viewport_height_start
+        visible &= (0 <= screen_x) & (screen_x < console.width) & (0 <= screen_y) & (screen_y < console.height)
+
+        rows = np.flatnonzero(visible)
+        if not len(rows):
+            return
+
+        rgb = console.rgb
+        cells = screen_y[rows], screen_x[rows]
+        rgb["ch"][cells] = self.glyph[rows]
+
+        fg_rows = rows[(flags[rows] & HAS_FG) != 0]
+        rgb["fg"][screen_y[fg_rows], screen_x[fg_rows]] = self.fg[fg_rows]
+
+        bg_rows = rows[(flags[rows] & HAS_BG) != 0]
+        if len(bg_rows):
+            kinds = self.kind[bg_rows]
+            picks = (np.random.random(len(bg_rows)) * self.kind_bg_count[kinds]).astype(np.int32)
+            rgb["bg"][screen_y[bg_rows], screen_x[bg_rows]] = self.kind_bg[kinds, picks]
+
+    def clear(self):
+        self.count = 0
+        for particle_system in self.systems.values():
+            particle_system.system_id = None
+        self.systems = {}
+
+    @classmethod
+    def from_entities(cls, particle_entities):
+        # Upgrade the Entity/Particle Lists of Older Saves
+        particle_store = cls()
+        particle_systems = {}
+        for particle_entity in particle_entities:
+            particle = particle_entity.particle
+            old_system = getattr(particle, 'particle_system', None)
+            particle_system = particle_systems.setdefault(id(old_system), ParticleSystem())
+            particle_store.spawn(particle_entity.json_index, particle_entity.position.x, particle_entity.position.y,
+                                 particle_system, lifetime=particle.lifetime)
+        return particle_store
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return "ParticleStore count={} capacity={} systems={}".format(self.count, self.capacity, len(self.systems))
 
 
 class Particle:
+    """
+    Per-entity particle component of older saves, only kept so they unpickle and upgrade into a ParticleStore.
+    """
     lifetime = 1
     x = 0
     y = 0
@@ -32,21 +301,5 @@ class Particle:
         self.particle_system = particle_system
         self.within_fov = within_fov
 
-    def update(self, dt):
-        # Will cancel itself and not change self.lifetime if "self.forever" is True
-        results = {}
-        self.lifetime -= dt - (self.forever * dt)
-        # print(self.lifetime)
-        if self.lifetime <= 0:
-            self.del_particle()
-
-        results[self] = [self.propagate, self.progagate_property]
-
-        return results
-
-    def del_particle(self):
-        # print('deleting particle')
-        self.particle_system.particle_list.remove(self)
-
     def __repr__(self):
-        return "Particle CurrentLifetime={} Pos=({}, {}) char={} fg={} bg={}".format(self.lifetime, self.x, self.y, self.char, self.fg, self.bg)
\ No newline at end of file
+        return "Particle CurrentLifetime={} Pos=({}, {}) char={} fg={} bg={}".format(self.lifetime, self.x, self.y, self.char, self.fg, self.bg)
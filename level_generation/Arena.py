@@ -1,5 +1,5 @@
 from math import ceil
-from random import choice, randint
+import random
 
 import tcod
 
@@ -17,11 +17,14 @@ class Arena:
     width = 30
     height = 30
     areas_of_interest = []
+    rng = random  # random.Random the Level is Generated from, Set by generate_level
 
     def generate_level(self, game_map, dungeon_level, max_rooms, room_min_size, room_max_size, map_width, map_height,
-                       player, entities, particles, particle_systems, item_table, mob_table):
+                       player, entities, particles, particle_systems, item_table, mob_table, rng=random):
+        self.rng = rng
         self.game_map = game_map
         self.dungeon_level = dungeon_level
+        self.areas_of_interest = []
         self.width = map_width
         self.height = map_height
         self.assign_terrain()
@@ -37,13 +40,13 @@ class Arena:
         area_y = map_height // 4
         area = AreaofInterest(x=area_x , y=area_y, width=area_width, height=area_height)
         self.areas_of_interest.append(area)
-        number_of_mobs = randint(5, 10)
+        number_of_mobs = self.rng.randint(5, 10)
         ai_type = AI
         encounter = Encounter(self.game_map, area, len(self.game_map.encounters) + 1, ai_type)
-        monster_chances = {mob: spawn_chance([stats for stats in mob_stats.get('spawn_chance')], randint(1, 6))
+        monster_chances = {mob: spawn_chance([stats for stats in mob_stats.get('spawn_chance')], self.rng.randint(1, 6))
                            for mob, mob_stats in mob_table.items()
                            }
-        mob_list = generate_mobs(entities, game_map, number_of_mobs, mob_table, monster_chances, encounter, room=area)
+        mob_list = generate_mobs(entities, game_map, number_of_mobs, mob_table, monster_chances, encounter, room=area, rng=self.rng)
         encounter.mob_list = mob_list
 
         self.game_map.encounters.append(encounter)
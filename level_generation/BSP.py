@@ -1,10 +1,14 @@
 from math import sqrt
-from random import choice, randint
+import random
 
 from tcod.bsp import BSP
 
+from RandomUtils import tcod_random
+
 
 class BinarySpacePartition(BSP):
+    rng = random  # random.Random the Level is Generated from, Set by generate_level
+
     def __init__(self):
         self.grid = None
         self.rooms = {}  # looks like {cell blocks: [rooms]}
@@ -54,6 +58,7 @@ class BinarySpacePartition(BSP):
             for cell_block in cell_blocks:
                 # print('cell_block:', cell_block)
                 bsp = BinarySpacePartition()
+                bsp.rng = self.rng
                 bsp.x = cell_block.x
                 bsp.y = cell_block.y
                 bsp.width = cell_block.width - self.cell_block_wall_buffer
@@ -94,7 +99,8 @@ class BinarySpacePartition(BSP):
             min_width=min_width,
             min_height=min_height,
             max_horizontal_ratio=1.25,
-            max_vertical_ratio=1.25
+            max_vertical_ratio=1.25,
+            seed=tcod_random(self.rng)
         )
 
         actual_room_nodes = []
@@ -144,8 +150,8 @@ class BinarySpacePartition(BSP):
                 Note: No distances are stored because the children pairs are so far away from each other they
                       do not overlap horizontally or vertically.
                 """
-                close_1 = choice(node.parent.children)
-                close_2 = choice(next_node.parent.children)
+                close_1 = self.rng.choice(node.parent.children)
+                close_2 = self.rng.choice(next_node.parent.children)
                 self.force_create_hall(close_1, close_2)
             else:
                 # Connect Good Rooms
@@ -234,7 +240,7 @@ class BinarySpacePartition(BSP):
     def force_create_hall(self, room1, room2, width=1):
         x1, y1 = center(room1)
         x2, y2 = center(room2)
-        if randint(0, 1) == 1:
+        if self.rng.randint(0, 1) == 1:
             self.create_h_tunnel(x1, x2, y1, width)
             self.create_v_tunnel(y1, y2, x2, width)
         else:  # else it starts vertically
@@ -1,5 +1,5 @@
 from operator import attrgetter
-from random import choice, random, randint
+import random
 
 import numpy as np
 import matplotlib.path as pltpath
@@ -10,6 +10,8 @@ from map_objects.Shapes import BSPRoom
 
 
 class BSPTreePolygonAlgorithm:
+    rng = random  # random.Random the Level is Generated from, Set by generate_level
+
     def __init__(self):
         self.game_map = None
         self.room = None
@@ -33,8 +35,9 @@ class BSPTreePolygonAlgorithm:
         return x_min, y_min, x_max, y_max
 
     def generate_level(self, game_map,max_rooms, room_min_size, room_max_size, map_width, map_height,
-                       entities, particles, item_table, mob_table, map_x_start, map_y_start, vertices=[]):
+                       entities, particles, item_table, mob_table, map_x_start, map_y_start, vertices=[], rng=random):
         self.game_map = game_map
+        self.rng = rng
         # self.dungeon_level = dungeon_level
         self.room_min_size = room_min_size
         self.room_max_size = room_max_size
@@ -45,7 +48,7 @@ class BSPTreePolygonAlgorithm:
         height = map_height - y_min
 
         # Obtain Min and Max Values of Polygon
-        if vertices != []:
+        if len(vertices):
             x_min, y_min, x_max, y_max = self.obtain_min_max_coordinates(vertices)
             width = x_max - x_min
             height = y_max - y_min
@@ -112,7 +115,7 @@ class BSPTreePolygonAlgorithm:
                     # print('max iterations exceeded')
                     break
                 if not l.child_1 and not l.child_2:  # if leaf has no child
-                    if l.width > self.MAX_LEAF_SIZE or l.height > self.MAX_LEAF_SIZE or random() > 0.5:
+                    if l.width > self.MAX_LEAF_SIZE or l.height > self.MAX_LEAF_SIZE or self.rng.random() > 0.5:
                         if l.split_leaf():  # try to split the leaf
                             _leafs.append(l.child_1)
                             _leafs.append(l.child_2)
@@ -160,7 +163,7 @@ class Leaf:  # used for the BSP tree algorithm
         elif self.height / self.width >= 1.25:
             split_horizontally = True
 
-        self.MIN_LEAF_SIZE = randint(4, 6)
+        self.MIN_LEAF_SIZE = self.main_tree.rng.randint(4, 6)
         if split_horizontally:
             max_size = self.height - self.MIN_LEAF_SIZE
         else:
@@ -169,7 +172,7 @@ class Leaf:  # used for the BSP tree algorithm
         if max_size <= self.MIN_LEAF_SIZE:
             return False  # the leaf is too small to split further
 
-        split = randint(self.MIN_LEAF_SIZE, max_size)  # determine where to split the leaf
+        split = self.main_tree.rng.randint(self.MIN_LEAF_SIZE, max_size)  # determine where to split the leaf
 
         # print('split val:', split)
 
@@ -273,7 +276,7 @@ class Leaf:  # used for the BSP tree algorithm
                 return self.room_2
 
             # If both room_1 and room_2 exist, pick one
-            elif random() < 0.5:
+            elif self.main_tree.rng.random() < 0.5:
                 return self.room_1
             else:
                 return self.room_2
@@ -1,11 +1,16 @@
 from math import sqrt
-from random import randint
-from collections import deque
+import random
 
 import numpy as np
 
+from level_generation.RegionLabelling import label_regions, largest_region
+
 
 class CellularAutomata:
+    """
+    Cave generator over a numpy [x][y] grid of int8 cells (0 open, 1 wall, higher values are left to subclasses). The
+    automata rules, fills and cave selection are whole-array operations on boolean wall masks.
+    """
     width = 20
     height = 20
     grid = None
@@ -13,8 +18,6 @@ class CellularAutomata:
     min_count = 5  # min count of surrounding walls for the automata rules
     iterations = 0
     pillar_iterations = 1
-    flood_tries = 5
-    goal_percentage = 30
     open_percentage = 0
     encounter_spread_factor = 6
 
@@ -22,6 +25,7 @@ class CellularAutomata:
     areas_of_interest = []  # areas of open space
     start_area = None
     end_area = None
+    rng = random  # random.Random the Level is Generated from, Set by generate_level
 
     def create_entrance_exit(self, castle_entrance=False):
         # Assume Entrance at Bottom, Exit at Top
@@ -29,7 +33,7 @@ class CellularAutomata:
 
         # Generate Start Area
         # entrance_x = 0
-        entrance_x = randint(2, len(self.grid) - 2)
+        entrance_x = self.rng.randint(2, len(self.grid) - 2)
         entrance_y = len(self.grid[0]) - 1
         width, height = 3, 3
         self.start_area = AreaofInterest(entrance_x, entrance_y, width, height)
@@ -42,7 +46,7 @@ class CellularAutomata:
             entrance_x = self.width // 2
             width, height = 15, 8
         else:
-            entrance_x = randint(2, len(self.grid) - 2)
+            entrance_x = self.rng.randint(2, len(self.grid) - 2)
             width, height = 3, 3
         entrance_y = 0
 
@@ -152,7 +156,7 @@ class CellularAutomata:
         final_str = ""
         final_str += "\n"
 
-        if grid:
+        if grid is not None:
             _grid = grid
         else:
             _grid = self.grid
@@ -170,56 +174,33 @@ class CellularAutomata:
         print(final_str)
 
     def reset_grid(self):
-        # All Floor
-        new_grid = [[0 for x in range(self.height)] for y in range(self.width)]
-
-        # Set Border to Wall
-        for i in range(len(new_grid)):
-            for j in range(len(new_grid[i])):
-                if i == 0 or j == 0 or i == len(new_grid) - 1 or j == len(new_grid[0]) - 1:
-                    new_grid[i][j] = 1
-
-        # Assign Grid
-        self.grid = new_grid
+        # All Floor, Border Set to Wall
+        self.grid = np.zeros((self.width, self.height), dtype=np.int8)
+        self.grid[[0, -1], :] = 1
+        self.grid[:, [0, -1]] = 1
 
     def populate_grid(self, wall_chance=None):
-        print('populate_grid')
         if not wall_chance:
             wall_chance = self.wall_chance
 
-        # Randomly Populate Grid
-        for i in range(len(self.grid)):  # reminder to test with: for index, value in enumerate(grid)
-            for j in range(len(self.grid[0])):
-                if randint(0, 100) <= wall_chance:  # test with list comprehension instead??
-                    self.grid[i][j] = 1
-        """
-        bsp_x = 10
-        bsp_y = 15
-        bsp_width = 40
-        bsp_height = 30
-        """
-        # self.grid[10:50][15:30] = np.zeros_like(self.grid[10:50][15:30])
-        # for row in self.grid:
-        #     print(row)
-            
+        # Randomly Populate Grid, One Draw for the Whole Grid Seeded from the Level's Stream
+        draws = np.random.default_rng(self.rng.getrandbits(64)).integers(0, 101, size=self.grid.shape)
+        self.grid[draws <= wall_chance] = 1
+
     def automata_iteration(self, make_pillars):
-        make_grid = [row[:] for row in self.grid]
-        for i in range(1, len(self.grid) - 1):
-            for j in range(1, len(self.grid[0]) - 1):
-                count = 0
-
-                # Check 4x4 area around cell and count obstacles
-                for k in range(-1, 2):
-                    for l in range(-1, 2):
-                        if self.grid[i + k][j + l] == 1:
-                            count += 1
-
-                # Add Wall or Remove Wall
-                if count >= self.min_count or (count == 0 and make_pillars == 1):
-                    make_grid[i][j] = 1
-                else:
-                    make_grid[i][j] = 0
-        self.grid = make_grid
+        # Count Walls in the 3x3 Area around every Inner Cell (Including Itself) by Summing Shifted Views
+        walls = self.grid == 1
+        width, height = walls.shape
+        count = np.zeros((width - 2, height - 2), dtype=np.int8)
+        for k in range(3):
+            for l in range(3):
+                count += walls[k:width - 2 + k, l:height - 2 + l]
+
+        # Add Wall or Remove Wall, the Border is Left as is
+        make_walls = count >= self.min_count
+        if make_pillars == 1:
+            make_walls |= count == 0
+        self.grid[1:-1, 1:-1] = make_walls
 
     @staticmethod
     def inside_circle(center_x, center_y, point_x, point_y, radius):
@@ -230,99 +211,66 @@ class CellularAutomata:
 
     def find_areas_if_interest(self, radius=1):
         # Find Areas of Interest to Spawn Prefabs or entities
-        possible_areas = []
-
-        for center_x in range(self.width):
-            for center_y in range(self.height):
-
-                open_area_count = 0
-                # Cache Circle Dimensions
-                top = max(0, center_y - radius)
-                bottom = min(self.height, center_y + radius)
-                left = max(0, center_x - radius)
-                right = min(self.width, center_x + radius)
-
-                # Iterate Through Circle Bounding Box
-                for point_x in range(left, right):
-                    for point_y in range(top, bottom):
-
-                        # If not Wall and Coordinates not In Possible Areas Already
-                        if self.grid[point_x][point_y] != 1 and (point_x, point_y) not in possible_areas:
-                            open_area_count += 1
-
-                # Add to Possible List for Areas-of-Interest
-                if open_area_count >= 4:
-                    possible_areas.append((center_x, center_y))
+        possible_areas = self.find_open_squares()
 
         # Among All Possible Areas, Remove Close Areas
         radius = min(self.width // self.encounter_spread_factor, self.height // self.encounter_spread_factor)
         possible_areas.extend([(self.start_area.x+1, self.start_area.y+1), (self.end_area.x+1, self.end_area.y+1)])
+        points = np.array(possible_areas, dtype=np.int64).reshape(-1, 2)
+        remaining = np.ones(len(points), dtype=bool)
         areas = []
-        while possible_areas:
-            center_x, center_y = possible_areas.pop()
-
-            # Cache Circle Dimensions to Measure Within
-            top = max(0, center_y - radius)
-            bottom = min(self.height, center_y + radius)
-            left = max(0, center_x - radius)
-            right = min(self.width, center_x + radius)
-
-            # Check if Coordinates are Inside Circle, not in Possible Areas and not Center Origin
-            for x in range(left, right):
-                for y in range(top, bottom):
-                    if self.inside_circle(center_x, center_y, x, y, radius) and (x, y) in possible_areas and \
-                            (x, y) != (center_x, center_y):
-                        possible_areas.remove((x, y))
+        while remaining.any():
+            last = np.flatnonzero(remaining)[-1]
+            remaining[last] = False
+            center_x, center_y = points[last]
+
+            # Drop Areas Inside the Circle's Bounding Box and Circle, Other than ones at the Center Origin
+            xs, ys = points[:, 0], points[:, 1]
+            dx, dy = xs - center_x, ys - center_y
+            close = (max(0, center_x - radius) <= xs) & (xs < min(self.width, center_x + radius)) & \
+                    (max(0, center_y - radius) <= ys) & (ys < min(self.height, center_y + radius)) & \
+                    (dx * dx + dy * dy <= radius * radius) & ((dx != 0) | (dy != 0))
+            remaining &= ~close
 
             # Finally Add to Final List
-            areas.append((center_x-1, center_y-1))
-            # areas.append(AreaofInterest(x=center_x-1, y=center_y-1, width=3, height=3))
+            areas.append((int(center_x) - 1, int(center_y) - 1))
         areas.remove((self.start_area.x, self.start_area.y))
         areas.remove((self.end_area.x, self.end_area.y))
         self.areas_of_interest.extend([AreaofInterest(x=center_x-1, y=center_y-1, width=3, height=3) for center_x, center_y in areas])
 
+    def find_open_squares(self):
+        """
+        Corners (x, y) of open 2x2 squares (x-1..x, y-1..y), in x then y order, where no square overlaps the corner of
+        one found before it. The acceptance of each corner depends on the ones before it, so columns are resolved one
+        at a time: a corner is blocked by the previous column directly, and inside a column the open corners left form
+        runs where every other corner is taken.
+        """
+        open_cells = self.grid != 1
+        width, height = open_cells.shape
+        open_squares = np.zeros_like(open_cells)
+        open_squares[1:, 1:] = open_cells[1:, 1:] & open_cells[:-1, 1:] & open_cells[1:, :-1] & open_cells[:-1, :-1]
+
+        accepted = np.zeros_like(open_cells)
+        rows = np.arange(height)
+        previous = np.zeros(height, dtype=bool)
+        for x in range(1, width):
+            candidates = open_squares[x] & ~previous
+            candidates[1:] &= ~previous[:-1]
+            run_starts = candidates.copy()
+            run_starts[1:] &= ~candidates[:-1]
+            run_start_rows = np.maximum.accumulate(np.where(run_starts, rows, 0))
+            previous = accepted[x] = candidates & ((rows - run_start_rows) % 2 == 0)
+
+        return [tuple(point) for point in np.argwhere(accepted).tolist()]
+
     def flood_find_empty(self):
-        times_remade = 0
-        percentage = 0
-        make_grid = [[1 for x in range(len(self.grid[0]))] for y in range(len(self.grid))]
-
-        # Multiple Flood Fill Checks to Ensure Good Map, Removing Small Unconnected Caves
-        while times_remade < self.flood_tries and percentage < self.goal_percentage:
-            copy_grid = [row[:] for row in self.grid]
-            open_count = 0
-            times_remade += 1
-            unvisited = deque([])
-            make_grid = [[1 for x in range(len(self.grid[0]))] for y in range(len(self.grid))]
-
-            # Select Random Starting Point
-            randx = randint(0, len(self.grid) - 1)
-            randy = randint(0, len(self.grid[0]) - 1)
-            while self.grid[randx][randy] == 1:
-                randx = randint(0, len(self.grid) - 1)
-                randy = randint(0, len(self.grid[0]) - 1)
-            unvisited.append([randx, randy])
-
-            # Flood Fill to find All Open Spaces
-            while len(unvisited) > 0:
-                current = unvisited.popleft()
-                make_grid[current[0]][current[1]] = 0
-                for k in range(-1, 2):
-                    for l in range(-1, 2):
-                        if current[0] + k >= 0 and current[0] + k < len(self.grid) and current[1] + l >= 0 and \
-                                current[1] + l < len(self.grid[0]):  # if we're not out of bounds
-                            if copy_grid[current[0] + k][current[1] + l] == 0:  # if it's an empty space
-                                copy_grid[current[0] + k][current[1] + l] = 2  # mark visited
-                                open_count += 1
-                                unvisited.append([current[0] + k, current[1] + l])
-            percentage = open_count * 100 / (len(self.grid) * len(self.grid[0]))
-            # print("counted {0}, {1}%...".format(open_count, percentage))
-        self.grid = make_grid
-        self.open_percentage = percentage
-
-        # if percentage < self.goal_percentage:
-        #     print("Failed to produce a big enough cave after {0} tries...".format(self.flood_tries))
-        # else:
-        #     print("Percentage of open space: {0}%".format(percentage))
+        # Keep the Largest Cave (Moving in 8 Directions), Filling in Every Smaller Unconnected One
+        labels, sizes, _ = label_regions(self.grid == 0, diagonal=True)
+        cave = largest_region(labels, sizes)
+        self.grid = np.where(cave, 0, 1).astype(np.int8)
+        self.open_percentage = np.count_nonzero(cave) * 100 / self.grid.size
+
+        # print("Percentage of open space: {0}%".format(self.open_percentage))
 
 
 class AreaofInterest:
@@ -352,8 +300,8 @@ class AreaofInterest:
         y = self.y + self.height // 2
         return x, y
 
-    def obtain_point_within(self, padding):
-        return randint(self.x, self.x + self.width), randint(self.y, self.y + self.height)
+    def obtain_point_within(self, padding, rng=random):
+        return rng.randint(self.x, self.x + self.width), rng.randint(self.y, self.y + self.height)
 
 
 def distance(x1, y1, x2, y2):
@@ -368,8 +316,6 @@ if __name__ == "__main__":
     c.min_count = 5
     c.iterations = 2
     c.pillar_iterations = 1
-    c.flood_tries = 5
-    c.goal_percentage = 30  # above 30% seems to be a good target
     c.encounter_spread_factor = 6
     c.sparse_wall_density = 2
     c.generate()
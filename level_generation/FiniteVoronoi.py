@@ -1,16 +1,16 @@
 import math
-from random import randint
+import random
 
-import matplotlib.pyplot as plt
-from matplotlib.patches import Polygon
 import numpy as np
-from scipy.spatial import ConvexHull, Voronoi
 
 from level_generation.voronoi_gen_utils import random_color, voronoi_finite_polygons_2d
 
 
-def voronoi_polygons(n=50, map_size=(100, 100)):
-    random_seeds = np.random.rand(n, 2) * map_size
+def voronoi_polygons(n=50, map_size=(100, 100), rng=random):
+    # scipy and matplotlib are Imported on First Use, they Dominate Startup Time otherwise
+    from scipy.spatial import Voronoi
+
+    random_seeds = np.random.default_rng(rng.getrandbits(64)).random((n, 2)) * map_size
     vor = Voronoi(random_seeds)
     regions, vertices = voronoi_finite_polygons_2d(vor)
     used_seeds = []
@@ -47,6 +47,10 @@ def angle_between(centroid, vector):
 
 
 def plot_polygons(polygons, map_size, points, vertices, ax=None, alpha=0.5, linewidth=0.7, saveas=None, show=True, dt=0):
+    import matplotlib.pyplot as plt
+    from matplotlib.patches import Polygon
+    from scipy.spatial import ConvexHull
+
     # Configure plot
     if ax is None:
         plt.figure(figsize=(10, 5))
@@ -139,7 +143,7 @@ def plot_polygons(polygons, map_size, points, vertices, ax=None, alpha=0.5, line
 
 
 if __name__ == '__main__':
-    s = randint(50, 500)
+    s = random.randint(50, 500)
     size = (s, s)
     size = (25, 25)
     plot_polygons(*voronoi_polygons(n=min(size * 3), map_size=size))
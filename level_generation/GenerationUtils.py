@@ -1,5 +1,5 @@
 from math import sqrt
-from random import choice, choices, randint
+import random
 
 
 from components.AI import AI, DefensiveAI, PatrolAI
@@ -12,7 +12,6 @@ from components.Fighter import Fighter
 from components.MapObject import MapObject
 from components.Inventory import Inventory
 from components.Item import Item
-from components.Particle import Particle
 from components.Position import Position
 from components.SpellCaster import SpellCaster
 from level_generation.Prefab import Prefab
@@ -23,19 +22,13 @@ from GameMessages import Message
 # Do not remove ItemFunctions! There are called out in json and eval()'ed
 from ItemFunctions import *
 # from ItemFunctions import cast_confuse, cast_fireball, cast_lightning, heal,
-from loader_functions.JsonReader import obtain_item_table, obtain_mob_table, obtain_tile_set, obtain_particles, obtain_spells
+from loader_functions.JsonReader import obtain_item_table, obtain_mob_table, obtain_tile_set, obtain_spells
 from MapObjectFunctions import *
 from RandomUtils import random_choice_from_dict, spawn_chance
+from map_objects.TileRegistry import TILES
 from RenderFunctions import RenderOrder
 
 
-TILE_SET = obtain_tile_set()
-ITEMS = obtain_item_table()
-MOBS = obtain_mob_table()
-PARTICLES = obtain_particles()
-SPELLS = obtain_spells()
-
-
 def calculate_distance(x1, y1, x2, y2):
     return sqrt((x2 - x1)**2 + (y2 - y1)**2)
 
@@ -64,7 +57,7 @@ def create_room(game_map, room):
             create_floor(game_map, x, y)
 
 
-def create_hall(game_map, room1, room2):
+def create_hall(game_map, room1, room2, rng=random):
     x1, y1 = room1.center
     x2, y2 = room2.center
     # x1, y1 = room1.x + room1.width // 2, room1.y + room1.height // 2
@@ -86,7 +79,7 @@ def create_hall(game_map, room1, room2):
     #         create_h_tunnel(game_map, x1, x2, y1)
     #         return None
 
-    if randint(0, 1) == 1:
+    if rng.randint(0, 1) == 1:
         create_h_tunnel(game_map, x1, x2, y1)
         create_v_tunnel(game_map, y1, y2, x2)
     else:  # else it starts vertically
@@ -119,15 +112,26 @@ def create_wall(game_map, x, y):
 
 def place_tile(game_map, x, y, obj):
     # Places Tile
-    tile = TILE_SET.get(str(obj))
-    game_map.transparent[y][x] = tile.get('transparent')
-    game_map.fov[y][x] = tile.get('fov')
-    game_map.walkable[y][x] = tile.get('walkable')
-    game_map.tileset_tiles[y][x] = int(obj)
-    game_map.tile_cost[y][x] = tile.get('tile_cost')
-
-
-def find_wall_direction(room_from, room_to):
+    tile = int(obj)
+    game_map.transparent[y][x] = TILES.transparent[tile]
+    game_map.fov[y][x] = TILES.fov[tile]
+    game_map.walkable[y][x] = TILES.walkable[tile]
+    game_map.tileset_tiles[y][x] = tile
+    game_map.bump_transparency_version()
+    game_map.tile_cost[y][x] = TILES.tile_cost[tile]
+
+
+def place_tiles(game_map, xs, ys, tiles):
+    # Places Tiles in Bulk, xs/ys/tiles are Equal Length Arrays
+    game_map.transparent[ys, xs] = TILES.transparent[tiles]
+    game_map.fov[ys, xs] = TILES.fov[tiles]
+    game_map.walkable[ys, xs] = TILES.walkable[tiles]
+    game_map.tileset_tiles[ys, xs] = tiles
+    game_map.bump_transparency_version()
+    game_map.tile_cost[ys, xs] = TILES.tile_cost[tiles]
+
+
+def find_wall_direction(room_from, room_to, rng=random):
     directions = []
     x1, y1 = room_from.center
     x2, y2 = room_to.center
@@ -144,12 +148,12 @@ def find_wall_direction(room_from, room_to):
 
     if not directions:
         return None
-    return choice(directions)
+    return rng.choice(directions)
 
 
-def create_door(game_map, sub_room, main_room):
+def create_door(game_map, sub_room, main_room, rng=random):
     # Create a Single Opening at a Select Rectangle Wall
-    direction = find_wall_direction(sub_room, main_room)
+    direction = find_wall_direction(sub_room, main_room, rng)
     x_door, y_door = sub_room.center
     if direction == 'south':
         x_door = (sub_room.x1 + 1 + sub_room.x2) // 2
@@ -173,7 +177,7 @@ def create_door(game_map, sub_room, main_room):
 
 
 def generate_mob(x, y, mob_stats, mob_index, encounter_group, faction, ai, entities, dialogue_component=None,
-                 follow_entity=None, target_entity=None, origin_x=None, origin_y=None):
+                 follow_entity=None, target_entity=None, origin_x=None, origin_y=None, rng=random):
 
     faction_component = Faction(faction_name=faction)
     inventory_component = Inventory(3)
@@ -188,7 +192,7 @@ def generate_mob(x, y, mob_stats, mob_index, encounter_group, faction, ai, entit
     if spells:
         spell_data_list = []
         for spell_name in spells:
-            spell_data_list.append(SPELLS.get(spell_name))
+            spell_data_list.append(obtain_spells().get(spell_name))
         # print('name:', mob_stats.get("name"))
         spellcaster_component = SpellCaster(spell_data=spell_data_list)
     else:
@@ -196,10 +200,10 @@ def generate_mob(x, y, mob_stats, mob_index, encounter_group, faction, ai, entit
 
     if origin_x and origin_y:
         ai_component = ai(encounter=encounter_group, origin_x=origin_x, origin_y=origin_y, follow_entity=follow_entity,
-                          target_entity=target_entity)
+                          target_entity=target_entity, rng=rng)
     else:
         ai_component = ai(encounter=encounter_group, origin_x=x, origin_y=y, follow_entity=follow_entity,
-                          target_entity=target_entity)
+                          target_entity=target_entity, rng=rng)
 
     position_component = Position(x, y, minimum_dist=mob_stats.get("minimum_dist", 1), movement_type=mob_stats.get("movement_type", "astar"))
     mob_entity = Entity(mob_stats.get('glyph'), mob_stats.get('color'), mob_stats.get('name'), mob_index, position=position_component,
@@ -228,11 +232,11 @@ def generate_mob(x, y, mob_stats, mob_index, encounter_group, faction, ai, entit
 
 
 def generate_object(x, y, entities, map_objects, particles, game_map, object_stats, object_index, item_list=None,
-                    no_inventory=True):
+                    no_inventory=True, rng=random):
 
     # Create an Object that has an "Interact" and "Wait" functions
     # _entities = [entity for entity in entities + map_objects if entity.position]
-    if not any([entity for entity in entities + map_objects if entity.position.x == x and entity.position.y == y]) and \
+    if not game_map.entity_index.is_occupied(x, y) and not game_map.map_object_index.is_occupied(x, y) and \
             game_map.is_within_map(x, y) and not game_map.is_blocked(x, y):
 
         inventory = object_stats.get('inventory')
@@ -258,13 +262,12 @@ def generate_object(x, y, entities, map_objects, particles, game_map, object_sta
                     inventory_component.add_item(item)
 
             elif not no_inventory:
-                inventory_component.items = _generate_random_items(number_of_items, game_map.dungeon_level)
+                inventory_component.items = _generate_random_items(number_of_items, game_map.dungeon_level, rng)
 
         # Check for Particle Attached to Tile Object
         particle_index = object_stats.get('particle')
         if particle_index:
-            particle_entity = generate_particle(x, y, particle_index)
-            particles.append(particle_entity)
+            particles.spawn(particle_index, x, y)
 
         movable = object_stats.get('moveable')
         breakable = object_stats.get('breakable')
@@ -285,18 +288,19 @@ def generate_object(x, y, entities, map_objects, particles, game_map, object_sta
         return map_object_entity
 
 
-def _generate_random_items(number_of_items, dungeon_level):
+def _generate_random_items(number_of_items, dungeon_level, rng=random):
     # Create Item Entities
     item_entities = []
+    items = obtain_item_table()
     item_chances = {item: spawn_chance([[item_stats.get('spawn_chance'), item_stats.get('item_level')]],
-                                       dungeon_level) for item, item_stats in ITEMS.items() if not item_stats.get('unique', False)
+                                       dungeon_level) for item, item_stats in items.items() if not item_stats.get('unique', False)
                     }
 
     # Generate Random Number of Items
     for i in range(number_of_items):
         # Randomly Select an Item to Spawn
-        item_index = random_choice_from_dict(item_chances)
-        item_stats = ITEMS[item_index]
+        item_index = random_choice_from_dict(item_chances, rng)
+        item_stats = items[item_index]
 
         if item_stats.get('type') == 'consumable':
             item_component = Item(use_function=eval(item_stats.get('use_function', "nothing")),
@@ -336,16 +340,17 @@ def _generate_random_items(number_of_items, dungeon_level):
     return item_entities
 
 
-def generate_objects(entities, map_objects, game_map, room, number_of_objects, object_chances, object_table):
+def generate_objects(entities, map_objects, game_map, room, number_of_objects, object_chances, object_table,
+                     rng=random):
     object_list = []
     for i in range(number_of_objects):
-        x, y = room.obtain_point_within(2)
+        x, y = room.obtain_point_within(2, rng)
 
-        if not any([entity for entity in entities + map_objects if entity.position.x == x and entity.position.y == y]) and \
+        if not game_map.entity_index.is_occupied(x, y) and not game_map.map_object_index.is_occupied(x, y) and \
                 game_map.is_within_map(x, y) and not game_map.is_blocked(x, y):
 
             # Randomly Select an Object to Spawn
-            object_index = random_choice_from_dict(object_chances)
+            object_index = random_choice_from_dict(object_chances, rng)
             object_stats = object_table[object_index]
 
             # Inventory/Items Contained Within
@@ -381,7 +386,7 @@ def generate_objects(entities, map_objects, game_map, room, number_of_objects, o
 
 def place_stairs(game_map, dungeon_level, x, y):
     object_index = "11"
-    object_stats = TILE_SET.get(object_index)
+    object_stats = obtain_tile_set().get(object_index)
 
     movable = object_stats.get('moveable')
     breakable = object_stats.get('breakable')
@@ -402,29 +407,31 @@ def place_stairs(game_map, dungeon_level, x, y):
     game_map.stairs = stairs_entity
 
 
-def place_prefab(game_map, prefab, entities, particles, dungeon_level, item_on_top=False, item_list=None):
+def place_prefab(game_map, prefab, entities, particles, dungeon_level, item_on_top=False, item_list=None, rng=random):
 
+    tile_set = obtain_tile_set()
     i = 0
     for x in range(prefab.x, prefab.x + prefab.width):
         for y in range(prefab.y, prefab.y + prefab.height):
 
             map_object = prefab.template[i]
-            object_stats = TILE_SET.get(str(map_object))
+            object_stats = tile_set.get(str(map_object))
             if object_stats.get('interact_function'):
                 item_entities = []
                 if item_on_top:
+                    items = obtain_item_table()
                     item_chances = {item: spawn_chance([[item_stats.get('spawn_chance'), item_stats.get('item_level')]],
-                                                       dungeon_level) for item, item_stats in ITEMS.items() if
+                                                       dungeon_level) for item, item_stats in items.items() if
                                     not item_stats.get('unique', False)
                                     }
-                    item_index = random_choice_from_dict(item_chances)
+                    item_index = random_choice_from_dict(item_chances, rng)
                     item_list = [item_index]
-                    item_json_index = choice(item_list)
+                    item_json_index = rng.choice(item_list)
                     item_entity = create_item_entity(item_json_index, x, y)
                     item_entities.append(item_entity)
 
                 generate_object(x, y, entities, game_map.map_objects, particles, game_map, object_stats, map_object,
-                                item_list=item_entities, no_inventory=False)
+                                item_list=item_entities, no_inventory=False, rng=rng)
 
             else:
                 place_tile(game_map, x, y, map_object)
@@ -436,7 +443,7 @@ def place_prefab(game_map, prefab, entities, particles, dungeon_level, item_on_t
 
 
 def create_item_entity(item_index, x=None, y=None):
-    item_stats = ITEMS.get(item_index)
+    item_stats = obtain_item_table().get(item_index)
     if x and y:
         position_component = Position(x, y)
     else:
@@ -486,25 +493,25 @@ def create_item_entity(item_index, x=None, y=None):
     return item_entity
 
 
-def generate_items(entities, game_map, room, number_of_items, item_chances, item_table):
+def generate_items(entities, game_map, room, number_of_items, item_chances, item_table, rng=random):
     item_list = []
     for i in range(number_of_items):
         if room:
             check_func = getattr(room, "obtain_point_within", None)
             if callable(check_func):
-                x, y = room.obtain_point_within(2)
+                x, y = room.obtain_point_within(2, rng)
             else:
-                x = randint(room.x, room.x + room.width)
-                y = randint(room.y, room.y + room.height)
+                x = rng.randint(room.x, room.x + room.width)
+                y = rng.randint(room.y, room.y + room.height)
 
         # Ensure another Entity doesn't already Exist in same coordinates
         # _entities = [entity for entity in entities if entity.position]
         try:
-            if not any([entity for entity in entities if entity.position.x == x and entity.position.y == y]) and \
+            if not game_map.entity_index.is_occupied(x, y) and \
                     game_map.is_within_map(x, y) and not game_map.is_blocked(x, y):
 
                 # Randomly Select an Item to Spawn
-                item_index = random_choice_from_dict(item_chances)
+                item_index = random_choice_from_dict(item_chances, rng)
                 item_entity = create_item_entity(item_index, x, y)
 
                 item_list.append(item_entity)
@@ -525,13 +532,13 @@ def generate_items(entities, game_map, room, number_of_items, item_chances, item
     return item_list
 
 
-def create_mob_entity(x, y, mob_index, encounter, ai_type=AI, faction_name="Mindless"):
-    mob_stats = MOBS.get(mob_index)
+def create_mob_entity(x, y, mob_index, encounter, ai_type=AI, faction_name="Mindless", rng=random):
+    mob_stats = obtain_mob_table().get(mob_index)
     faction_component = Faction(faction_name=faction_name)
     fighter_component = Fighter(hp=mob_stats.get('hp'), defense=mob_stats.get('def'),
                                 power=mob_stats.get('att'), xp=mob_stats.get('xp'), fov_range=mob_stats.get('fov_range'),
                                 mob_level=mob_stats.get('mob_level'))
-    ai_component = ai_type(encounter=encounter, origin_x=x, origin_y=y)
+    ai_component = ai_type(encounter=encounter, origin_x=x, origin_y=y, rng=rng)
     position_component = Position(x, y)
     mob_entity = Entity(mob_stats.get('glyph'), mob_stats.get('color'), mob_stats.get('name'), json_index=mob_index,
                         position=position_component, blocks=True, fighter=fighter_component,
@@ -539,27 +546,8 @@ def create_mob_entity(x, y, mob_index, encounter, ai_type=AI, faction_name="Mind
     return mob_entity
 
 
-def generate_particle(x, y, particle_index):
-    p_stats = PARTICLES.get(particle_index)
-    p_name = p_stats.get("name")
-    p_lifetime = p_stats.get("lifetime")
-    p_char = p_stats.get("glyph")
-    p_fg = p_stats.get("fg")
-    p_bg = p_stats.get("bg")
-    p_propagate = p_stats.get("propagate", False)
-    p_propagate_property = p_stats.get("propagate_property", None)
-    p_forever = p_stats.get("forever", False)
-    position_component = Position(x=x, y=y)
-    particle_component = Particle(lifetime=p_lifetime, char=p_char, fg=p_fg, bg=p_bg, forever=p_forever,
-                                      propagate=p_propagate, propagate_property=p_propagate_property)
-    particle_entity = Entity(char=p_char, color=p_fg, name=p_name, json_index=particle_index,
-                             position=position_component, particle=particle_component,
-                             render_order=RenderOrder.PARTICLE)
-
-    return particle_entity
-
-
-def generate_mobs(entities, game_map, number_of_mobs, mobs, monster_chances, encounter, room=None, x=None, y=None):
+def generate_mobs(entities, game_map, number_of_mobs, mobs, monster_chances, encounter, room=None, x=None, y=None,
+                  rng=random):
 
     monster_list = []
     MOBS = mobs
@@ -572,22 +560,22 @@ def generate_mobs(entities, game_map, number_of_mobs, mobs, monster_chances, enc
         if room:
             check_func = getattr(room, "obtain_point_within", None)
             if callable(check_func):
-                x, y = room.obtain_point_within(2)
+                x, y = room.obtain_point_within(2, rng)
             else:
-                x = randint(room.x, room.x + room.width)
-                y = randint(room.y, room.y + room.height)
+                x = rng.randint(room.x, room.x + room.width)
+                y = rng.randint(room.y, room.y + room.height)
 
         print("x, y:", x, y)
         # Ensure another Entity doesn't already Exist in same coordinates
         # _entities = [entity for entity in entities if entity.position]
-        if not any([entity for entity in entities if entity.position.x == x and entity.position.y == y]) and \
+        if not game_map.entity_index.is_occupied(x, y) and \
                 game_map.is_within_map(x, y) and not game_map.is_blocked(x, y):
 
-            mob_index = random_choice_from_dict(monster_chances)
+            mob_index = random_choice_from_dict(monster_chances, rng)
             mob_stats = MOBS.get(mob_index)
             faction = "Mindless"
             ai = AI
-            mob_entity = generate_mob(x, y, mob_stats, mob_index, encounter, faction, ai, entities)
+            mob_entity = generate_mob(x, y, mob_stats, mob_index, encounter, faction, ai, entities, rng=rng)
 
             entities.append(mob_entity)
             monster_list.append(mob_entity)
@@ -597,13 +585,14 @@ def generate_mobs(entities, game_map, number_of_mobs, mobs, monster_chances, enc
     return monster_list
 
 
-def place_entities(game_map, dungeon_level, room, entities, item_table, mob_table, mob_count=None, item_count=None):
+def place_entities(game_map, dungeon_level, room, entities, item_table, mob_table, mob_count=None, item_count=None,
+                   rng=random):
 
     # Get a Random Number of Monsters
     max_monsters_per_room = spawn_chance([[2, 1], [3, 4], [5, 6]], dungeon_level)
     max_items_per_room = spawn_chance([[1, 1], [2, 4]], dungeon_level)
-    number_of_mobs = randint(1, max_monsters_per_room)
-    number_of_items = randint(0, max_items_per_room)
+    number_of_mobs = rng.randint(1, max_monsters_per_room)
+    number_of_items = rng.randint(0, max_items_per_room)
 
     monster_chances = {mob: spawn_chance([stats for stats in mob_stats.get('spawn_chance')], dungeon_level)
                        for mob, mob_stats in mob_table.items()
@@ -622,9 +611,9 @@ def place_entities(game_map, dungeon_level, room, entities, item_table, mob_tabl
     pop = [AI, DefensiveAI, PatrolAI]
     # weights = [100]
     weights = [33, 33, 33]
-    encounter_type = choices(population=pop,
-                             weights=weights,
-                             k=1)[0]
+    encounter_type = rng.choices(population=pop,
+                                 weights=weights,
+                                 k=1)[0]
     encounter = Encounter(game_map, room, len(game_map.encounters) + 1)
 
     # Generate Prefabs
@@ -632,9 +621,10 @@ def place_entities(game_map, dungeon_level, room, entities, item_table, mob_tabl
 
     # Generate Monsters
     # def generate_mobs(entities, game_map, number_of_mobs, mobs, monster_chances, encounter, room=None, x=None, y=None):
-    encounter.mob_list = generate_mobs(entities, game_map, number_of_mobs, mob_table, monster_chances, encounter, room=room)
+    encounter.mob_list = generate_mobs(entities, game_map, number_of_mobs, mob_table, monster_chances, encounter, room=room,
+                                       rng=rng)
     # Generate Items
-    item_list = generate_items(entities, game_map, room, number_of_items, item_chances, item_table)
+    item_list = generate_items(entities, game_map, room, number_of_items, item_chances, item_table, rng)
 
     encounter.item_list = item_list
 
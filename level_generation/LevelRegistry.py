@@ -0,0 +1,32 @@
+import importlib
+
+# Level Generators by Name, as "module:Class". Modules are Imported on First Use, so Startup never Pays for
+# Generators (and their scipy/matplotlib/shapely Dependencies) that aren't Played
+LEVEL_GENERATORS = {
+    'arena': 'level_generation.Arena:Arena',
+    'undergrave': 'level_generation.UndergravePrison:UndergravePrison',
+    'resinfaire': 'level_generation.ResinfaireForest:ResinFaireForest',
+    'yendor_outer': 'level_generation.YendorCastleOuter:YendorCastleOuter',
+    'yendor_inner': 'level_generation.YendorCastleInner:YendorCastleInner',
+    'overworld': 'level_generation.Overworld:Overworld',
+    'random_walk': 'level_generation.RandomWalk:RandomWalkAlgorithm',
+    'tunneling': 'level_generation.Tunneling:TunnelingAlgorithm',
+}
+LOADED_GENERATORS = {}  # name: class
+
+
+def register_level_generator(name, qualified_name):
+    LEVEL_GENERATORS[name] = qualified_name
+    LOADED_GENERATORS.pop(name, None)
+
+
+def obtain_level_generator(name):
+    generator = LOADED_GENERATORS.get(name)
+    if generator is None:
+        module_name, class_name = LEVEL_GENERATORS[name].split(':')
+        generator = LOADED_GENERATORS[name] = getattr(importlib.import_module(module_name), class_name)
+    return generator
+
+
+def create_level_generator(name):
+    return obtain_level_generator(name)()
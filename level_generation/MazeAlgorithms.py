@@ -18,6 +18,10 @@ import random
 from math import sqrt
 from collections import OrderedDict
 
+import numpy as np
+
+from level_generation.RegionLabelling import label_regions, largest_region, regions_by_size
+
 SCREEN_WIDTH = 80
 SCREEN_HEIGHT = 60
 TEXTBOX_HEIGHT = 10
@@ -675,69 +679,29 @@ class CellularAutomata:
 
     def getCaves(self, mapWidth, mapHeight):
         # locate all the caves within self.level and stor them in self.caves
-        for x in range(0, mapWidth):
-            for y in range(0, mapHeight):
-                if self.level[x][y] == 0:
-                    self.floodFill(x, y)
-
-        for set in self.caves:
-            for tile in set:
-                self.level[tile[0]][tile[1]] = 0
-
-        # check for 2 that weren't changed.
-        '''
-        The following bit of code doesn't do anything. I 
-        put this in to help find mistakes in an earlier 
-        version of the algorithm. Still, I don't really 
-        want to remove it.
-        '''
-        # for x in range(0, mapWidth):
-        #     for y in range(0, mapHeight):
-        #         if self.level[x][y] == 2:
-        #             print("(", x, ",", y, ")")
-
-    def floodFill(self, x, y):
-        '''
-        flood fill the separate regions of the level, discard
-        the regions that are smaller than a minimum size, and
-        create a reference for the rest.
-        '''
-        cave = set()
-        tile = (x, y)
-        toBeFilled = set([tile])
-        while toBeFilled:
-            tile = toBeFilled.pop()
-
-            if tile not in cave:
-                cave.add(tile)
-
-                self.level[tile[0]][tile[1]] = 1
-
-                # check adjacent cells
-                x = tile[0]
-                y = tile[1]
-                north = (x, y - 1)
-                south = (x, y + 1)
-                east = (x + 1, y)
-                west = (x - 1, y)
-
-                for direction in [north, south, east, west]:
+        level = np.array(self.level)
+        labels, sizes, _ = label_regions(level == 0)
 
-                    if self.level[direction[0]][direction[1]] == 0:
-                        if direction not in toBeFilled and direction not in cave:
-                            toBeFilled.add(direction)
+        # discard the regions that are smaller than a minimum size,
+        # and create a reference for the rest
+        keep, caveLabels = regions_by_size(labels, sizes, min_size=self.ROOM_MIN_SIZE)
+        for label in caveLabels:
+            xs, ys = np.nonzero(labels == label)
+            self.caves.append(set(zip(xs.tolist(), ys.tolist())))
 
-        if len(cave) >= self.ROOM_MIN_SIZE:
-            self.caves.append(cave)
+        level[(level == 0) & ~keep] = 1
+        self.level = level.tolist()
 
     def connectCaves(self, mapWidth, mapHeight):
         # Find the closest cave to the current cave
         for currentCave in self.caves:
+            # label the level once per cave, tunnels are only dug after the search
+            labels, _, _ = label_regions(np.array(self.level) == 0)
             for point1 in currentCave: break  # get an element from cave1
             point2 = None
             distance = 0
             for nextCave in self.caves:
-                if nextCave != currentCave and not self.checkConnectivity(currentCave, nextCave):
+                if nextCave != currentCave and not self.checkConnectivity(currentCave, nextCave, labels):
                     # choose a random point from nextCave
                     for nextPoint in nextCave: break  # get an element from cave1
                     # compare distance of point1 to old and new point2
@@ -753,40 +717,12 @@ class CellularAutomata:
         d = sqrt((point2[0] - point1[0]) ** 2 + (point2[1] - point1[1]) ** 2)
         return d
 
-    def checkConnectivity(self, cave1, cave2):
-        # floods cave1, then checks a point in cave2 for the flood
-
-        connectedRegion = set()
+    def checkConnectivity(self, cave1, cave2, labels):
+        # checks whether a point in cave1 and a point in cave2 share a region of labels
         for start in cave1: break  # get an element from cave1
-
-        toBeFilled = set([start])
-        while toBeFilled:
-            tile = toBeFilled.pop()
-
-            if tile not in connectedRegion:
-                connectedRegion.add(tile)
-
-                # check adjacent cells
-                x = tile[0]
-                y = tile[1]
-                north = (x, y - 1)
-                south = (x, y + 1)
-                east = (x + 1, y)
-                west = (x - 1, y)
-
-                for direction in [north, south, east, west]:
-
-                    if self.level[direction[0]][direction[1]] == 0:
-                        if direction not in toBeFilled and direction not in connectedRegion:
-                            toBeFilled.add(direction)
-
         for end in cave2: break  # get an element from cave2
 
-        if end in connectedRegion:
-            return True
-
-        else:
-            return False
+        return labels[start] == labels[end]
 
 
 # ==== Room Addition ====
@@ -1003,46 +939,10 @@ class RoomAddition:
         '''
         Find the largest region. Fill in all other regions.
         '''
-        roomWidth, roomHeight = self.getRoomDimensions(room)
-        largestRegion = set()
-
-        for x in range(roomWidth):
-            for y in range(roomHeight):
-                if room[x][y] == 0:
-                    newRegion = set()
-                    tile = (x, y)
-                    toBeFilled = set([tile])
-                    while toBeFilled:
-                        tile = toBeFilled.pop()
-
-                        if tile not in newRegion:
-                            newRegion.add(tile)
-
-                            room[tile[0]][tile[1]] = 1
-
-                            # check adjacent cells
-                            x = tile[0]
-                            y = tile[1]
-                            north = (x, y - 1)
-                            south = (x, y + 1)
-                            east = (x + 1, y)
-                            west = (x - 1, y)
+        labels, sizes, _ = label_regions(np.array(room) == 0)
+        largestRegion = largest_region(labels, sizes, min_size=self.ROOM_MIN_SIZE)
 
-                            for direction in [north, south, east, west]:
-
-                                if room[direction[0]][direction[1]] == 0:
-                                    if direction not in toBeFilled and direction not in newRegion:
-                                        toBeFilled.add(direction)
-
-                    if len(newRegion) >= self.ROOM_MIN_SIZE:
-                        if len(newRegion) > len(largestRegion):
-                            largestRegion.clear()
-                            largestRegion.update(newRegion)
-
-        for tile in largestRegion:
-            room[tile[0]][tile[1]] = 0
-
-        return room
+        return np.where(largestRegion, 0, 1).tolist()
 
     def placeRoom(self, room, mapWidth, mapHeight):  # (self,room,direction,)
         roomX = None
@@ -11,6 +11,7 @@ class MazeWithRooms:
     http://journal.stuffwithstuff.com/2014/12/21/rooms-and-mazes/
     by Bob Nystrom
     """
+    rng = random  # random.Random the Level is Generated from, Set by generate_level
 
     def __init__(self):
         self.level = []
@@ -113,7 +114,7 @@ class MazeWithRooms:
                 it isn't necessary to do otherwise.
                 """
                 if ((last_direction in unmade_cells) and
-                        (random.random() > self.windingPercent)):
+                        (self.rng.random() > self.windingPercent)):
                     direction = last_direction
                 else:
                     direction = unmade_cells.pop()
@@ -147,12 +148,12 @@ class MazeWithRooms:
             Pick a random room size and ensure that rooms have odd 
             dimensions and that rooms are not too narrow.
             """
-            room_width = random.randint(int(self.ROOM_MIN_SIZE / 2), int(self.ROOM_MAX_SIZE / 2)) * 2 + 1
-            room_height = random.randint(int(self.ROOM_MIN_SIZE / 2), int(self.ROOM_MAX_SIZE / 2)) * 2 + 1
-            x = (random.randint(0, self.map_width - room_width - 1) / 2) * 2 + 1
-            y = (random.randint(0, self.map_height - room_height - 1) / 2) * 2 + 1
+            room_width = self.rng.randint(int(self.ROOM_MIN_SIZE / 2), int(self.ROOM_MAX_SIZE / 2)) * 2 + 1
+            room_height = self.rng.randint(int(self.ROOM_MIN_SIZE / 2), int(self.ROOM_MAX_SIZE / 2)) * 2 + 1
+            x = (self.rng.randint(0, self.map_width - room_width - 1) / 2) * 2 + 1
+            y = (self.rng.randint(0, self.map_height - room_height - 1) / 2) * 2 + 1
 
-            room = Rect(x, y, room_width, room_height, buffer=random.randint(0, 1))
+            room = Rect(x, y, room_width, room_height, buffer=self.rng.randint(0, 1))
             # check for overlap with previous rooms
             failed = False
             for other_room in self.rooms:
@@ -274,7 +275,7 @@ class MazeWithRooms:
                 if len(regions) > 1:
                     continue
 
-                if random.random() < self.connection_chance:
+                if self.rng.random() < self.connection_chance:
                     self.add_junction(pos)
 
                 # remove it
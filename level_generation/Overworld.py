@@ -1,13 +1,9 @@
 from copy import copy
 from functools import partial
 import math
+import random
 
 import numpy as np
-
-from scipy.spatial import ConvexHull, Delaunay
-
-import matplotlib.pyplot as plt
-
 import tcod
 import tcod.noise
 import tcod.path
@@ -27,9 +23,10 @@ class Overworld:
     #     self.dungeon_level = 0
 
     def generate_level(self, game_map, dungeon_level, max_rooms, room_min_size, room_max_size, map_width, map_height,
-                       player, entities, particles, particle_systems, item_table, mob_table):
+                       player, entities, particles, particle_systems, item_table, mob_table, rng=random):
 
         self.game_map = game_map
+        self.rng = rng
         # self.dungeon_level = dungeon_level
         # # Initialize Noise
         # self.noise = tcod.noise.Noise(
@@ -63,7 +60,8 @@ class Overworld:
         # Voronoi Generation
         polygons, map_size, center_points, vertices = FiniteVoronoi.voronoi_polygons(
             max(map_width // 6, map_height // 6),
-            (map_width, map_height)
+            (map_width, map_height),
+            rng=self.rng
         )
 
         # Generate Roads
@@ -126,7 +124,7 @@ class Overworld:
             max_x, max_y = z[-1]
             # print(min_x, min_y, max_x, max_y)
             b.generate_level(game_map, max_rooms, room_min_size, room_max_size, max_x-1, max_y-1,
-                       entities, particles, item_table, mob_table, min_x-1, min_y-1, poly)
+                       entities, particles, item_table, mob_table, min_x-1, min_y-1, poly, rng=self.rng)
 
             # x = [p[0] for p in poly]
             # y = [p[1] for p in poly]
@@ -152,6 +150,7 @@ class Overworld:
 
         # Outerwalls
         # TODO: Sometimes the convex hull does not generate?
+        from scipy.spatial import ConvexHull  # Imported on First Use, Heavy
         unpack_polygons = np.array([c for v in polygons for c in v])
         hull = ConvexHull(points=unpack_polygons, qhull_options='QG6')
         corner_points = []
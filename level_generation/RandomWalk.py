@@ -1,11 +1,13 @@
 from math import sqrt
-from random import randint, random
+import random
 
 from level_generation.GenerationUtils import create_floor, place_entities, place_stairs
 from map_objects.Shapes import Circle
 
 
 class RandomWalkAlgorithm:
+    rng = random  # random.Random the Level is Generated from, Set by generate_level
+
     def __init__(self):
         self.game_map = None
         self._percentGoal = .6
@@ -26,7 +28,8 @@ class RandomWalkAlgorithm:
         self.random_walk_y = 0
 
     def generate_level(self, game_map, dungeon_level, max_rooms, room_min_size, room_max_size, map_width, map_height,
-                       player, entities, particles, particle_systems, item_table, mob_table):
+                       player, entities, particles, particle_systems, item_table, mob_table, rng=random):
+        self.rng = rng
         # Creates an empty 2D array or clears existing array
         self.walk_iterations = max(self.walk_iterations, (map_width * map_height * 10))
         self.game_map = game_map
@@ -34,8 +37,8 @@ class RandomWalkAlgorithm:
 
         self.radius = max(map_width//10, map_height//10)
 
-        self.random_walk_x = randint(self.radius, map_width - self.radius - 1)
-        self.random_walk_y = randint(self.radius, map_height - self.radius - 1)
+        self.random_walk_x = self.rng.randint(self.radius, map_width - self.radius - 1)
+        self.random_walk_y = self.rng.randint(self.radius, map_height - self.radius - 1)
 
         # Modify Percent Goal Depending on Dungeon Level
         self._percentGoal = 0.1 + (self.dungeon_level * 0.015)
@@ -62,7 +65,7 @@ class RandomWalkAlgorithm:
                         room = Circle(game_map, self.random_walk_x, self.random_walk_y, self.radius,
                                       len(game_map.rooms) + 1)
                         game_map.rooms.append(room)
-                        place_entities(self.game_map, self.dungeon_level, room, entities, item_table, mob_table)
+                        place_entities(self.game_map, self.dungeon_level, room, entities, item_table, mob_table, rng=self.rng)
                         self.encounters.append((self.random_walk_x, self.random_walk_y))
                 else:
                     # TODO: Find a way to not allow multiple iteration checks for encounter_within_proximity
@@ -111,7 +114,7 @@ class RandomWalkAlgorithm:
         west /= total
 
         # choose the direction
-        choice = random()
+        choice = self.rng.random()
         if 0 <= choice < north:
             dx = 0
             dy = -1
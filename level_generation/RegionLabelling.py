@@ -0,0 +1,45 @@
+import numpy as np
+
+# Neighbourhoods for label_regions, Cells Touching only at Corners are Connected with DIAGONAL
+CARDINAL = np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]])
+DIAGONAL = np.ones((3, 3), dtype=int)
+
+
+def label_regions(open_cells, diagonal=False):
+    """
+    Connected-component labelling of a 2d boolean array, in one pass over the grid.
+
+    Returns (labels, sizes, bounding_boxes):
+    - labels: int32 array the shape of open_cells, 0 for closed cells and 1..n for each region, numbered in the order
+      their first cell appears scanning the array row by row (so [x][y] grids are numbered x then y)
+    - sizes: cell count of each region, indexed by label (sizes[0] is always 0)
+    - bounding_boxes: tuple of slices (one per axis) of each region, indexed by label (bounding_boxes[0] is None)
+    Axes are the array's own, [x][y] grids get (x slice, y slice) and GameMap layers get (y slice, x slice).
+    """
+    # scipy is Imported on First Use, Only Generators that Label Regions Pay for it
+    from scipy.ndimage import find_objects, label
+
+    open_cells = np.asarray(open_cells, dtype=bool)
+    labels = np.zeros(open_cells.shape, dtype=np.int32)
+    count = label(open_cells, structure=DIAGONAL if diagonal else CARDINAL, output=labels)
+    sizes = np.bincount(labels.ravel(), minlength=count + 1)
+    sizes[0] = 0
+    bounding_boxes = [None, *find_objects(labels, max_label=count)]
+    return labels, sizes, bounding_boxes
+
+
+def largest_region(labels, sizes, min_size=1):
+    # Boolean Mask of the Largest Region (the First One on Ties), Empty when None has min_size Cells
+    region = int(np.argmax(sizes))
+    if not region or sizes[region] < min_size:
+        return np.zeros(labels.shape, dtype=bool)
+    return labels == region
+
+
+def regions_by_size(labels, sizes, min_size=1, max_size=None):
+    # Boolean Mask of Every Region with min_size to max_size Cells, and their Labels in Order
+    keep = sizes >= min_size
+    if max_size is not None:
+        keep &= sizes <= max_size
+    keep[0] = False
+    return keep[labels], np.flatnonzero(keep)
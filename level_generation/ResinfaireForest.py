@@ -1,5 +1,5 @@
 from copy import deepcopy
-from random import choice, choices, randint, shuffle
+import random
 from math import sqrt
 
 import numpy as np
@@ -8,14 +8,12 @@ import tcod
 from components.AI import AI, DefensiveAI, PatrolAI
 from components.Encounter import Encounter
 from level_generation.CellularAutomata import AreaofInterest, CellularAutomata
-from level_generation.GenerationUtils import generate_mobs, generate_object, place_tile, create_floor, create_wall, generate_mob, place_prefab, place_stairs, place_entities
+from level_generation.GenerationUtils import generate_mobs, generate_object, place_tile, place_tiles, create_floor, create_wall, generate_mob, place_prefab, place_stairs, place_entities
 from level_generation.Prefab import Prefab
 from loader_functions.JsonReader import obtain_tile_set, obtain_prefabs, obtain_mob_table
-from RandomUtils import spawn_chance
+from RandomUtils import spawn_chance, tcod_random
 
-TILESET = obtain_tile_set()
-MOBS = obtain_mob_table("resinfaire_mobs")
-PREFABS = obtain_prefabs()
+MOB_TABLE = "resinfaire_mobs"
 
 
 class ResinFaireForest(CellularAutomata):
@@ -24,7 +22,8 @@ class ResinFaireForest(CellularAutomata):
     town_center = None
 
     def generate_level(self, game_map, dungeon_level, max_rooms, room_min_size, room_max_size, map_width, map_height,
-                       player, entities, particles, particle_systems, item_table, mob_table):
+                       player, entities, particles, particle_systems, item_table, mob_table, rng=random):
+        self.rng = rng
         self.game_map = game_map
         self.dungeon_level = dungeon_level
         self.width = map_width
@@ -38,8 +37,6 @@ class ResinFaireForest(CellularAutomata):
             self.min_count = 5
             self.iterations = 1
             self.pillar_iterations = 1
-            self.flood_tries = 5
-            self.goal_percentage = 30  # above 30% seems to be a good target
             self.encounter_spread_factor = 3
             self.sparse_wall_density = 10
 
@@ -54,8 +51,6 @@ class ResinFaireForest(CellularAutomata):
             self.min_count = 5
             self.iterations = 2
             self.pillar_iterations = 1
-            self.flood_tries = 5
-            self.goal_percentage = 30  # above 30% seems to be a good target
             self.encounter_spread_factor = 5
             self.sparse_wall_density = 2
             # Specific Dungeon Level Variables
@@ -67,8 +62,6 @@ class ResinFaireForest(CellularAutomata):
             self.min_count = 5
             self.iterations = 2
             self.pillar_iterations = 1
-            self.flood_tries = 5
-            self.goal_percentage = 30  # above 30% seems to be a good target
             self.encounter_spread_factor = 5
             self.sparse_wall_density = 50
             # Specific Dungeon Level Variables
@@ -82,13 +75,11 @@ class ResinFaireForest(CellularAutomata):
             self.min_count = 5
             self.iterations = 1
             self.pillar_iterations = 1
-            self.flood_tries = 5
-            self.goal_percentage = 30  # above 30% seems to be a good target
             self.encounter_spread_factor = 10
             self.sparse_wall_density = 10
             # Specific Dungeon Level Variables
             mold = True
-            town = choice([False, True])
+            town = self.rng.choice([False, True])
 
 
         # Terrain Generation
@@ -141,7 +132,7 @@ class ResinFaireForest(CellularAutomata):
         # self.ref_spawn_groups(entities)
         areas = deepcopy(self.areas_of_interest)
         for area in areas:
-            place_entities(self.game_map, self.dungeon_level, area, entities, item_table, mob_table)
+            place_entities(self.game_map, self.dungeon_level, area, entities, item_table, mob_table, rng=self.rng)
 
         # Game Map
         self.game_map = game_map
@@ -150,28 +141,24 @@ class ResinFaireForest(CellularAutomata):
         place_stairs(game_map, self.dungeon_level, self.end_area.x, self.end_area.y + 2)
 
     def assign_tiles(self, mold=False):
-        # Assign Tiles from Grid
-        for x in range(self.width):
-            for y in range(self.height):
-                if self.grid[x][y] == 1:
-                    if randint(0, 6) == 1 and mold:
-                        place_tile(self.game_map, x, y, '46')  # normal tree
-                    else:
-                        place_tile(self.game_map, x, y, '13')  # moldfy tree
+        # Assign Tiles from Grid, Rolled for Every Cell at Once
+        draws = np.random.default_rng(self.rng.getrandbits(64))
+        walls = self.grid == 1
+        floors = self.grid == 0
+        tiles = np.full(self.grid.shape, -1, dtype=np.int32)
 
-                elif self.grid[x][y] == 0:
-                    if randint(0, 4) == 1:
-                        place_tile(self.game_map, x, y, '44')  # normal grass
-                    elif randint(0, 6) == 1 and mold:
-                        place_tile(self.game_map, x, y, '45')  # fungus grass
-                    else:
-                        create_floor(self.game_map, x, y)
+        tiles[walls] = 13  # moldfy tree
+        if mold:
+            tiles[walls & (draws.integers(0, 7, size=tiles.shape) == 1)] = 46  # normal tree
 
-                # elif self.grid[x][y] == 2:  # river
-                #     place_tile(self.game_map, x, y, '37')
+        tiles[floors] = 2
+        if mold:
+            tiles[floors & (draws.integers(0, 7, size=tiles.shape) == 1)] = 45  # fungus grass
+        tiles[floors & (draws.integers(0, 5, size=tiles.shape) == 1)] = 44  # normal grass
 
-                # elif self.grid[x][y] == 0:
-                #     create_floor(game_map, x, y)
+        xs, ys = np.nonzero(tiles >= 0)
+        place_tiles(self.game_map, xs, ys, tiles[xs, ys])
+        # River (Grid 2) would be Tile '37'
 
     def generate_castle_entrance(self):
         x = self.end_area.x
@@ -210,6 +197,7 @@ class ResinFaireForest(CellularAutomata):
             min_height=6,
             max_horizontal_ratio=1.5,
             max_vertical_ratio=1.5,
+            seed=tcod_random(self.rng)
         )
 
         # Pre-process through Nodes to Assign Specific Buildings
@@ -227,10 +215,10 @@ class ResinFaireForest(CellularAutomata):
 
                 # print(room_min_size, min(room_max_size, node.width - 1))
                 # print(room_min_size, min(room_max_size, node.height - 1))
-                w = randint(room_min_size, min(room_max_size, node.width - 1))
-                h = randint(room_min_size, min(room_max_size, node.height - 1))
-                x = randint(node.x, node.x + (node.width - 1) - w)
-                y = randint(node.y, node.y + (node.height - 1) - h)
+                w = self.rng.randint(room_min_size, min(room_max_size, node.width - 1))
+                h = self.rng.randint(room_min_size, min(room_max_size, node.height - 1))
+                x = self.rng.randint(node.x, node.x + (node.width - 1) - w)
+                y = self.rng.randint(node.y, node.y + (node.height - 1) - h)
                 buildings.append((x, y, w, h))
 
         # Find Closest to Center
@@ -248,14 +236,14 @@ class ResinFaireForest(CellularAutomata):
         town_center_area = AreaofInterest(*t)
         self.town_center = town_center_area
         self.areas_of_interest.append(town_center_area)
-        town_center_prefab = PREFABS.get("town_center")
+        town_center_prefab = obtain_prefabs().get("town_center")
         p = Prefab()
         p.load_template(town_center_prefab)
         p.x, p.y = t[0], t[1]
         buildings.remove(t)
 
         for x, y, w, h in buildings:
-            ruined = choice([False, True])
+            ruined = self.rng.choice([False, True])
             self.clear_floor(x, y, w, h)
             self.create_walled_room(x, y, w, h, ruined)
 
@@ -271,7 +259,7 @@ class ResinFaireForest(CellularAutomata):
         # place_tile(self.game_map, bsp_width//2 + bsp_x,  bsp_height//2 + bsp_y, "46")
 
         # Place Town Center
-        place_prefab(self.game_map, p, entities, particles, self.dungeon_level)
+        place_prefab(self.game_map, p, entities, particles, self.dungeon_level, rng=self.rng)
 
         # Road from Town Center to Castle Gates
 
@@ -296,29 +284,30 @@ class ResinFaireForest(CellularAutomata):
 
         # print('poss_locations:', poss_locations)
         # Two Doors
-        shuffle(poss_locations)
-        if randint(0, 4) == 1:
+        self.rng.shuffle(poss_locations)
+        if self.rng.randint(0, 4) == 1:
             door_x, door_y = poss_locations.pop()
             # print('door:', door_x, door_y)
             create_floor(self.game_map, door_x, door_y)
             door_index = "5"
-            door_stats = TILESET.get(door_index)
+            door_stats = obtain_tile_set().get(door_index)
             generate_object(door_x, door_y, entities, self.game_map.map_objects, particles, self.game_map, door_stats,
-                            door_index, item_list=None)
+                            door_index, item_list=None, rng=self.rng)
 
         door_x, door_y = poss_locations.pop()
         # print('door:', door_x, door_y)
         create_floor(self.game_map, door_x, door_y)
         door_index = "5"
-        door_stats = TILESET.get(door_index)
+        door_stats = obtain_tile_set().get(door_index)
         generate_object(door_x, door_y, entities, self.game_map.map_objects, particles, self.game_map, door_stats,
-                        door_index, item_list=None)
+                        door_index, item_list=None, rng=self.rng)
 
         return door_x, door_y
 
     def populate_building(self, x, y, w, h, entities, particles):
         # Place Prefabs for Building
-        chest = choices(population=[PREFABS.get("open_chest"), PREFABS.get("closed_chest")], weights=[50, 50], k=1)[0]
+        prefabs = obtain_prefabs()
+        chest = self.rng.choices(population=[prefabs.get("open_chest"), prefabs.get("closed_chest")], weights=[50, 50], k=1)[0]
         prefab_list = [chest]
         for prefab in prefab_list:
             p = Prefab()
@@ -326,12 +315,12 @@ class ResinFaireForest(CellularAutomata):
             tries = 0
             max_tries = 20
             while tries < max_tries:
-                random_x = randint(x, x + w - p.width)
-                random_y = randint(y, y + h - p.height)
+                random_x = self.rng.randint(x, x + w - p.width)
+                random_y = self.rng.randint(y, y + h - p.height)
 
                 if self.grid[random_x][random_y] == 0 and self.game_map.walkable[random_y][random_x]:
                     p.x, p.y = random_x, random_y
-                    place_prefab(self.game_map, p, entities, particles, self.dungeon_level)
+                    place_prefab(self.game_map, p, entities, particles, self.dungeon_level, rng=self.rng)
                     tries = max_tries
                 tries += 1
 
@@ -357,12 +346,12 @@ class ResinFaireForest(CellularAutomata):
                         y == room_y + room_height - 1:
 
                     if ruined:
-                        if randint(0, 100) < 80:
+                        if self.rng.randint(0, 100) < 80:
                             create_wall(self.game_map, x, y)
                     else:
                         create_wall(self.game_map, x, y)
                 else:
-                    if ruined and randint(0, 100) < 25:
+                    if ruined and self.rng.randint(0, 100) < 25:
                         create_floor(self.game_map, x, y)
                     else:
                         place_tile(self.game_map, x, y, "47")
@@ -372,21 +361,21 @@ class ResinFaireForest(CellularAutomata):
     def generate_rivers(self):
         # print('generate_rivers')
         # print(self.game_map.tile_cost)
-        number_of_rivers = randint(0, 1 + ((self.width+self.height) // (2 * 30)))
+        number_of_rivers = self.rng.randint(0, 1 + ((self.width+self.height) // (2 * 30)))
         # number_of_rivers = randint(1, 3)
         for i in range(number_of_rivers):
-            river_width = randint(1, 3)
+            river_width = self.rng.randint(1, 3)
 
             # Cache River Starting Points
-            direction = [[(0, randint(0, self.width - 1)), (self.height - 1, randint(0, self.width - 1))],
-                         [(randint(0, self.height - 1), 0), (randint(0, self.height - 1), self.width - 1)]]
-            river_points = choice(direction)
-            shuffle(river_points)
+            direction = [[(0, self.rng.randint(0, self.width - 1)), (self.height - 1, self.rng.randint(0, self.width - 1))],
+                         [(self.rng.randint(0, self.height - 1), 0), (self.rng.randint(0, self.height - 1), self.width - 1)]]
+            river_points = self.rng.choice(direction)
+            self.rng.shuffle(river_points)
             start_x, start_y = river_points.pop()
             end_x, end_y = river_points.pop()
 
             # AStar Pathfind Around Obstacles to End of Area
-            astar = tcod.path.AStar(self.game_map.tile_cost, 1.41)
+            astar = self.game_map.obtain_pathfinder(1.41)
             river_path = astar.get_path(start_x, start_y, end_x, end_y)
             river_path.extend([(start_x, start_y), (end_x, end_y)])  # Add Start and End points
 
@@ -406,7 +395,7 @@ class ResinFaireForest(CellularAutomata):
 
     def generate_road(self, x1,y1,x2,y2, wide=False):
         # Connect Roads between (2) Areas
-        astar = tcod.path.AStar(self.game_map.tile_cost, 5)
+        astar = self.game_map.obtain_pathfinder(5)
 
         path = astar.get_path(y1, x1, y2, x2)
         for x, y in path:
@@ -423,10 +412,10 @@ class ResinFaireForest(CellularAutomata):
         # print('generate_roads')
 
         # Connect Start and End
-        astar = tcod.path.AStar(self.game_map.tile_cost, 1.41)
+        astar = self.game_map.obtain_pathfinder(1.41)
         path = astar.get_path(self.start_area.center[1], self.start_area.center[0], self.end_area.center[1], self.end_area.center[0])
         for x, y in path:
-            if randint(1, 4) == 1:
+            if self.rng.randint(1, 4) == 1:
                 place_tile(self.game_map, y, x, '12')
 
         # Connect All Areas of Interest
@@ -434,7 +423,7 @@ class ResinFaireForest(CellularAutomata):
         for area in self.areas_of_interest[1:]:
             center_y, center_x = area.center
 
-            astar = tcod.path.AStar(self.game_map.tile_cost, 1.41)
+            astar = self.game_map.obtain_pathfinder(1.41)
             path = astar.get_path(prev_x, prev_y, center_x, center_y)
             # print('\n\nstart:', prev_x, prev_y)
             # print('end:', center_x, center_y)
@@ -456,7 +445,7 @@ class ResinFaireForest(CellularAutomata):
             hurst=0.5,
             lacunarity=2.0,
             octaves=4,
-            seed=None,
+            seed=tcod_random(self.rng),
         )
 
         # Create a 5x5 open multi-dimensional mesh-grid.
@@ -492,33 +481,33 @@ A
 
         for area in self.areas_of_interest:
             center_x, center_y = area.center
-            dice_roll = randint(1, 2)
+            dice_roll = self.rng.randint(1, 2)
             # ai_type = PatrolAI
             # ai_type = DefensiveAI
             # ai_type = PatrolAI
-            ai_type = choice([DefensiveAI, PatrolAI])
+            ai_type = self.rng.choice([DefensiveAI, PatrolAI])
             encounter = Encounter(self.game_map, area, len(self.game_map.encounters) + 1, ai_type)
             # dice_roll = 1
             if dice_roll == 1:
                 # Spawn "Imperial" Group
                 faction = "Imperials"
                 imperial_index = 'imperial_knight'
-                imperial_stats = MOBS.get(imperial_index)
+                imperial_stats = obtain_mob_table(MOB_TABLE).get(imperial_index)
                 if self.game_map.walkable[center_y][center_x]:
-                    entities.append(generate_mob(center_x, center_y, imperial_stats, imperial_index, encounter, faction, ai_type, entities))
+                    entities.append(generate_mob(center_x, center_y, imperial_stats, imperial_index, encounter, faction, ai_type, entities, rng=self.rng))
                 else:
                     x, y = self.obtain_location(area, entities)
                     if x and y:
-                        mob = generate_mob(x, y, imperial_stats, imperial_index, encounter, faction, ai_type, entities)
+                        mob = generate_mob(x, y, imperial_stats, imperial_index, encounter, faction, ai_type, entities, rng=self.rng)
                         entities.append(mob)
                         encounter.mob_list.append(mob)
 
                 imperial_index = 'imperial_warrior'
-                imperial_stats = MOBS.get(imperial_index)
+                imperial_stats = obtain_mob_table(MOB_TABLE).get(imperial_index)
                 for i in range(2):
                     x, y = self.obtain_location(area, entities)
                     if x and y:
-                        mob = generate_mob(x, y, imperial_stats, imperial_index, encounter, faction, ai_type, entities)
+                        mob = generate_mob(x, y, imperial_stats, imperial_index, encounter, faction, ai_type, entities, rng=self.rng)
                         entities.append(mob)
                         encounter.mob_list.append(mob)
 
@@ -528,36 +517,36 @@ A
                 faction = "Rebels"
 
                 rebel_index = 'rebel_fighter'
-                rebel_stats = MOBS.get(rebel_index)
+                rebel_stats = obtain_mob_table(MOB_TABLE).get(rebel_index)
                 for i in range(2):
                     x, y = self.obtain_location(area, entities)
                     if x and y:
-                        mob = generate_mob(x, y, rebel_stats, rebel_index, encounter, faction, ai_type, entities)
+                        mob = generate_mob(x, y, rebel_stats, rebel_index, encounter, faction, ai_type, entities, rng=self.rng)
                         entities.append(mob)
                         encounter.mob_list.append(mob)
 
             self.game_map.encounters.append(encounter)
 
     def generate_outpost(self, area, entities, particles):
-        if randint(1, 5) == 1:
+        if self.rng.randint(1, 5) == 1:
             center_x, center_y = area.x, area.y
             faction = "Rebels"
 
             width = 5
             height = 5
-            prefab = PREFABS.get('output_test')
+            prefab = obtain_prefabs().get('output_test')
             p = Prefab()
             p.load_template(prefab)
             p.x = center_x - (width // 2)
             p.y = center_y - (height // 2)
-            place_prefab(self.game_map, p, entities, particles, self.dungeon_level)
+            place_prefab(self.game_map, p, entities, particles, self.dungeon_level, rng=self.rng)
             x, y = self.obtain_location(area, entities)
 
             if x and y:
                 chest_index = "10"
-                chest_stats = TILESET.get(chest_index)
+                chest_stats = obtain_tile_set().get(chest_index)
                 generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map, chest_stats,
-                                chest_index, item_list=None, no_inventory=False)
+                                chest_index, item_list=None, no_inventory=False, rng=self.rng)
         # else:
         #     faction = 'Imperials'
 
@@ -572,7 +561,7 @@ A
         elif faction == 'Imperials':
             mob_index = 'imperial_knight'
 
-        mob_stats = MOBS.get(mob_index)
+        mob_stats = obtain_mob_table(MOB_TABLE).get(mob_index)
         # ai_type = DefensiveAI
         ai_type = AI
         # ai_type = choice([DefensiveAI, PatrolAI])
@@ -580,7 +569,7 @@ A
         for i in range(2):
             x, y = self.obtain_location(area, entities)
             if x and y:
-                mob = generate_mob(x, y, mob_stats, mob_index, encounter, faction, ai_type, entities)
+                mob = generate_mob(x, y, mob_stats, mob_index, encounter, faction, ai_type, entities, rng=self.rng)
                 entities.append(mob)
                 encounter.mob_list.append(mob)
 
@@ -595,14 +584,13 @@ A
         # _entities = [entity for entity in entities if entity.position]
         x, y = None, None
         while tries < max_tries:
-            x = randint(center_x - radius, center_x + radius)
-            y = randint(center_y - radius, center_y + radius)
+            x = self.rng.randint(center_x - radius, center_x + radius)
+            y = self.rng.randint(center_y - radius, center_y + radius)
 
             if not 0 <= x < self.width or not 0 <= y < self.height:
                 tries += 1
                 continue
-            if self.game_map.walkable[y][x] and not any(
-                    [entity for entity in entities if entity.position.x == x and entity.position.y == y]):
+            if self.game_map.walkable[y][x] and not self.game_map.entity_index.is_occupied(x, y):
                 # Position is good
                 # print('# Position is good')
                 return (x, y)
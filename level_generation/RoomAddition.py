@@ -1,7 +1,10 @@
 from random import choice, randint, random
 
+import numpy as np
 import tcod as libtcod
 
+from level_generation.RegionLabelling import label_regions, largest_region
+
 
 class RoomAddition:
     """
@@ -216,46 +219,10 @@ class RoomAddition:
 
     def flood_fill(self, room):
         # Find the largest region. Fill in all other regions.
-        room_width, room_height = self.get_room_dimensions(room)
-        largest_region = set()
-
-        for x in range(room_width):
-            for y in range(room_height):
-                if room[x][y] == 0:
-                    new_region = set()
-                    tile = (x, y)
-                    to_be_filled = set([tile])
-                    while to_be_filled:
-                        tile = to_be_filled.pop()
-
-                        if tile not in new_region:
-                            new_region.add(tile)
+        labels, sizes, _ = label_regions(np.array(room) == 0)
+        largest = largest_region(labels, sizes, min_size=self.ROOM_MIN_SIZE)
 
-                            room[tile[0]][tile[1]] = 1
-
-                            # check adjacent cells
-                            x = tile[0]
-                            y = tile[1]
-                            north = (x, y - 1)
-                            south = (x, y + 1)
-                            east = (x + 1, y)
-                            west = (x - 1, y)
-
-                            for direction in [north, south, east, west]:
-
-                                if room[direction[0]][direction[1]] == 0:
-                                    if direction not in to_be_filled and direction not in new_region:
-                                        to_be_filled.add(direction)
-
-                    if len(new_region) >= self.ROOM_MIN_SIZE:
-                        if len(new_region) > len(largest_region):
-                            largest_region.clear()
-                            largest_region.update(new_region)
-
-        for tile in largest_region:
-            room[tile[0]][tile[1]] = 0
-
-        return room
+        return np.where(largest, 0, 1).tolist()
 
     def place_room(self, room, map_width, map_height):  # (self,room,direction,)
         room_x = None
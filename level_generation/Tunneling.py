@@ -1,4 +1,4 @@
-from random import randint
+import random
 
 from level_generation.GenerationUtils import create_floor, create_room, place_entities, place_stairs, generate_object
 from map_objects.Shapes import SquareRoom
@@ -16,11 +16,13 @@ class TunnelingAlgorithm:
     room_max_size = 30
     width = 10
     height = 10
+    rng = random  # random.Random the Level is Generated from, Set by generate_level
 
     def generate_level(self, game_map, dungeon_level, max_rooms, room_min_size, room_max_size, map_width, map_height,
-                       player, entities, particles, particle_systems, item_table, mob_table):
+                       player, entities, particles, particle_systems, item_table, mob_table, rng=random):
 
         self.game_map = game_map
+        self.rng = rng
         self.width = map_width
         self.height = map_height
         self.dungeon_level = dungeon_level
@@ -31,11 +33,11 @@ class TunnelingAlgorithm:
 
         for r in range(max_rooms):
             # Random Width and Height
-            w = randint(self.room_min_size, self.room_max_size)
-            h = randint(self.room_min_size, self.room_max_size)
+            w = self.rng.randint(self.room_min_size, self.room_max_size)
+            h = self.rng.randint(self.room_min_size, self.room_max_size)
             # Random Position without going out of the boundaries of the map
-            x = randint(0, map_width - w - 1)
-            y = randint(0, map_height - h - 1)
+            x = self.rng.randint(0, map_width - w - 1)
+            y = self.rng.randint(0, map_height - h - 1)
 
             # "Rect" class makes rectangles easier to work with
             new_room = SquareRoom(x, y, w, h, len(game_map.rooms) + 1)
@@ -58,10 +60,10 @@ class TunnelingAlgorithm:
                     # Connect Every Room after 1st Room to Previous Room With Tunnel
                     # Create connection between previous room and new room
                     previous_map = rooms[num_rooms - 1]
-                    create_hall(game_map, previous_map, new_room)
+                    create_hall(game_map, previous_map, new_room, rng=self.rng)
 
                 # Determine Monster Placement and Population
-                place_entities(game_map, dungeon_level, new_room, entities, item_table, mob_table)
+                place_entities(game_map, dungeon_level, new_room, entities, item_table, mob_table, rng=self.rng)
 
                 # finally, append the new room to the list
                 rooms.append(new_room)
@@ -84,11 +86,11 @@ def create_v_tunnel(game_map, y1, y2, x):
         create_floor(game_map, x, y)
 
 
-def create_hall(game_map, room1, room2):
+def create_hall(game_map, room1, room2, rng=random):
     x1, y1 = room1.center
     x2, y2 = room2.center
 
-    if randint(0, 1) == 1:
+    if rng.randint(0, 1) == 1:
         create_h_tunnel(game_map, x1, x2, y1)
         create_v_tunnel(game_map, y1, y2, x2)
     else:  # else it starts vertically
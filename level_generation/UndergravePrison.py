@@ -1,6 +1,6 @@
 from copy import deepcopy
 from math import ceil, sqrt
-from random import choice, choices, randint, shuffle
+import random
 
 import numpy as np
 from tcod.bsp import BSP
@@ -19,12 +19,9 @@ from level_generation.Prefab import Prefab
 from map_objects.GameEvent import check_entity_dead, entity_at_position_condition, GameEvent, turn_count_condition
 from map_objects.Shapes import MouseRoom
 
-from RandomUtils import random_choice_from_dict, spawn_chance
+from RandomUtils import random_choice_from_dict, spawn_chance, tcod_random
 
-TILE_SET = obtain_tile_set()
-PREFABS = obtain_prefabs()
-MOBS = obtain_mob_table("undergrave_prison")
-ITEMS = obtain_item_table()
+MOB_TABLE = "undergrave_prison"
 
 
 class UndergravePrison(BinarySpacePartition):
@@ -40,7 +37,8 @@ class UndergravePrison(BinarySpacePartition):
     sub_room_depth = 5  # How much to further split up each room of each cell block
 
     def generate_level(self, game_map, dungeon_level, max_rooms, room_min_size, room_max_size, map_width, map_height,
-                       player, entities, particles, particle_systems, item_table, mob_table):
+                       player, entities, particles, particle_systems, item_table, mob_table, rng=random):
+        self.rng = rng
         self.width = map_width - 1
         self.height = map_height - 1
         # self.width = randint(30, map_width - 1)
@@ -84,10 +82,10 @@ class UndergravePrison(BinarySpacePartition):
 
             elif self.dungeon_level < 10:
                 # Generate Cell Blocks and Their Rooms
-                self.cell_block_min_size = randint(10, 30)
-                self.cell_block_depth = randint(0, 10)
-                self.cell_block_wall_buffer = randint(1, 10)
-                self.sub_room_depth = randint(2, 20)
+                self.cell_block_min_size = self.rng.randint(10, 30)
+                self.cell_block_depth = self.rng.randint(0, 10)
+                self.cell_block_wall_buffer = self.rng.randint(1, 10)
+                self.sub_room_depth = self.rng.randint(2, 20)
 
             print('\n\n{}\nWidth, Height: ({}, {})\ncell_block_depth: {}\ncell_block_size: {}\ncell_block_wall_buffer: {}\nsub_room_depth: {}'.format(
                 game_map.level.title(), self.width, self.height,  self.cell_block_depth, self.cell_block_min_size, self.cell_block_wall_buffer, self.sub_room_depth))
@@ -139,7 +137,8 @@ class UndergravePrison(BinarySpacePartition):
                 min_width=self.cell_block_min_size//2,
                 min_height=self.cell_block_min_size//2,
                 max_horizontal_ratio=1.25,
-                max_vertical_ratio=1.25
+                max_vertical_ratio=1.25,
+                seed=tcod_random(self.rng)
             )
             self.rooms[main_room] = []
 
@@ -201,7 +200,7 @@ class UndergravePrison(BinarySpacePartition):
             mobs = ['undergrave_guard']
             game_event = GameEvent(self.game_map, 'spawn_mob', conditions=conditions, condition_kwargs=condition_kwargs,
                                    position=center(self.end_room),
-                                   mobs=[choice(mobs) for i in range(1)], faction='Imperials',
+                                   mobs=[self.rng.choice(mobs) for i in range(1)], faction='Imperials',
                                    ai_type=PatrolAI, area_of_interest=self.end_room)
             self.game_map.game_events.append(game_event)
 
@@ -211,7 +210,7 @@ class UndergravePrison(BinarySpacePartition):
             mobs = ['undergrave_guard']
             game_event = GameEvent(self.game_map, 'spawn_mob', conditions=conditions, condition_kwargs=condition_kwargs,
                                    position=center(self.end_room),
-                                   mobs=[choice(mobs) for i in range(1)], faction='Imperials',
+                                   mobs=[self.rng.choice(mobs) for i in range(1)], faction='Imperials',
                                    ai_type=PatrolAI, area_of_interest=self.end_room)
             self.game_map.game_events.append(game_event)
 
@@ -219,24 +218,24 @@ class UndergravePrison(BinarySpacePartition):
             # self.end_room = BSP(x=40, y=10, width=9, height=9)
             conditions = [turn_count_condition]
             condition_kwargs = {"turn_count": 75, "game_map": self.game_map}
-            origin_x = randint(self.end_room.x + 2, self.end_room.x + self.end_room.width - 2)
-            origin_y = randint(self.end_room.y + 2, self.end_room.y + self.end_room.height - 2)
+            origin_x = self.rng.randint(self.end_room.x + 2, self.end_room.x + self.end_room.width - 2)
+            origin_y = self.rng.randint(self.end_room.y + 2, self.end_room.y + self.end_room.height - 2)
             game_event = GameEvent(self.game_map, 'spawn_mob', conditions=conditions, condition_kwargs=condition_kwargs,
                                    position=center(self.end_room), mobs=['undergrave_guard'], faction='Imperials',
                                    ai_type=DefensiveAI, area_of_interest=self.end_room, origin_x=origin_x, origin_y=origin_y)
             self.game_map.game_events.append(game_event)
 
             condition_kwargs = {"turn_count": 77, "game_map": self.game_map}
-            origin_x = randint(self.end_room.x + 2, self.end_room.x + self.end_room.width - 2)
-            origin_y = randint(self.end_room.y + 2, self.end_room.y + self.end_room.height - 2)
+            origin_x = self.rng.randint(self.end_room.x + 2, self.end_room.x + self.end_room.width - 2)
+            origin_y = self.rng.randint(self.end_room.y + 2, self.end_room.y + self.end_room.height - 2)
             game_event = GameEvent(self.game_map, 'spawn_mob', conditions=conditions, condition_kwargs=condition_kwargs,
                                    position=center(self.end_room), mobs=['undergrave_guard'], faction='Imperials',
                                    ai_type=DefensiveAI, area_of_interest=self.end_room, origin_x=origin_x, origin_y=origin_y)
             self.game_map.game_events.append(game_event)
 
             condition_kwargs = {"turn_count": 79, "game_map": self.game_map}
-            origin_x = randint(self.end_room.x + 2, self.end_room.x + self.end_room.width - 2)
-            origin_y = randint(self.end_room.y + 2, self.end_room.y + self.end_room.height - 2)
+            origin_x = self.rng.randint(self.end_room.x + 2, self.end_room.x + self.end_room.width - 2)
+            origin_y = self.rng.randint(self.end_room.y + 2, self.end_room.y + self.end_room.height - 2)
             game_event = GameEvent(self.game_map, 'spawn_mob', conditions=conditions, condition_kwargs=condition_kwargs,
                                    position=center(self.end_room), mobs=['undergrave_guard'], faction='Imperials',
                                    ai_type=DefensiveAI, area_of_interest=self.end_room, origin_x=origin_x, origin_y=origin_y)
@@ -312,20 +311,20 @@ class UndergravePrison(BinarySpacePartition):
 
             # Warden Boss
             mob_index = "warden"
-            mob_stats = MOBS.get(mob_index)
+            mob_stats = obtain_mob_table(MOB_TABLE).get(mob_index)
             faction = 'Imperials'
             ai_type = PursueAI
             encounter = Encounter(self.game_map, main_room, len(self.game_map.encounters) + 1)
 
             x, y = self.find_open_spawn_spot(main_room, entities, particles)
-            warden_mob = generate_mob(x, y, mob_stats, mob_index, encounter, faction, ai_type, entities)
+            warden_mob = generate_mob(x, y, mob_stats, mob_index, encounter, faction, ai_type, entities, rng=self.rng)
             entities.append(warden_mob)
 
             # Check Warden is Dead and Player Goes to Iron Gate
             map_object_index = "35"
-            map_object_stats = TILE_SET.get(map_object_index)
+            map_object_stats = obtain_tile_set().get(map_object_index)
             iron_gate_entity = generate_object(25, 34, entities, self.game_map.map_objects, particles, self.game_map,
-                                               map_object_stats, map_object_index)
+                                               map_object_stats, map_object_index, rng=self.rng)
             conditions = [entity_at_position_condition]
             condition_kwargs = {"area_of_interest": (24, 26, 33, 35), "entity": self.game_map.player,
                                 'target_entity': warden_mob}
@@ -347,7 +346,7 @@ class UndergravePrison(BinarySpacePartition):
         for y in range(self.height):
             for x in range(self.width):
                 if self.game_map.tileset_tiles[y][x] == 2:
-                    terrain = randint(1, 100)
+                    terrain = self.rng.randint(1, 100)
                     if terrain == 1:  # puddle
                         self.generate_puddles(x, y)
                     elif terrain == 2:  # vine
@@ -358,8 +357,8 @@ class UndergravePrison(BinarySpacePartition):
         rare_rooms = deepcopy(self.possible_rooms['rare'])
         uncommon_rooms = deepcopy(self.possible_rooms['uncommon'])
 
-        shuffle(rare_rooms)
-        shuffle(uncommon_rooms)
+        self.rng.shuffle(rare_rooms)
+        self.rng.shuffle(uncommon_rooms)
         """
        treasure_room', 'hard_monster_room', 'animal_prisoner_room
        alarm_room', 'small_jail_cell', 'supply_room', 'food_storage_room', 'office_room
@@ -414,9 +413,9 @@ class UndergravePrison(BinarySpacePartition):
 
                     if not too_close:
                         door_index = "5"
-                        door_stats = TILE_SET.get(door_index)
+                        door_stats = obtain_tile_set().get(door_index)
                         generate_object(x1, y1, entities, self.game_map.map_objects, particles, self.game_map, door_stats,
-                                    door_index, item_list=None)
+                                    door_index, item_list=None, rng=self.rng)
 
                 # Seperate Room into sections for small rooms
                 bsp = tcod.bsp.BSP(x=room.x, y=room.y, width=room.width, height=room.height)
@@ -426,7 +425,8 @@ class UndergravePrison(BinarySpacePartition):
                     min_width=9,
                     min_height=9,
                     max_horizontal_ratio=1.5,
-                    max_vertical_ratio=1.5
+                    max_vertical_ratio=1.5,
+                    seed=tcod_random(self.rng)
                 )
 
                 # Count All Nodes that Are an Actual Room
@@ -518,14 +518,14 @@ class UndergravePrison(BinarySpacePartition):
                     # Ensure Jail Doesn't Fully Block Way to Other side of Room
                     if south_buffer == -buffer_increment and north_buffer == buffer_increment and \
                             east_buffer == 0 and west_buffer == 0:
-                        a = randint(0, 1)
+                        a = self.rng.randint(0, 1)
                         if a == 1:
                             east_buffer -= buffer_increment
                         else:
                             west_buffer += buffer_increment
                     elif east_buffer == -buffer_increment and west_buffer == buffer_increment and \
                             south_buffer == 0 and north_buffer == 0:
-                        a = randint(0, 1)
+                        a = self.rng.randint(0, 1)
                         if a == 1:
                             north_buffer += buffer_increment
                         else:
@@ -544,15 +544,15 @@ class UndergravePrison(BinarySpacePartition):
 
                             room_type_population = ['jail', 'storage', "uncommon"]
                             room_weights = [60, 15, 25]
-                            room_type = choices(population=room_type_population, weights=room_weights, k=1)[0]
+                            room_type = self.rng.choices(population=room_type_population, weights=room_weights, k=1)[0]
 
                             if room_type == "uncommon":
-                                room_type = choice(uncommon_rooms)
+                                room_type = self.rng.choice(uncommon_rooms)
 
                         else:
                             room_type_population = ['jail', 'storage']
                             room_weights = [75, 25]
-                            room_type = choices(population=room_type_population, weights=room_weights, k=1)[0]
+                            room_type = self.rng.choices(population=room_type_population, weights=room_weights, k=1)[0]
 
 
                     # elif modified_height < 6 or modified_width < 6:
@@ -608,7 +608,7 @@ class UndergravePrison(BinarySpacePartition):
         # Place Tables on All Sides of Room
         # print('\n# Place Tables on All Sides of Room')
         table_index = '27'
-        table_stats = TILE_SET.get(table_index)
+        table_stats = obtain_tile_set().get(table_index)
 
         crate_index = '18'
 
@@ -616,10 +616,10 @@ class UndergravePrison(BinarySpacePartition):
         barrel_index = '19'
 
         stove_index = '32'
-        stove_stats = TILE_SET.get(stove_index)
+        stove_stats = obtain_tile_set().get(stove_index)
 
         sink_index = '33'
-        sink_stats = TILE_SET.get(sink_index)
+        sink_stats = obtain_tile_set().get(sink_index)
 
         required_map_objects = [stove_index, sink_index]
 
@@ -639,42 +639,43 @@ class UndergravePrison(BinarySpacePartition):
 
                         if required_map_objects:
                             map_object_index = required_map_objects.pop()
-                            map_object_stats = TILE_SET.get(map_object_index)
+                            map_object_stats = obtain_tile_set().get(map_object_index)
                             generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map,
-                                            map_object_stats, map_object_index)
+                                            map_object_stats, map_object_index, rng=self.rng)
 
-                        if randint(1, 25) == 1:
+                        if self.rng.randint(1, 25) == 1:
                             # Stove Map Object and It's Stove Fire Particle
                             generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map,
-                                            stove_stats, stove_index)
-                        elif randint(1, 25) == 1:
+                                            stove_stats, stove_index, rng=self.rng)
+                        elif self.rng.randint(1, 25) == 1:
                             # Sink Map Object
                             generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map,
-                                            sink_stats, sink_index)
+                                            sink_stats, sink_index, rng=self.rng)
                         else:
                             food_entities = []
-                            if randint(1, 5) != 1:
-                                if randint(1, 50) <= 5:
-                                    food_entities = [create_item_entity(choice(['meat', 'bread']), x, y)]
+                            if self.rng.randint(1, 5) != 1:
+                                if self.rng.randint(1, 50) <= 5:
+                                    food_entities = [create_item_entity(self.rng.choice(['meat', 'bread']), x, y)]
 
                                 generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map,
-                                                table_stats, table_index, item_list=food_entities, no_inventory=True)
+                                                table_stats, table_index, item_list=food_entities, no_inventory=True, rng=self.rng)
                             else:
 
                                 # Generate Crate/Barrel
-                                index = choice([barrel_index, crate_index])
-                                stats = TILE_SET.get(index)
+                                index = self.rng.choice([barrel_index, crate_index])
+                                stats = obtain_tile_set().get(index)
                                 generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map,
-                                                stats, index, item_list=food_entities, no_inventory=True)
+                                                stats, index, item_list=food_entities, no_inventory=True, rng=self.rng)
 
-        prefab_list = [PREFABS.get("open_chest"), PREFABS.get("closed_chest")]
-        table_direction = choice(['vertical', 'horizontal'])
+        prefabs = obtain_prefabs()
+        prefab_list = [prefabs.get("open_chest"), prefabs.get("closed_chest")]
+        table_direction = self.rng.choice(['vertical', 'horizontal'])
         if table_direction == 'horizontal':
-            prefab_list.extend([PREFABS.get('long_horizontal_table'), PREFABS.get('medium_horizontal_table'),
-                                PREFABS.get('short_horizontal_table')])
+            prefab_list.extend([prefabs.get('long_horizontal_table'), prefabs.get('medium_horizontal_table'),
+                                prefabs.get('short_horizontal_table')])
         else:
-            prefab_list.extend([PREFABS.get('long_vertical_table'), PREFABS.get('medium_vertical_table'),
-                                PREFABS.get('short_vertical_table')])
+            prefab_list.extend([prefabs.get('long_vertical_table'), prefabs.get('medium_vertical_table'),
+                                prefabs.get('short_vertical_table')])
 
         # Table Inbetween
         for x in range(node.x + 3, node.x + node.width - 2):
@@ -685,32 +686,32 @@ class UndergravePrison(BinarySpacePartition):
                     if table_direction == 'horizontal':
                         if (node.x + 3) % 2 != 0 and y % 2 != 0:
                             p = Prefab()
-                            p.load_template(choice(prefab_list))
+                            p.load_template(self.rng.choice(prefab_list))
                             p.x, p.y = x, y
                             if p.x + p.width < node.x + node.width - 2:
-                                place_prefab(self.game_map, p, entities, particles, self.dungeon_level)
+                                place_prefab(self.game_map, p, entities, particles, self.dungeon_level, rng=self.rng)
 
                         elif (node.x + 3) % 2 == 0 and y % 2 == 0:
                             p = Prefab()
-                            p.load_template(choice(prefab_list))
+                            p.load_template(self.rng.choice(prefab_list))
                             p.x, p.y = x, y
                             if p.x + p.width < node.x + node.width - 2:
-                                place_prefab(self.game_map, p, entities, particles, self.dungeon_level)
+                                place_prefab(self.game_map, p, entities, particles, self.dungeon_level, rng=self.rng)
                     else:
                         if (node.y + 3) % 2 != 0 and x % 2 != 0:
                             p = Prefab()
-                            p.load_template(choice(prefab_list))
+                            p.load_template(self.rng.choice(prefab_list))
                             p.x, p.y = x, y
                             if p.y + p.height < node.y + node.height - 2:
-                                place_prefab(self.game_map, p, entities, particles, self.dungeon_level)
+                                place_prefab(self.game_map, p, entities, particles, self.dungeon_level, rng=self.rng)
 
                         elif (node.y + 3) % 2 == 0 and x % 2 == 0:
                             p = Prefab()
-                            p.load_template(choice(prefab_list))
+                            p.load_template(self.rng.choice(prefab_list))
                             p.x, p.y = x, y
 
                             if p.y + p.height < node.y + node.height - 2:
-                                place_prefab(self.game_map, p, entities, particles, self.dungeon_level)
+                                place_prefab(self.game_map, p, entities, particles, self.dungeon_level, rng=self.rng)
 
     def generate_jail_cell(self, node, room, entrances, north_buffer, south_buffer, east_buffer, west_buffer, entities,
                            particles):
@@ -743,44 +744,45 @@ class UndergravePrison(BinarySpacePartition):
         self.jail_cells.append(j)
 
         # Place Prefabs for Jail Cell
-        number_of_beds = [PREFABS.get('prison_bed') for i in range(ceil(j.size / 20))]
-        chest = choices(population=[PREFABS.get("open_chest"), PREFABS.get("closed_chest")], weights=[90, 10], k=1)[0]
-        prefab_list = [PREFABS.get('toilet'),  chest]
+        prefabs = obtain_prefabs()
+        number_of_beds = [prefabs.get('prison_bed') for i in range(ceil(j.size / 20))]
+        chest = self.rng.choices(population=[prefabs.get("open_chest"), prefabs.get("closed_chest")], weights=[90, 10], k=1)[0]
+        prefab_list = [prefabs.get('toilet'),  chest]
         prefab_list.extend(number_of_beds)
         # print('number_of_beds:', number_of_beds)
-        shuffle(prefab_list)
+        self.rng.shuffle(prefab_list)
         for prefab in prefab_list:
             p = Prefab()
             p.load_template(prefab)
             tries = 0
             max_tries = 20
             while tries < max_tries:
-                random_x = randint(j.x + 1, j.x + j.width - p.width)
-                random_y = randint(j.y + 1, j.y + j.height - p.height)
+                random_x = self.rng.randint(j.x + 1, j.x + j.width - p.width)
+                random_y = self.rng.randint(j.y + 1, j.y + j.height - p.height)
 
                 if self.grid[random_x][random_y] == 0 and self.game_map.tileset_tiles[random_y][random_x] == 2:
                     p.x, p.y = random_x, random_y
-                    place_prefab(self.game_map, p, entities, particles, self.dungeon_level)
+                    place_prefab(self.game_map, p, entities, particles, self.dungeon_level, rng=self.rng)
                     tries = max_tries
                 tries += 1
 
         # Place Jail Cell Entrance;
         jail_gate_index = "15"
-        jail_gate_stats = TILE_SET.get(jail_gate_index)
+        jail_gate_stats = obtain_tile_set().get(jail_gate_index)
         _entrances = []
         if north_buffer != 0:
             x = j.x + j.width // 2
             y = j.y
             place_tile(self.game_map, x, y, '2')
             entrance_entity = generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map, jail_gate_stats,
-                            jail_gate_index, item_list=None)
+                            jail_gate_index, item_list=None, rng=self.rng)
             _entrances.append(entrance_entity)
         if west_buffer != 0:
             x = j.x
             y = j.y + j.height // 2
             place_tile(self.game_map, x, y, '2')
             entrance_entity = generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map,
-                                              jail_gate_stats, jail_gate_index, item_list=None)
+                                              jail_gate_stats, jail_gate_index, item_list=None, rng=self.rng)
             _entrances.append(entrance_entity)
 
         if south_buffer != 0:
@@ -788,31 +790,31 @@ class UndergravePrison(BinarySpacePartition):
             y = j.y + j.height
             place_tile(self.game_map, x, y, '2')
             entrance_entity = generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map,
-                                              jail_gate_stats, jail_gate_index, item_list=None)
+                                              jail_gate_stats, jail_gate_index, item_list=None, rng=self.rng)
             _entrances.append(entrance_entity)
         if east_buffer != 0:
             x = j.x + j.width
             y = j.y + j.height // 2
             place_tile(self.game_map, x, y, '2')
             entrance_entity = generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map,
-                                              jail_gate_stats, jail_gate_index, item_list=None)
+                                              jail_gate_stats, jail_gate_index, item_list=None, rng=self.rng)
             _entrances.append(entrance_entity)
 
         j.entrances = _entrances
 
     def generate_alarm_room(self, node, entrances, north_buffer, south_buffer, east_buffer, west_buffer, entities, particles):
         p = Prefab()
-        prefab = PREFABS.get("alarm_room")
+        prefab = obtain_prefabs().get("alarm_room")
         center_x, center_y = center(node)
         p.load_template(prefab, x=center_x-1, y=center_y-1)
-        place_prefab(self.game_map, p, entities, particles, self.dungeon_level)
+        place_prefab(self.game_map, p, entities, particles, self.dungeon_level, rng=self.rng)
 
     def generate_guard_dormitory(self, node, entrances, north_buffer, south_buffer, east_buffer, west_buffer, entities, particles):
 
         prefab_list = []
         for prefab_json_index in ["guard_bed", "short_vertical_table"]:
             p = Prefab()
-            prefab = PREFABS.get(prefab_json_index)
+            prefab = obtain_prefabs().get(prefab_json_index)
             p.load_template(prefab)
             prefab_list.append(p)
         prefab_list_weights = [90, 10]
@@ -822,25 +824,25 @@ class UndergravePrison(BinarySpacePartition):
                 if x % 2 == 0 and y % 4 == 0 and p.height + y <= node.y + node.height:
 
                     p.x, p.y = x, y
-                    p = choices(population=prefab_list, weights=prefab_list_weights, k=1)[0]
+                    p = self.rng.choices(population=prefab_list, weights=prefab_list_weights, k=1)[0]
                     item_on_top = False
                     if p == prefab_list[1]:
                         item_on_top = True
-                    place_prefab(self.game_map, p, entities, particles, self.dungeon_level, item_on_top)
+                    place_prefab(self.game_map, p, entities, particles, self.dungeon_level, item_on_top, rng=self.rng)
 
                 if x % 2 == 1 and y % 4 == 0:
-                    if randint(0, 100) < 5:
+                    if self.rng.randint(0, 100) < 5:
                         chest_index = "10"
-                        chest_stats = TILE_SET.get(chest_index)
+                        chest_stats = obtain_tile_set().get(chest_index)
                         generate_object(x, y, entities, self.game_map.map_objects, particles,  self.game_map, chest_stats,
-                                        chest_index, item_list=None, no_inventory=False)
+                                        chest_index, item_list=None, no_inventory=False, rng=self.rng)
 
     def generate_armory_room(self, node, entrances, north_buffer, south_buffer, east_buffer, west_buffer, entities, particles):
         weapons = []
         armor = []
         item_frequency = 15
 
-        for equipment, equip_dict in ITEMS.items():
+        for equipment, equip_dict in obtain_item_table().items():
 
             if equip_dict['item_level'] <= self.dungeon_level:
                 slot = equip_dict.get('slot')
@@ -849,19 +851,19 @@ class UndergravePrison(BinarySpacePartition):
                 elif slot:
                     armor.append(equipment)
 
-        armory_items = choice([weapons, armor])
+        armory_items = self.rng.choice([weapons, armor])
         room_size = node.width * node.height
 
         # Layup Type
-        dice_roll = randint(1, 2)
+        dice_roll = self.rng.randint(1, 2)
         # if dice_roll == 1:
 
         # Randomly Place Items
         number_of_items = ceil(room_size // item_frequency)
         for i in range(number_of_items):
-            item_index = choice(armory_items)
-            x = randint(node.x + 1, node.x + node.width - 1)
-            y = randint(node.y + 1, node.y + node.height - 1)
+            item_index = self.rng.choice(armory_items)
+            x = self.rng.randint(node.x + 1, node.x + node.width - 1)
+            y = self.rng.randint(node.y + 1, node.y + node.height - 1)
             entities.append(create_item_entity(item_index, x, y))
 
     def generate_storage_room(self, node, entrances, north_buffer, south_buffer, east_buffer, west_buffer, entities, particles):
@@ -888,34 +890,34 @@ class UndergravePrison(BinarySpacePartition):
                     if y <= node.y + self.height // 2 and south_buffer > 1:
                         chance += 40
 
-                    dice_roll = randint(0, 100)
+                    dice_roll = self.rng.randint(0, 100)
                     if dice_roll < chance:
                         item_entities = None
                         no_inventory = True
-                        if randint(1, 6) < 2:
+                        if self.rng.randint(1, 6) < 2:
                             item_list = ['meat', 'bread', 'healing_potion', 'fireball_scroll', 'confusion_scroll',
                                          'lightning_scroll', 'teleport_crystal', 'blind_powder', 'poison_vial']
-                            item_entities = [create_item_entity(choice(item_list))]
+                            item_entities = [create_item_entity(self.rng.choice(item_list))]
                             no_inventory = False
 
-                        crate_barrel_index = choice(crate_barrel_chance)
-                        crate_barrel_stats = TILE_SET.get(crate_barrel_index)
+                        crate_barrel_index = self.rng.choice(crate_barrel_chance)
+                        crate_barrel_stats = obtain_tile_set().get(crate_barrel_index)
                         # place_tile(self.game_map, x, y, choice(crate_barrel_chance))
                         # x, y, entities, map_objects, game_map, object_stats, object_index, item_list=None
                         generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map, crate_barrel_stats,
-                                        crate_barrel_index, item_list=item_entities, no_inventory=no_inventory)
+                                        crate_barrel_index, item_list=item_entities, no_inventory=no_inventory, rng=self.rng)
 
                     else:
-                        dice_roll = randint(0, 100)
+                        dice_roll = self.rng.randint(0, 100)
                         if dice_roll < 5:
                             chest_index = "10"
-                            chest_stats = TILE_SET.get(chest_index)
+                            chest_stats = obtain_tile_set().get(chest_index)
                             generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map, chest_stats,
-                                            chest_index, item_list=None, no_inventory=False)
+                                            chest_index, item_list=None, no_inventory=False, rng=self.rng)
 
     def generate_puddles(self, x, y):
         # Place Different Sized Puddles throughout Map
-        size = randint(1, 2)
+        size = self.rng.randint(1, 2)
         place_tile(self.game_map, x, y, "17")
         if size == 2:
             # Iterate through different directions
@@ -941,19 +943,18 @@ class UndergravePrison(BinarySpacePartition):
             number_of_mobs = ceil(jail.size / 29)
 
             for i in range(number_of_mobs):
-                prisoner_index = choices(population=prisoner_pop, weights=prisoner_weights, k=1)[0]
-                prisoner_dict = MOBS.get(prisoner_index)
+                prisoner_index = self.rng.choices(population=prisoner_pop, weights=prisoner_weights, k=1)[0]
+                prisoner_dict = obtain_mob_table(MOB_TABLE).get(prisoner_index)
                 tries = 0
 
                 # Attempt to Find an Empty Space to Place Mob
                 x, y = None, None
                 while tries < max_tries:
                     tries += 1
-                    x = randint(jail.x + 1, jail.x + jail.width - 1)
-                    y = randint(jail.y + 1, jail.y + jail.height - 1)
+                    x = self.rng.randint(jail.x + 1, jail.x + jail.width - 1)
+                    y = self.rng.randint(jail.y + 1, jail.y + jail.height - 1)
 
-                    if self.game_map.walkable[y][x] and not \
-                            any([entity for entity in entities if entity.position.x == x and entity.position.y == y]):
+                    if self.game_map.walkable[y][x] and not self.game_map.entity_index.is_occupied(x, y):
                         # Position is good
                         break
                     x, y = None, None
@@ -969,7 +970,7 @@ class UndergravePrison(BinarySpacePartition):
                                                ]
                                               )
                 mob = generate_mob(x, y, prisoner_dict, prisoner_index, encounter, faction, ai_type, entities,
-                                   dialogue_component)
+                                   dialogue_component, rng=self.rng)
 
                 # "block" new position
                 self.game_map.tile_cost[y][x] = 99
@@ -989,7 +990,7 @@ class UndergravePrison(BinarySpacePartition):
         faction = "Imperials"
         undergrave_mobs_table = {
             mob: spawn_chance([stats for stats in mob_stats.get('spawn_chance')], self.dungeon_level)
-            for mob, mob_stats in MOBS.items()}
+            for mob, mob_stats in obtain_mob_table(MOB_TABLE).items()}
 
         if not _rooms:
             _rooms = [cell_block for cell_block in self.rooms.keys()]
@@ -1001,7 +1002,7 @@ class UndergravePrison(BinarySpacePartition):
             ai_type = DefensiveAI
             # spawn_check = 2
             # spawn_check = 1
-            spawn_check = randint(1, 2)
+            spawn_check = self.rng.randint(1, 2)
 
             if spawn_check == 2:
                 encounter = Encounter(self.game_map, room, len(self.game_map.encounters) + 1)
@@ -1021,9 +1022,9 @@ class UndergravePrison(BinarySpacePartition):
                         continue
 
                     # Spawn an Entity
-                    mob_index = random_choice_from_dict(undergrave_mobs_table)
-                    mob_stats = MOBS[mob_index]
-                    mob = generate_mob(x, y, mob_stats, mob_index, encounter, faction, ai_type, entities)
+                    mob_index = random_choice_from_dict(undergrave_mobs_table, self.rng)
+                    mob_stats = obtain_mob_table(MOB_TABLE)[mob_index]
+                    mob = generate_mob(x, y, mob_stats, mob_index, encounter, faction, ai_type, entities, rng=self.rng)
 
                     # "block" new mob position
                     self.game_map.tile_cost[y][x] = 99
@@ -1068,8 +1069,8 @@ class UndergravePrison(BinarySpacePartition):
         x, y = None, None
         while tries < max_tries:
             tries += 1
-            x = randint(room.x + 1, room.x + room.width - 1)
-            y = randint(room.y + 1, room.y + room.height - 1)
+            x = self.rng.randint(room.x + 1, room.x + room.width - 1)
+            y = self.rng.randint(room.y + 1, room.y + room.height - 1)
 
             rooms_to_avoid = []
             for j in self.jail_cells:
@@ -1080,7 +1081,7 @@ class UndergravePrison(BinarySpacePartition):
             if rooms_to_avoid:
                 for _room in rooms_to_avoid:
                     # print('_room:', _room)
-                    if _room.contains(x, y) or not self.game_map.walkable[y][x] or any([entity for entity in entities if entity.position.x == x and entity.position.y == y]):
+                    if _room.contains(x, y) or not self.game_map.walkable[y][x] or self.game_map.entity_index.is_occupied(x, y):
                         # Position is good
                         x, y = None, None
                         break
@@ -1088,8 +1089,7 @@ class UndergravePrison(BinarySpacePartition):
                     break
             else:
 
-                if self.game_map.walkable[y][x] and not any(
-                        [entity for entity in entities if entity.position.x == x and entity.position.y == y]):
+                if self.game_map.walkable[y][x] and not self.game_map.entity_index.is_occupied(x, y):
                     # Position is good
                     break
                 x, y = None, None
@@ -1101,12 +1101,12 @@ class UndergravePrison(BinarySpacePartition):
 
     def generate_vines(self, x, y):
         # Create a localized Layout of SizexSize and Use Astar to make a path for vines
-        size = randint(2, 5)
+        size = self.rng.randint(2, 5)
 
-        localized_layout = np.array([[1 for y in range(y-size, y+size)] for x in range(x-size, x+size)] if 0 <= x < self.width and 0 <= y < self.height else 999)
+        localized_layout = np.array([[1 for y in range(y-size, y+size)] for x in range(x-size, x+size)] if 0 <= x < self.width and 0 <= y < self.height else 999, dtype=np.int32)
 
         astar = tcod.path.AStar(localized_layout, diagonal=1)
-        goal_x, goal_y = (randint(x - size, x + size-1) + size, randint(y-size, y + size - 1) + size)
+        goal_x, goal_y = (self.rng.randint(x - size, x + size-1) + size, self.rng.randint(y-size, y + size - 1) + size)
         final_path = astar.get_path(size, size, goal_x - x, goal_y - y)
 
         for i, j in final_path:
@@ -1118,8 +1118,8 @@ class UndergravePrison(BinarySpacePartition):
 
     def random_place_player_stairs(self, entities, particles):
         # Sort Rooms by center_x, center_y or both
-        sorting_algorithm = randint(1, 4)
-        reverse_order = choice([False, True])
+        sorting_algorithm = self.rng.randint(1, 4)
+        reverse_order = self.rng.choice([False, True])
 
         rooms = [room for rooms in self.rooms.values() for room in rooms]
         if sorting_algorithm == 1:
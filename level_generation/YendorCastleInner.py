@@ -1,5 +1,5 @@
 from copy import deepcopy
-from random import choice, choices, randint, shuffle
+import random
 from math import sqrt
 
 import numpy as np
@@ -26,7 +26,8 @@ class YendorCastleInner(MazeWithRooms):
     end_room = None
 
     def generate_level(self, game_map, dungeon_level, max_rooms, room_min_size, room_max_size, map_width, map_height,
-                       player, entities, particles, particle_systems, item_table, mob_table):
+                       player, entities, particles, particle_systems, item_table, mob_table, rng=random):
+        self.rng = rng
         self.game_map = game_map
         self.dungeon_level = dungeon_level
 
@@ -60,7 +61,7 @@ class YendorCastleInner(MazeWithRooms):
             # Place Entities in each of the Sub rooms generated in Main Room
             for room in self.rooms:
             # for room in self.sub_rooms:
-                place_entities(self.game_map, self.dungeon_level, room, entities, item_table, mob_table)
+                place_entities(self.game_map, self.dungeon_level, room, entities, item_table, mob_table, rng=self.rng)
 
         game_map.rooms = self.rooms
         # game_map.sub_rooms = self.sub_rooms
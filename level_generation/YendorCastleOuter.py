@@ -1,5 +1,5 @@
 from copy import deepcopy
-from random import choice, choices, randint, shuffle
+import random
 from math import sqrt
 
 import numpy as np
@@ -13,11 +13,9 @@ from level_generation.GenerationUtils import generate_mobs, generate_object, pla
 from level_generation.Prefab import Prefab
 from loader_functions.JsonReader import obtain_tile_set, obtain_prefabs, obtain_mob_table
 from map_objects.GameEvent import GameEvent, tile_index_at_position_condition
-from RandomUtils import spawn_chance
+from RandomUtils import spawn_chance, tcod_random
 
-TILESET = obtain_tile_set()
-MOBS = obtain_mob_table("yendor_1_mobs")
-PREFABS = obtain_prefabs()
+MOB_TABLE = "yendor_1_mobs"
 
 
 class YendorCastleOuter(BinarySpacePartition):
@@ -28,7 +26,8 @@ class YendorCastleOuter(BinarySpacePartition):
     end_room = None
 
     def generate_level(self, game_map, dungeon_level, max_rooms, room_min_size, room_max_size, map_width, map_height,
-                       player, entities, particles, particle_systems, item_table, mob_table):
+                       player, entities, particles, particle_systems, item_table, mob_table, rng=random):
+        self.rng = rng
         self.game_map = game_map
         self.dungeon_level = dungeon_level
 
@@ -59,7 +58,8 @@ class YendorCastleOuter(BinarySpacePartition):
                 min_width=self.cell_block_min_size // 2,
                 min_height=self.cell_block_min_size // 2,
                 max_horizontal_ratio=1.25,
-                max_vertical_ratio=1.25
+                max_vertical_ratio=1.25,
+                seed=tcod_random(self.rng)
             )
             self.rooms[main_room] = []
 
@@ -102,7 +102,7 @@ class YendorCastleOuter(BinarySpacePartition):
 
             # Place Entities in each of the Sub rooms generated in Main Room
             for room in self.sub_rooms:
-                place_entities(self.game_map, self.dungeon_level, room, entities, item_table, mob_table)
+                place_entities(self.game_map, self.dungeon_level, room, entities, item_table, mob_table, rng=self.rng)
 
         game_map.rooms = self.rooms
         game_map.sub_rooms = self.sub_rooms
@@ -121,7 +121,7 @@ class YendorCastleOuter(BinarySpacePartition):
         for y in range(self.height):
             for x in range(self.width):
                 if self.game_map.tileset_tiles[y][x] == 2:
-                    terrain = randint(1, 100)
+                    terrain = self.rng.randint(1, 100)
                     if terrain == 1:  # puddle
                         self.generate_puddles(x, y)
                     elif terrain == 2:  # vine
@@ -130,7 +130,7 @@ class YendorCastleOuter(BinarySpacePartition):
 
     def generate_puddles(self, x, y):
         # Place Different Sized Puddles throughout Map
-        size = randint(1, 2)
+        size = self.rng.randint(1, 2)
         place_tile(self.game_map, x, y, "17")
         if size == 2:
             # Iterate through different directions
@@ -141,12 +141,12 @@ class YendorCastleOuter(BinarySpacePartition):
 
     def generate_vines(self, x, y):
         # Create a localized Layout of SizexSize and Use Astar to make a path for vines
-        size = randint(2, 5)
+        size = self.rng.randint(2, 5)
 
-        localized_layout = np.array([[1 for y in range(y-size, y+size)] for x in range(x-size, x+size)] if 0 <= x < self.width and 0 <= y < self.height else 999)
+        localized_layout = np.array([[1 for y in range(y-size, y+size)] for x in range(x-size, x+size)] if 0 <= x < self.width and 0 <= y < self.height else 999, dtype=np.int32)
 
         astar = tcod.path.AStar(localized_layout, diagonal=1)
-        goal_x, goal_y = (randint(x - size, x + size-1) + size, randint(y-size, y + size - 1) + size)
+        goal_x, goal_y = (self.rng.randint(x - size, x + size-1) + size, self.rng.randint(y-size, y + size - 1) + size)
         final_path = astar.get_path(size, size, goal_x - x, goal_y - y)
 
         for i, j in final_path:
@@ -158,7 +158,7 @@ class YendorCastleOuter(BinarySpacePartition):
 
     def create_lever_event(self, entities, particles):
         lever_index = "54"
-        lever_stats = TILESET.get(lever_index)
+        lever_stats = obtain_tile_set().get(lever_index)
         lever_entities = []
         r = None
         d = 0
@@ -177,7 +177,7 @@ class YendorCastleOuter(BinarySpacePartition):
 
         if x and y:
             lever_entities.append(generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map, lever_stats,
-                            lever_index, item_list=None, no_inventory=True))
+                            lever_index, item_list=None, no_inventory=True, rng=self.rng))
 
             ref_coords.append((x, y))
         # Find 2nd Farthest Room
@@ -197,13 +197,13 @@ class YendorCastleOuter(BinarySpacePartition):
         x, y = self.obtain_point_within(r)
         if x and y:
             lever_entities.append(generate_object(x, y, entities, self.game_map.map_objects, particles, self.game_map, lever_stats,
-                            lever_index, item_list=None, no_inventory=True))
+                            lever_index, item_list=None, no_inventory=True, rng=self.rng))
 
 
 
         # Game Event for Levers
         map_object_index = "35"
-        map_object_stats = TILESET.get(map_object_index)
+        map_object_stats = obtain_tile_set().get(map_object_index)
         iron_gate_entities = []
         for x in range(self.width // 2, self.height // 2 + 11):  # end Room to main
             # =map_height-6-7
@@ -211,7 +211,7 @@ class YendorCastleOuter(BinarySpacePartition):
             # place_tile(self.game_map, x, self.end_room.y + self.end_room.height + 1, "51")
             iron_gate_entity = generate_object(x, self.end_room.y + self.end_room.height + 1, entities,
                                                self.game_map.map_objects, particles, self.game_map, map_object_stats,
-                                               map_object_index)
+                                               map_object_index, rng=self.rng)
             iron_gate_entities.append(iron_gate_entity)
         conditions = [tile_index_at_position_condition]
         condition_kwargs = {"tile_index": 53, "lever_entities": lever_entities}
@@ -223,8 +223,8 @@ class YendorCastleOuter(BinarySpacePartition):
         max_num_of_tries = 2 * room.width * room.height
         try_count = 0
         while try_count < max_num_of_tries:
-            x = randint(room.x + padding, room.x + room.width - padding - 1)
-            y = randint(room.y + padding, room.y + room.height - padding - 1)
+            x = self.rng.randint(room.x + padding, room.x + room.width - padding - 1)
+            y = self.rng.randint(room.y + padding, room.y + room.height - padding - 1)
             print(x, y)
             # Check if Spot is Open
             if self.game_map.walkable[y][x]:
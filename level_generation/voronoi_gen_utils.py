@@ -1,12 +1,8 @@
 import random
 
-import matplotlib.pyplot as plt
 import numpy as np
 
 
-from scipy.spatial import Voronoi
-
-
 def random_color(as_str=True, alpha=0.5):
     rgb = [random.randint(0,255),
            random.randint(0,255),
@@ -19,6 +15,8 @@ def random_color(as_str=True, alpha=0.5):
 
 
 def test_random_color(gridsize=(5,100), figsize=(12,8)):
+    import matplotlib.pyplot as plt
+
     fig, axarr = plt.subplots(*gridsize, figsize=figsize)
     for i, ax in enumerate(axarr.flatten()):
         # Remove ticks
@@ -64,7 +62,7 @@ def voronoi_finite_polygons_2d(vor, radius=None):
 
     center = vor.points.mean(axis=0)
     if radius is None:
-        radius = vor.points.ptp().max()*2
+        radius = np.ptp(vor.points).max()*2
 
     # Construct a map containing all ridges for a given point
     all_ridges = {}
@@ -119,6 +117,9 @@ def voronoi_finite_polygons_2d(vor, radius=None):
 
 
 if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+    from scipy.spatial import Voronoi
+
     # make up data points
     np.random.seed(1234)
     points = np.random.rand(15, 2)
@@ -151,4 +152,4 @@ if __name__ == '__main__':
     plt.savefig('voro.png')
     plt.show()
 
-    test_random_color()
\ No newline at end of file
+    test_random_color()
\ No newline at end of file
@@ -0,0 +1,79 @@
+import copy
+import json
+import os
+import threading
+
+# Resolved from the Package, not the Working Directory, so the Game Runs from Anywhere on Any OS
+ASSET_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+
+
+def asset_path(file_name):
+    # Accepts 'name.png' or 'sub/name.png' (either separator), Returns an OS Native Absolute Path
+    return os.path.join(ASSET_DIRECTORY, *file_name.replace('\\', '/').split('/'))
+
+
+class AssetRegistry:
+    """
+    Central cache of the json data files in assets/.
+
+    Each file is parsed once and every caller gets the same object, so tables are shared: treat them as read-only and
+    use copy() when a private, mutable table is needed. With hot_reload every lookup compares the file's mtime against
+    the cached one (a single stat) and re-parses the file when it changed. Tables are fetched where they are used and
+    TILES recompiles in GameMap.make_map, so content edits show up on the next floor without restarting the game.
+    """
+
+    def __init__(self, directory=ASSET_DIRECTORY, hot_reload=True):
+        self.directory = directory
+        self.hot_reload = hot_reload
+        self.cache = {}  # name: (mtime_ns, data)
+        self.lock = threading.Lock()  # Levels may be Generated off the Main Thread
+        self.loads = 0
+        self.hits = 0
+
+    def path(self, name):
+        return os.path.join(self.directory, '%s.json' % name)
+
+    def get(self, name):
+        cached = self.cache.get(name)
+        if cached and not self.hot_reload:
+            self.hits += 1
+            return cached[1]
+
+        path = self.path(name)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            print('Cannot locate %s!!!' % path)
+            raise FileNotFoundError(path)
+
+        if cached and cached[0] == mtime:
+            self.hits += 1
+            return cached[1]
+
+        with self.lock:
+            with open(path, 'r', encoding='utf8') as read_file:
+                data = json.load(read_file)
+            self.cache[name] = (mtime, data)
+            self.loads += 1
+        return data
+
+    def copy(self, name):
+        return copy.deepcopy(self.get(name))
+
+    def fingerprint(self):
+        # mtime of Every json File in the Directory, Changes whenever an Asset is Edited (a Directory Scan, no Parsing)
+        return tuple(sorted((entry.name, entry.stat().st_mtime_ns) for entry in os.scandir(self.directory)
+                            if entry.name.endswith('.json')))
+
+    def invalidate(self, name=None):
+        if name is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(name, None)
+
+    def __repr__(self):
+        return "AssetRegistry {} cached={} loads={} hits={}".format(self.directory, sorted(self.cache), self.loads,
+                                                                   self.hits)
+
+
+ASSETS = AssetRegistry()
@@ -0,0 +1,81 @@
+import threading
+import time
+
+from loader_functions.SaveFormat import write_snapshot
+
+
+class AutoSaver:
+    """
+    Writes SaveSnapshots to disk on a worker thread so saving never stalls the main loop.
+
+    The main thread only pays for the snapshot (record encoding and array copies). Serializing, compressing, fsyncing
+    and the atomic rename all happen on the worker. Only the newest pending snapshot is kept: if the worker is still
+    busy when another autosave is requested, the older pending snapshot is dropped, so saves never queue up behind a
+    slow disk.
+
+    on_save(header) is called on the worker after each successful write (e.g. to update the save index).
+    """
+
+    def __init__(self, path, compress=True, on_save=None):
+        self.path = path
+        self.compress = compress
+        self.on_save = on_save
+        self.condition = threading.Condition()
+        self.pending = None  # Newest Snapshot not yet Written
+        self.writing = False
+        self.thread = None
+
+        # Statistics
+        self.saves = 0
+        self.dropped = 0
+        self.last_duration = 0.0  # Seconds Spent on the Worker for the Last Save
+        self.last_error = None
+
+    @property
+    def busy(self):
+        with self.condition:
+            return self.pending is not None or self.writing
+
+    def request(self, snapshot):
+        with self.condition:
+            if self.pending is not None:
+                self.dropped += 1
+            self.pending = snapshot
+            self.condition.notify_all()
+
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self.run, name='AutoSaver', daemon=True)
+            self.thread.start()
+
+    def run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: self.pending is not None)
+                snapshot, self.pending = self.pending, None
+                self.writing = True
+
+            start = time.perf_counter()
+            try:
+                header = write_snapshot(self.path, snapshot, compress=self.compress)
+                self.saves += 1
+                if self.on_save:
+                    self.on_save(header)
+                self.last_error = None
+            except Exception as error:
+                # Previous Save is Left Untouched, Try Again at the Next Autosave (a Failed Save Never Stops the Worker)
+                self.last_error = error
+                print('Autosave to %s failed: %s' % (self.path, error))
+            finally:
+                with self.condition:
+                    self.writing = False
+                    self.last_duration = time.perf_counter() - start
+                    self.condition.notify_all()
+
+    def flush(self, timeout=None):
+        # Block until Every Requested Snapshot is on Disk, Returns False on Timeout
+        with self.condition:
+            return self.condition.wait_for(lambda: self.pending is None and not self.writing, timeout)
+
+    def __repr__(self):
+        return "AutoSaver {} saves={} dropped={} last={:.1f}ms".format(self.path, self.saves, self.dropped,
+                                                                     self.last_duration * 1000.0)
@@ -1,12 +1,39 @@
+import json
 import os
 import shelve
+import threading
 
+from loader_functions.SaveFormat import read_header, read_save, snapshot_state, write_snapshot
 
-def load_game():
-    if not os.path.isfile('save_files/savegame.dat'):
+SAVE_DIRECTORY = 'save_files'
+SAVE_EXTENSION = '.ctm'
+SAVE_INDEX_FILE = 'save_files/index.json'  # slot: metadata, read by the Title Screen instead of the saves themselves
+SAVE_SLOTS = ['slot_1', 'slot_2', 'slot_3']  # New Games take a free slot, or the least recently saved one
+DEFAULT_SLOT = 'savegame'
+LEGACY_SAVE_FILE = 'save_files/savegame'  # shelve, read only so old saves can still be continued
+SAVE_INDEX_LOCK = threading.Lock()  # Autosaves update the index from the AutoSaver's worker thread
+
+
+def obtain_save_path(slot=DEFAULT_SLOT):
+    return os.path.join(SAVE_DIRECTORY, '%s%s' % (slot, SAVE_EXTENSION))
+
+
+SAVE_FILE = obtain_save_path()
+
+
+def load_game(slot=DEFAULT_SLOT, mmap=False):
+    save_file = obtain_save_path(slot)
+    if os.path.isfile(save_file):
+        header, state = read_save(save_file, mmap=mmap)
+        entities = state['entities']
+        player = entities[state['player_index']]
+        return (player, entities, state['particles'], state['particles_systems'], state['game_map'],
+                state['message_log'], state['game_state'])
+
+    if slot != DEFAULT_SLOT or not os.path.isfile('%s.dat' % LEGACY_SAVE_FILE):
         raise FileNotFoundError
 
-    with shelve.open('save_files/savegame', 'r') as data_file:
+    with shelve.open(LEGACY_SAVE_FILE, 'r') as data_file:
         player_index = data_file['player_index']
         entities = data_file['entities']
         particles = data_file['particles']
@@ -20,18 +47,132 @@ def load_game():
     return player, entities, particles, particles_systems, game_map, message_log, game_state
 
 
-def save_game(player, entities, particles, particles_systems, game_map, message_log, game_state):
+def obtain_save_metadata(player, game_map, game_state):
+    # Stored in the Header so Save Slots can be Listed without Loading the Game
+    metadata = {'name': player.name, 'level': game_map.level, 'dungeon_level': game_map.dungeon_level,
+                'turn_count': game_map.turn_count, 'game_state': getattr(game_state, 'name', str(game_state))}
+    if player.fighter:
+        metadata['hp'] = player.fighter.hp
+        metadata['max_hp'] = player.fighter.max_hp
+    if player.level:
+        metadata['player_level'] = player.level.current_level
+    return metadata
+
+
+def snapshot_game(player, entities, particles, particles_systems, game_map, message_log, game_state):
     """
     - index for player is saved, not the player entity
     as it is already in entities variable
+    - cheap enough for the main thread, the snapshot shares nothing with the live game so an AutoSaver can write it
     """
     # print('save_game', player, entities, game_map, message_log, game_state)
+    state = {
+        'player_index': entities.index(player),
+        'entities': entities,
+        'particles': particles,
+        'particles_systems': particles_systems,
+        'game_map': game_map,
+        'message_log': message_log,
+        'game_state': game_state,
+    }
+    return snapshot_state(state, metadata=obtain_save_metadata(player, game_map, game_state))
+
+
+def save_game(player, entities, particles, particles_systems, game_map, message_log, game_state, slot=DEFAULT_SLOT,
+              compress=True):
+    """
+    - compress=False keeps map layers raw so load_game(mmap=True) can memory-map them
+    """
+    snapshot = snapshot_game(player, entities, particles, particles_systems, game_map, message_log, game_state)
+    header = write_snapshot(obtain_save_path(slot), snapshot, compress=compress)
+    update_save_index(slot, header)
+    return header
+
+
+def obtain_index_entry(slot, header):
+    entry = dict(header.get('metadata', {}))
+    entry['saved_at'] = header.get('saved_at', 0)
+    entry['file_size'] = os.path.getsize(obtain_save_path(slot))
+    return entry
+
+
+def write_save_index(save_index):
+    # Written Aside and Renamed, a Crash Never Leaves a Half Written Index
+    temporary_path = '%s.tmp' % SAVE_INDEX_FILE
+    os.makedirs(os.path.dirname(SAVE_INDEX_FILE) or '.', exist_ok=True)
+    with open(temporary_path, 'w', encoding='utf8') as index_file:
+        json.dump(save_index, index_file, indent=1)
+    os.replace(temporary_path, SAVE_INDEX_FILE)
+
+
+def update_save_index(slot, header):
+    with SAVE_INDEX_LOCK:
+        save_index = obtain_save_index()
+        save_index[slot] = obtain_index_entry(slot, header)
+        write_save_index(save_index)
+
+
+def rebuild_save_index():
+    # Only Save Headers are Read, never the Saved Worlds
+    save_index = {}
+    if not os.path.isdir(SAVE_DIRECTORY):
+        return save_index
+
+    for file_name in os.listdir(SAVE_DIRECTORY):
+        slot, extension = os.path.splitext(file_name)
+        if extension != SAVE_EXTENSION:
+            continue
+        try:
+            save_index[slot] = obtain_index_entry(slot, read_header(obtain_save_path(slot)))
+        except (OSError, ValueError):
+            print('Skipping unreadable save %s' % file_name)
+
+    legacy_file = '%s.dat' % LEGACY_SAVE_FILE
+    if DEFAULT_SLOT not in save_index and os.path.isfile(legacy_file):
+        save_index[DEFAULT_SLOT] = {'legacy': True, 'saved_at': os.path.getmtime(legacy_file),
+                                    'file_size': os.path.getsize(legacy_file)}
+
+    if save_index:
+        write_save_index(save_index)
+    return save_index
+
+
+def obtain_save_index():
+    """
+    slot: {'name', 'level', 'dungeon_level', 'turn_count', 'player_level', 'hp', 'max_hp', 'saved_at', 'file_size'}
+    Rebuilt from the save headers when the index is missing, unreadable or out of date with the save directory.
+    """
+    try:
+        with open(SAVE_INDEX_FILE, 'r', encoding='utf8') as index_file:
+            save_index = json.load(index_file)
+    except (OSError, ValueError):
+        return rebuild_save_index()
+
+    # Saves Written or Copied in without Reaching the Index, or Deleted since, only Need a Directory Listing
+    saved_slots = set()
+    for file_name in os.listdir(SAVE_DIRECTORY):
+        slot, extension = os.path.splitext(file_name)
+        if extension == SAVE_EXTENSION:
+            saved_slots.add(slot)
+    if saved_slots != {slot for slot, entry in save_index.items() if not entry.get('legacy')}:
+        return rebuild_save_index()
+
+    for slot, entry in save_index.items():
+        if entry.get('legacy'):
+            continue
+        if os.path.getsize(obtain_save_path(slot)) != entry.get('file_size'):
+            return rebuild_save_index()
+    return save_index
+
+
+def list_save_slots():
+    # [(slot, entry)], Most Recently Saved First
+    return sorted(obtain_save_index().items(), key=lambda slot_entry: slot_entry[1].get('saved_at', 0), reverse=True)
+
 
-    with shelve.open('save_files/savegame', 'n') as data_file:
-        data_file['player_index'] = entities.index(player)
-        data_file['particles'] = particles
-        data_file['particles_systems'] = particles_systems
-        data_file['entities'] = entities
-        data_file['game_map'] = game_map
-        data_file['message_log'] = message_log
-        data_file['game_state'] = game_state
+def obtain_free_slot():
+    save_index = obtain_save_index()
+    for slot in SAVE_SLOTS:
+        if slot not in save_index:
+            return slot
+    return min(SAVE_SLOTS, key=lambda slot: save_index[slot].get('saved_at', 0))
@@ -3,12 +3,12 @@ import tcod as libtcod
 from components.Faction import Faction
 from components.Fighter import Fighter
 from components.Level import Level
+from components.Particle import ParticleStore
 from components.Item import Item
 from components.Inventory import Inventory
 from components.Equippable import Equippable
 from components.Equipment import Equipment
 from components.Position import Position
-from loader_functions.JsonReader import obtain_item_table
 from Entity import Entity
 from level_generation.GenerationUtils import create_item_entity
 from GameMessages import Message, MessageLog
@@ -19,9 +19,6 @@ from map_objects.GameMap import GameMap
 from RenderFunctions import RenderOrder
 
 
-ITEMS = obtain_item_table()
-
-
 def get_constants():
     window_title = 'Complete The Mission'
 
@@ -61,6 +58,19 @@ def get_constants():
     fov_radius = 10
     enemy_fov_radius = 5
 
+    # Frame Pacing, Only Applies while Something is Animating (Idle Frames Wait on Input)
+    fps_cap = 30
+    show_frame_time = False
+
+    # Turns between Background Autosaves (0 Disables), Level Transitions Always Autosave
+    autosave_interval = 100
+
+    # Build the Next Floor in a Worker Process while the Current One is Played
+    pregenerate_floors = True
+
+    # Master Seed for the Generation, AI and Combat Streams, None Picks a New Run Each Game
+    seed = None
+
     constants = {
         'window_title': window_title,
         'screen_width': screen_width,
@@ -85,13 +95,18 @@ def get_constants():
         'top_gui_height': top_gui_height,
         'top_gui_y': top_gui_y,
         'side_panel_height': side_panel_height,
-        'side_panel_width': side_panel_width
+        'side_panel_width': side_panel_width,
+        'fps_cap': fps_cap,
+        'show_frame_time': show_frame_time,
+        'autosave_interval': autosave_interval,
+        'pregenerate_floors': pregenerate_floors,
+        'seed': seed
     }
 
     return constants
 
 
-def get_game_variables(constants, level=None):
+def create_player(constants):
     # Player Variables
     fighter_component = Fighter(hp=30, defense=0, power=1, is_player=True, fov_range=constants.get('fov_radius'))
     inventory_component = Inventory(26)
@@ -102,10 +117,6 @@ def get_game_variables(constants, level=None):
     player = Entity("@", (95, 75, 47), 'Player', "player", blocks=True, render_order=RenderOrder.ACTOR, position=position_component,
                     fighter=fighter_component, inventory=inventory_component, level=level_component,
                     equipment=equipment_component, faction=faction_component)
-    entities = [player]
-    particles = []
-    particle_systems = []
-    encounters = []
 
     # Generate Starting Equipment
     if not player.inventory.items:
@@ -119,10 +130,21 @@ def get_game_variables(constants, level=None):
             if item_entity.equippable:
                 player.equipment.toggle_equip(item_entity)
 
+    return player
+
+
+def get_game_variables(constants, level=None):
+    player = create_player(constants)
+    particles = ParticleStore()
+    particle_systems = []
+    encounters = []
+
     # Initiatize Map
     dungeon_level = 0
     # TODO: Change game_map into a Map variable containing all the entities and tiles. All tiles are not transparent
-    game_map = GameMap(constants['map_width'], constants['map_height'], dungeon_level=dungeon_level)
+    game_map = GameMap(constants['map_width'], constants['map_height'], dungeon_level=dungeon_level,
+                       seed=constants['seed'])
+    entities = game_map.track_entities([player])
     game_map.make_map(constants['max_rooms'], constants['room_min_size'], constants['room_max_size'],
                       constants['map_width'], constants['map_height'], player, entities, particles, particle_systems,
                       encounters=encounters, level=level)
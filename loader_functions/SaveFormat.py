@@ -0,0 +1,386 @@
+"""
+Versioned binary save file.
+
+    MAGIC | header length (uint32 little endian) | header json | padding | blocks...
+
+The json header holds the schema version, free-form metadata (level, turn, player stats, ...) and a table of blocks:
+    name: {"offset": int, "nbytes": int, "dtype": str, "shape": [int], "compression": "none" | "zlib"}
+
+Every numpy array in the saved state is its own block, raw or zlib compressed. Raw blocks are aligned to BLOCK_ALIGNMENT
+so they can be memory-mapped straight from the file on load. The object graph goes in the "records" block as json:
+every object (Entity, component, Encounter, GameMap, ...) is one record {"type": index, "state": {...}} with a stable
+integer id, classes are named once in a "types" table of "module:Class" names, and references between objects are
+{"$ref": id}. Object state is the same __getstate__/__dict__ pickle would save, so transient caches stay out of saves,
+but the encoding doesn't depend on pickle's class layout: fields added later fall back to their class attribute
+defaults when an older save is loaded.
+"""
+
+from collections import deque
+from enum import Enum
+from functools import partial
+import importlib
+import json
+import os
+import pickle
+import random
+import struct
+import time
+import types
+import zlib
+
+import numpy as np
+
+from map_objects.SpatialIndex import EntityList
+
+MAGIC = b'CTMSAVE\x00'
+SCHEMA_VERSION = 1
+BLOCK_ALIGNMENT = 64
+RECORDS_BLOCK = 'records'
+SCALAR_TYPES = (type(None), bool, int, float, str)
+
+# Schema Version: function(header, records_document) Upgrading a Save from that Version to the Next
+SCHEMA_UPGRADES = {}
+
+
+def qualified_name(obj_type):
+    return '%s:%s' % (obj_type.__module__, obj_type.__qualname__)
+
+
+def resolve_name(name):
+    module_name, qualname = name.split(':')
+    obj = importlib.import_module(module_name)
+    for attribute in qualname.split('.'):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+class RecordEncoder:
+    """
+    Flattens an object graph into json-compatible records, moving numpy arrays out into separate blocks.
+    """
+
+    def __init__(self, externals=None):
+        self.externals = externals or {}  # id(obj): name, objects the reader supplies instead of the file
+        self.records = []
+        self.record_ids = {}  # id(obj): record id
+        self.type_names = []  # Records Refer to their Class by Index, each Name is Stored Once
+        self.type_ids = {}  # class: index in type_names
+        self.pending = deque()  # (record id, obj) whose state is still to be encoded
+        self.arrays = {}  # block name: array
+        self.array_names = {}  # id(array): block name
+        self.keep_alive = []  # Objects whose id() is used as a key must outlive the encoder
+
+    def encode_root(self, value):
+        encoded = self.encode(value)
+
+        # Breadth First, so Deep Object Chains don't Recurse
+        while self.pending:
+            record_id, obj = self.pending.popleft()
+            state = obj.__getstate__() if hasattr(obj, '__getstate__') else obj.__dict__
+            self.records[record_id]['state'] = self.encode(state if state is not None else {})
+        return encoded
+
+    def encode(self, value):
+        value_type = type(value)
+        if value_type in SCALAR_TYPES:
+            return value
+        if value_type is dict:
+            return self.encode_dict(value)
+        if value_type is list:
+            return [self.encode(item) for item in value]
+        if isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            return self.encode_array(value)
+        if isinstance(value, Enum):
+            return {'$enum': qualified_name(type(value)), 'name': value.name}
+        if isinstance(value, EntityList):
+            return {'$entity_list': [self.encode(item) for item in value]}
+        if value_type is random.Random:
+            # Mersenne Twister State as a uint32 Block instead of 625 json Numbers
+            version, internal_state, gauss_next = value.getstate()
+            return {'$random': self.encode_array(np.array(internal_state, dtype=np.uint32)), 'version': version,
+                    'gauss_next': gauss_next}
+        if isinstance(value, deque):
+            return {'$deque': [self.encode(item) for item in value], 'maxlen': value.maxlen}
+        if isinstance(value, list):
+            return [self.encode(item) for item in value]
+        if isinstance(value, tuple):
+            return {'$tuple': [self.encode(item) for item in value]}
+        if isinstance(value, (set, frozenset)):
+            return {'$set': [self.encode(item) for item in value], 'frozen': isinstance(value, frozenset)}
+        if isinstance(value, dict):
+            return self.encode_dict(value)
+        if isinstance(value, bytes):
+            return {'$bytes': self.encode_array(np.frombuffer(value, dtype=np.uint8))}
+        if isinstance(value, partial):
+            return {'$partial': self.encode(value.func), 'args': self.encode(value.args),
+                    'keywords': self.encode(value.keywords)}
+        if isinstance(value, types.MethodType):
+            return {'$method': self.encode(value.__self__), 'name': value.__func__.__name__}
+        if isinstance(value, (types.FunctionType, types.BuiltinFunctionType, type)):
+            if '<' not in value.__qualname__:
+                return {'$name': qualified_name(value)}
+        elif hasattr(value, '__dict__'):
+            return self.encode_object(value)
+
+        # Last Resort for Foreign Objects without a __dict__
+        return {'$pickle': self.encode_array(np.frombuffer(pickle.dumps(value), dtype=np.uint8))}
+
+    def encode_dict(self, value):
+        if all(isinstance(key, str) and not key.startswith('$') for key in value):
+            return {key: self.encode(val) for key, val in value.items()}
+        return {'$dict': [[self.encode(key), self.encode(val)] for key, val in value.items()]}
+
+    def encode_object(self, obj):
+        if id(obj) in self.externals:
+            return {'$external': self.externals[id(obj)]}
+
+        record_id = self.record_ids.get(id(obj))
+        if record_id is None:
+            obj_type = type(obj)
+            type_id = self.type_ids.get(obj_type)
+            if type_id is None:
+                type_id = self.type_ids[obj_type] = len(self.type_names)
+                self.type_names.append(qualified_name(obj_type))
+
+            record_id = len(self.records)
+            self.record_ids[id(obj)] = record_id
+            self.records.append({'type': type_id, 'state': None})
+            self.pending.append((record_id, obj))
+            self.keep_alive.append(obj)
+        return {'$ref': record_id}
+
+    def encode_array(self, array):
+        name = self.array_names.get(id(array))
+        if name is None:
+            name = 'array_%s' % len(self.arrays)
+            self.array_names[id(array)] = name
+            self.arrays[name] = array
+            self.keep_alive.append(array)
+        return {'$array': name}
+
+
+class RecordDecoder:
+    """
+    Rebuilds the object graph of RecordEncoder: every record is allocated first, then states are decoded (references
+    resolve to the allocated objects) and applied, and EntityLists are filled last so their spatial indexes see fully
+    restored positions.
+    """
+
+    def __init__(self, type_names, records, arrays, externals=None):
+        self.externals = externals or {}  # name: obj for {'$external': name}
+        self.type_names = type_names
+        self.records = records
+        self.arrays = arrays  # block name: array
+        self.objects = []
+        self.entity_lists = []  # (EntityList, items) filled once every object is restored
+
+    def decode_root(self, value):
+        obj_types = [resolve_name(name) for name in self.type_names]
+        for record in self.records:
+            obj_type = obj_types[record['type']]
+            self.objects.append(obj_type.__new__(obj_type))
+
+        for obj, record in zip(self.objects, self.records):
+            state = self.decode(record['state'])
+            if hasattr(obj, '__setstate__'):
+                obj.__setstate__(state)
+            else:
+                obj.__dict__.update(state)
+
+        root = self.decode(value)
+        for entity_list, items in self.entity_lists:
+            entity_list.__init__(items)
+        return root
+
+    def decode(self, value):
+        if isinstance(value, list):
+            return [self.decode(item) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if not value or not next(iter(value)).startswith('$'):
+            return {key: self.decode(val) for key, val in value.items()}
+
+        tag = next(iter(value))
+        if tag == '$ref':
+            return self.objects[value['$ref']]
+        if tag == '$external':
+            return self.externals[value['$external']]
+        if tag == '$array':
+            return self.arrays[value['$array']]
+        if tag == '$enum':
+            return resolve_name(value['$enum'])[value['name']]
+        if tag == '$entity_list':
+            entity_list = EntityList.__new__(EntityList)
+            self.entity_lists.append((entity_list, self.decode(value['$entity_list'])))
+            return entity_list
+        if tag == '$random':
+            rng = random.Random()
+            internal_state = tuple(int(word) for word in self.arrays[value['$random']['$array']])
+            rng.setstate((value['version'], internal_state, value['gauss_next']))
+            return rng
+        if tag == '$deque':
+            return deque(self.decode(value['$deque']), value['maxlen'])
+        if tag == '$tuple':
+            return tuple(self.decode(value['$tuple']))
+        if tag == '$set':
+            items = self.decode(value['$set'])
+            return frozenset(items) if value['frozen'] else set(items)
+        if tag == '$dict':
+            return {self.decode(key): self.decode(val) for key, val in value['$dict']}
+        if tag == '$bytes':
+            return self.arrays[value['$bytes']['$array']].tobytes()
+        if tag == '$partial':
+            return partial(self.decode(value['$partial']), *self.decode(value['args']), **self.decode(value['keywords']))
+        if tag == '$method':
+            return getattr(self.decode(value['$method']), value['name'])
+        if tag == '$name':
+            return resolve_name(value['$name'])
+        if tag == '$pickle':
+            return pickle.loads(self.arrays[value['$pickle']['$array']].tobytes())
+        raise ValueError('Unknown save record tag %s' % tag)
+
+
+class SaveSnapshot:
+    """
+    Save state captured on the main thread: encoded records plus private copies of every array. Nothing in it is
+    shared with the live game, so it can be serialized and written on another thread while the game keeps running.
+    """
+
+    def __init__(self, document, arrays, metadata):
+        self.document = document  # {'root': ..., 'types': [...], 'records': [...]}
+        self.arrays = arrays  # block name: array
+        self.metadata = metadata
+
+    def __repr__(self):
+        return "SaveSnapshot records={} arrays={}".format(len(self.document['records']), len(self.arrays))
+
+
+def snapshot_state(state, metadata=None, externals=None):
+    """
+    externals: {name: obj} objects left out of the snapshot, restore_snapshot/read_save are handed them back by name.
+    """
+    encoder = RecordEncoder({id(obj): name for name, obj in (externals or {}).items()})
+    root = encoder.encode_root(state)
+    arrays = {name: np.array(array, copy=True) for name, array in encoder.arrays.items()}
+    document = {'root': root, 'types': encoder.type_names, 'records': encoder.records}
+    return SaveSnapshot(document, arrays, metadata or {})
+
+
+def write_snapshot(path, snapshot, compress=True):
+    """
+    Serialize a SaveSnapshot to path. The file is written next to path, fsynced and then renamed over it, so a crash
+    mid-save leaves the previous save intact. Returns the header that was written.
+    """
+    records_document = json.dumps(snapshot.document, separators=(',', ':')).encode('utf8')
+
+    payloads = [(RECORDS_BLOCK, zlib.compress(records_document, 6), 'uint8', [len(records_document)], 'zlib')]
+    for name, array in snapshot.arrays.items():
+        array = np.ascontiguousarray(array)
+        if compress:
+            payloads.append((name, zlib.compress(array.tobytes(), 1), array.dtype.str, list(array.shape), 'zlib'))
+        else:
+            payloads.append((name, array.tobytes(), array.dtype.str, list(array.shape), 'none'))
+
+    blocks = {}
+    offset = 0
+    for name, payload, dtype, shape, compression in payloads:
+        blocks[name] = {'offset': offset, 'nbytes': len(payload), 'dtype': dtype, 'shape': shape,
+                        'compression': compression}
+        offset += len(payload) + (-len(payload) % BLOCK_ALIGNMENT)
+
+    header = {'schema_version': SCHEMA_VERSION, 'saved_at': time.time(), 'metadata': snapshot.metadata,
+              'blocks': blocks}
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf8')
+    data_start = len(MAGIC) + 4 + len(header_bytes)
+    data_start += -data_start % BLOCK_ALIGNMENT
+
+    temporary_path = '%s.tmp' % path
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(temporary_path, 'wb') as save_file:
+        save_file.write(MAGIC)
+        save_file.write(struct.pack('<I', len(header_bytes)))
+        save_file.write(header_bytes)
+        save_file.write(b'\x00' * (data_start - save_file.tell()))
+        for name, payload, dtype, shape, compression in payloads:
+            save_file.write(payload)
+            save_file.write(b'\x00' * (-len(payload) % BLOCK_ALIGNMENT))
+        save_file.flush()
+        os.fsync(save_file.fileno())
+    os.replace(temporary_path, path)
+
+    return header
+
+
+def restore_snapshot(snapshot, externals=None):
+    # Rebuild the State of a SaveSnapshot without Going through a File
+    document = snapshot.document
+    return RecordDecoder(document['types'], document['records'], snapshot.arrays, externals).decode_root(
+        document['root'])
+
+
+def write_save(path, state, metadata=None, compress=True, externals=None):
+    """
+    Write "state" (any object graph) to path. compress=False stores arrays raw so loads can memory-map them.
+    Returns the header that was written.
+    """
+    return write_snapshot(path, snapshot_state(state, metadata, externals), compress=compress)
+
+
+def read_header(path):
+    # Header Only, Cheap Enough for Listing Save Slots
+    with open(path, 'rb') as save_file:
+        if save_file.read(len(MAGIC)) != MAGIC:
+            raise ValueError('%s is not a save file' % path)
+        header_length = struct.unpack('<I', save_file.read(4))[0]
+        header = json.loads(save_file.read(header_length).decode('utf8'))
+
+    data_start = len(MAGIC) + 4 + header_length
+    header['data_start'] = data_start + (-data_start % BLOCK_ALIGNMENT)
+    return header
+
+
+def read_block(path, header, name, mmap=False, save_file=None):
+    block = header['blocks'][name]
+    offset = header['data_start'] + block['offset']
+    dtype = np.dtype(block['dtype'])
+    shape = tuple(block['shape'])
+
+    if block['compression'] == 'none' and mmap:
+        # Copy on Write, the Game may Change the Array but the File is never Touched
+        return np.memmap(path, dtype=dtype, mode='c', offset=offset, shape=shape)
+
+    save_file.seek(offset)
+    payload = save_file.read(block['nbytes'])
+    if block['compression'] == 'zlib':
+        payload = zlib.decompress(payload)
+
+    if name == RECORDS_BLOCK:
+        return payload
+    return np.frombuffer(payload, dtype=dtype).reshape(shape).copy()
+
+
+def read_save(path, mmap=False, externals=None):
+    """
+    Returns (header, state). mmap=True memory-maps raw (uncompressed) array blocks instead of reading them.
+    externals: {name: obj} for the objects the save was written without.
+    """
+    header = read_header(path)
+    schema_version = header.get('schema_version', 0)
+    if schema_version > SCHEMA_VERSION:
+        raise ValueError('%s was saved by a newer version (schema %s)' % (path, schema_version))
+
+    with open(path, 'rb') as save_file:
+        document = json.loads(read_block(path, header, RECORDS_BLOCK, save_file=save_file).decode('utf8'))
+        arrays = {name: read_block(path, header, name, mmap=mmap, save_file=save_file)
+                  for name in header['blocks'] if name != RECORDS_BLOCK}
+
+    while schema_version < SCHEMA_VERSION:
+        SCHEMA_UPGRADES[schema_version](header, document)
+        schema_version += 1
+
+    state = RecordDecoder(document['types'], document['records'], arrays, externals).decode_root(document['root'])
+    return header, state
@@ -0,0 +1,106 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from loader_functions.AssetRegistry import ASSETS
+from loader_functions.SaveFormat import restore_snapshot, snapshot_state
+
+
+def generate_floor(width, height, dungeon_level, seed, level, constants, player_snapshot):
+    """
+    Worker side: build the floor after dungeon_level on a fresh GameMap and return it as a SaveSnapshot.
+
+    The player is a private copy, it is written as the external 'player' so every reference the floor holds to it
+    (game_map.player, entity lists, events) resolves to the live player when the snapshot is restored. The map shares
+    the run's seed, so the floor matches the one next_floor would build from the same seed.
+    """
+    from map_objects.GameMap import GameMap
+
+    player = restore_snapshot(player_snapshot)
+    game_map = GameMap(width, height, dungeon_level=dungeon_level, seed=seed)
+    game_map.level = level
+    game_map.allocate_layers()
+    entities, particles, particle_systems = game_map.generate_next_floor(player, constants)
+    state = {'game_map': game_map, 'entities': entities, 'particles': particles, 'particle_systems': particle_systems,
+             'position': (player.position.x, player.position.y)}
+    return snapshot_state(state, externals={'player': player})
+
+
+class FloorPregenerator:
+    """
+    Builds the next floor in a worker process while the player is still on the current one.
+
+    request() is called as soon as a floor is entered. take() hands back the finished floor when the player reaches the
+    stairs, or None when the worker isn't done (or the request no longer matches the map, or json assets were edited
+    since it was made), in which case the caller generates the floor synchronously as before. Only one floor is ever
+    pending; a new request cancels the old one.
+    """
+
+    def __init__(self, constants):
+        self.constants = constants
+        self.executor = None  # Started Lazily, Spawned so the Worker doesn't Inherit the Window
+        self.future = None
+        self.dungeon_level = None  # Level the Pending Floor Follows
+        self.asset_fingerprint = None  # ASSETS.fingerprint() when the Pending Floor was Requested
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def request(self, game_map, player):
+        self.cancel()
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+
+        player_snapshot = snapshot_state(player)
+        self.dungeon_level = game_map.dungeon_level
+        self.asset_fingerprint = ASSETS.fingerprint()
+        self.future = self.executor.submit(generate_floor, game_map.width, game_map.height, game_map.dungeon_level,
+                                           game_map.obtain_random_streams().seed, game_map.level, self.constants, player_snapshot)
+
+    def ready(self):
+        return self.future is not None and self.future.done()
+
+    def cancel(self):
+        if self.future is not None:
+            self.future.cancel()
+        self.future = None
+        self.dungeon_level = None
+
+    def take(self, game_map, player):
+        """
+        Returns (game_map, entities, particles, particle_systems) of the next floor, or None to generate synchronously.
+        """
+        if not self.ready() or self.dungeon_level != game_map.dungeon_level or \
+                self.asset_fingerprint != ASSETS.fingerprint():
+            self.misses += 1
+            self.cancel()
+            return None
+
+        future = self.future
+        self.cancel()
+        try:
+            state = restore_snapshot(future.result(), externals={'player': player})
+        except Exception as error:
+            # A Failed Worker Never Blocks the Stairs
+            print('Floor pre-generation failed: %s' % error)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        new_map = state['game_map']
+        new_map.player = player
+        # The AI and Combat Streams Carry on from the Live Map, Only Generation was Done in the Worker
+        new_map.random_streams = game_map.obtain_random_streams()
+        player.position.x, player.position.y = state['position']
+        entities = new_map.restore_spatial_indexes(state['entities'])
+        return new_map, entities, state['particles'], state['particle_systems']
+
+    def shutdown(self):
+        self.cancel()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    def __repr__(self):
+        return "FloorPregenerator level={} ready={} hits={} misses={}".format(self.dungeon_level, self.ready(),
+                                                                          self.hits, self.misses)
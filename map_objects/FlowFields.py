@@ -0,0 +1,42 @@
+import numpy as np
+
+from tcod.path import dijkstra2d, maxarray
+
+
+class FlowFields:
+    """
+    Per-turn Dijkstra distance maps, one per distinct target position, shared by every mob chasing that target.
+    Mobs walk down the gradient with hillclimb2d, so pathfinding costs O(targets x map) per turn instead of
+    O(mobs x map).
+
+    Fields are dropped whenever the turn count or the map's tiles (GameMap.transparency_version) change.
+    """
+
+    def __init__(self):
+        self.fields = {}  # (target_x, target_y, cardinal, diagonal): distance array indexed [y][x]
+        self.key = None  # (turn_count, transparency_version) the fields were computed for
+
+    def obtain(self, game_map, target_x, target_y, cardinal=1, diagonal=1):
+        key = (game_map.turn_count, game_map.transparency_version)
+        if self.key != key:
+            self.fields = {}
+            self.key = key
+
+        field_key = (target_x, target_y, cardinal, diagonal)
+        flow_field = self.fields.get(field_key)
+        if flow_field is None:
+            # Obtain Cost Map - How much each Tile "costs" to travel to (0 is Blocked)
+            cost_map = np.asarray(game_map.tile_cost, dtype=np.int32)
+            flow_field = maxarray(cost_map.shape, dtype=np.int32)
+            flow_field[target_y][target_x] = 0
+            dijkstra2d(flow_field, cost_map, cardinal, diagonal, out=flow_field)
+            self.fields[field_key] = flow_field
+
+        return flow_field
+
+    def __getstate__(self):
+        # Fields are cheap to rebuild, never saved
+        return {'fields': {}, 'key': None}
+
+    def __repr__(self):
+        return "FlowFields key={} fields={}".format(self.key, len(self.fields))
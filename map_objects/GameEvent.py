@@ -8,8 +8,6 @@ import MapObjectFunctions
 
 import RenderFunctions
 
-MOBS = obtain_mob_table('undergrave_prison')
-
 
 class GameEvent:
     """
@@ -54,7 +52,7 @@ class GameEvent:
                 results.append({'Message': Message("You hear barking and yelling in the distance...", tcod.dark_yellow)})
             for mob_index in mob_indexes:
                 x, y = self.game_map.obtain_closest_spawn_point(spawn_x, spawn_y)
-                mob_stats = MOBS.get(mob_index)
+                mob_stats = obtain_mob_table('undergrave_prison').get(mob_index)
                 if x and y:
                     self.game_map.tile_cost[y][x] = 99
                     entities.append(generate_mob(x, y, mob_stats, mob_index, e, faction, ai_type, entities,
@@ -1,26 +1,23 @@
 from collections import deque
 from copy import deepcopy
-from random import choice
-
+import numpy as np
 import tcod as libtcod
 from tcod.map import Map
 
-from level_generation.Arena import Arena
-from level_generation.GenericDungeon import generic_dungeon
-from level_generation.UndergravePrison import UndergravePrison
-from level_generation.ResinfaireForest import ResinFaireForest
-from level_generation.YendorCastleOuter import YendorCastleOuter
-from level_generation.YendorCastleInner import YendorCastleInner
-from level_generation.Overworld import Overworld
-from level_generation.RandomWalk import RandomWalkAlgorithm
-from level_generation.Tunneling import TunnelingAlgorithm
+from components.Particle import ParticleStore
+from level_generation.LevelRegistry import create_level_generator
 from loader_functions.JsonReader import obtain_item_table, obtain_mob_table, obtain_tile_set
+from map_objects.FlowFields import FlowFields
+from map_objects.PathfinderCache import PathfinderCache
+from map_objects.SpatialIndex import EntityList, SpatialIndex
+from map_objects.TileRegistry import TILES
 from GameMessages import Message
+from RandomUtils import RandomStreams
 
 
 # LEVEL_GENERATION = [BSPTreeAlgorithm, CellularAutomataAlgorithm, RandomWalkAlgorithm, TunnelingAlgorithm]
 # LEVEL_GENERATION = [RandomWalkAlgorithm]
-LEVEL_GENERATION = [RandomWalkAlgorithm, TunnelingAlgorithm]
+LEVEL_GENERATION = ['random_walk', 'tunneling']  # names in LevelRegistry.LEVEL_GENERATORS
 
 """
 1. Tunneling Algorithm
@@ -33,20 +30,17 @@ LEVEL_GENERATION = [RandomWalkAlgorithm, TunnelingAlgorithm]
 8. Messy BSP Tree
 """
 
-MOBS = obtain_mob_table()
-ITEMS = obtain_item_table()
-
 
 class GameMap(Map):
-    explored = [[]]  # boolean 2d numpy array of what player has explored
-    tileset_tiles = [[]]  # 2d numpy array of indexes from tile_set.json
+    explored = None  # boolean 2d numpy array of what player has explored
+    tileset_tiles = None  # 2d numpy array of indexes from tile_set.json
     map_objects = []  # list of map object entities that can be interacted with  does not need to be iterated through every frame
     # char_tiles = [[]]  # 2d numpy array of just the glyphs need to see if this is still needed
     level = ''  # name of level generation algorithm
     map = None
     player = None
     stairs = None
-    tile_cost = [[]]  # 2d numpy array of integers of "traversal costs" of each node
+    tile_cost = None  # 2d numpy array of integers of "traversal costs" of each node
 
     entrances = []
     mouse_rooms = []  # Used to keep track of room types for mouse display
@@ -59,50 +53,132 @@ class GameMap(Map):
 
     turn_count = 0
     # turn_count = None
+    transparency_version = 0  # bumped whenever tiles change, invalidates cached mob FOVs and flow fields
+    flow_fields = None  # FlowFields shared by mobs chasing the same target
+    pathfinders = None  # PathfinderCache of AStars over tile_cost
+    random_streams = None  # RandomStreams of the game, carried from floor to floor
     game_events = []
     level_message = ''
 
-    def __init__(self, width, height, dungeon_level=1):
+    def __init__(self, width, height, dungeon_level=1, seed=None):
         super(GameMap, self).__init__(width, height)
+        self.random_streams = RandomStreams(seed)
         # Map Variables
         self.turn_count = 0
         # self.turn_count = TurnCount()
         self.dungeon_level = dungeon_level
         self.spawn_chances = {'mobs': {},
                               'items': {}}  # Used to display dungeon level stats
-        self.tile_set = obtain_tile_set()
+
+        # Spatial Indexes: (x, y) -> Entities, kept in sync by EntityList and Position
+        self.entity_index = SpatialIndex()
+        self.map_objects = EntityList()
+
+    @property
+    def tile_set(self):
+        # Shared with the Tile Registry, not Copied into every Map (or Save)
+        return TILES.tile_set
+
+    @property
+    def map_object_index(self):
+        return self.map_objects.spatial_index
+
+    def track_entities(self, entities):
+        # Wrap the Level's Entity List so Every Add/Remove/Move Updates the Entity Index
+        self.entity_index.clear()
+        return EntityList(entities, spatial_index=self.entity_index)
+
+    def restore_spatial_indexes(self, entities):
+        # Indexes are not saved, rebuild them after a Game is Loaded
+        self.entity_index = SpatialIndex()
+        self.map_objects = EntityList(self.map_objects)
+        return self.track_entities(entities)
+
+    def bump_transparency_version(self):
+        # Cached Mob FOVs Keyed on an Older Version are Recomputed on their Next Lookup
+        self.transparency_version += 1
+
+    def obtain_flow_field(self, target_x, target_y, cardinal=1, diagonal=1):
+        # Created Lazily so Maps Saved before Flow Fields Existed still Load
+        if self.flow_fields is None:
+            self.flow_fields = FlowFields()
+        return self.flow_fields.obtain(self, target_x, target_y, cardinal, diagonal)
+
+    def obtain_pathfinder(self, diagonal_cost=1.41):
+        # Created Lazily so Maps Saved before the Pathfinder Cache Existed still Load
+        if self.pathfinders is None:
+            self.pathfinders = PathfinderCache()
+        return self.pathfinders.obtain(self, diagonal_cost)
+
+    def obtain_random_streams(self):
+        # Created Lazily so Maps Saved before Seeded Streams Existed still Load
+        if self.random_streams is None:
+            self.random_streams = RandomStreams()
+        return self.random_streams
+
+    def obtain_random_stream(self, name):
+        return self.obtain_random_streams().stream(name)
+
+    def obtain_level_stream(self, name='generation'):
+        # Fresh Stream for this Floor, Only Depends on the Game Seed and dungeon_level
+        return self.obtain_random_streams().level_stream(name, self.dungeon_level)
+
+    def allocate_layers(self):
+        # Terrain Layers not Provided by tcod's Map, Same [y][x] Layout as walkable/transparent/fov
+        self.explored = np.zeros((self.height, self.width), dtype=bool)
+        self.tile_cost = np.zeros((self.height, self.width), dtype=np.int32)
+        self.tileset_tiles = np.zeros((self.height, self.width), dtype=np.int32)
+
+    def upgrade_layers(self):
+        # Saves made before every Terrain Layer was a numpy Array Hold Lists of Lists
+        if not isinstance(self.explored, np.ndarray):
+            self.explored = np.array(self.explored, dtype=bool)
+        if not isinstance(self.tile_cost, np.ndarray) or self.tile_cost.dtype != np.int32:
+            self.tile_cost = np.array(self.tile_cost, dtype=np.int32)
+        if not isinstance(self.tileset_tiles, np.ndarray):
+            self.tileset_tiles = np.array(self.tileset_tiles, dtype=np.int32)
+
+    def fill_layers(self, walkable=None, transparent=None, fov=None, explored=None, tile_cost=None,
+                    tileset_tiles=None, region=None):
+        """
+        Bulk assignment of terrain layers, over the whole map or region=(x1, y1, x2, y2) with exclusive ends.
+        Layers left as None are untouched.
+        """
+        if region is None:
+            cells = slice(None), slice(None)
+        else:
+            x1, y1, x2, y2 = region
+            cells = slice(y1, y2), slice(x1, x2)
+
+        layers = ((self.walkable, walkable), (self.transparent, transparent), (self.fov, fov),
+                  (self.explored, explored), (self.tile_cost, tile_cost), (self.tileset_tiles, tileset_tiles))
+        for layer, value in layers:
+            if value is not None:
+                layer[cells] = value
+
+        if any(value is not None for value in (walkable, transparent, fov, tile_cost, tileset_tiles)):
+            self.bump_transparency_version()
 
     def initialize_open_map(self):
         # Set Entire Map to Open Floor
-        self.explored = [[False for x in range(self.width)] for y in range(self.height)]
-        self.tile_cost = [[1 for x in range(self.width)] for y in range(self.height)]
-        self.tileset_tiles = [[2 for x in range(self.width)] for y in range(self.height)]
-        self.map_objects = []
+        self.allocate_layers()
+        self.map_objects = EntityList()
         self.mouse_rooms = []
-
-        for x in range(self.height):
-            for y in range(self.width):
-                self.walkable[x][y] = True
-                self.transparent[x][y] = True
-                self.fov[x][y] = True
+        self.fill_layers(walkable=True, transparent=True, fov=True, explored=False, tile_cost=1, tileset_tiles=2)
 
     def initialize_closed_map(self):
         # Set Entire Map to Closed Walls
-        self.explored = [[True for y in range(self.width)] for x in range(self.height)]
-        self.tile_cost = [[0 for x in range(self.width)] for y in range(self.height)]
-        self.tileset_tiles = [[self.default_tile for y in range(self.width)] for x in range(self.height)]
-        self.map_objects = []
+        self.allocate_layers()
+        self.map_objects = EntityList()
         self.mouse_rooms = []
-
-        for x in range(self.height):
-            for y in range(self.width):
-                self.walkable[x][y] = False
-                self.transparent[x][y] = False
-                self.fov[x][y] = False
+        self.fill_layers(walkable=False, transparent=False, fov=False, explored=True, tile_cost=0,
+                         tileset_tiles=self.default_tile)
 
     def make_map(self, max_rooms, room_min_size, room_max_size, map_width, map_height, player, entities, particles,
-                 particle_systems, encounters, level=None):
+                 particle_systems, encounters, level=None, rng=None):
         # Map Generation Variables
+        if rng is None:
+            rng = self.obtain_level_stream()
         self.game_events = []
         self.player = player
         self.stairs = None
@@ -114,7 +190,9 @@ class GameMap(Map):
         else:
             self.encounters = []
 
-        mob_table = MOBS
+        # Tables are Fetched per Floor, so Edited json Assets Apply from the Next Floor on
+        TILES.refresh()
+        mob_table = obtain_mob_table()
         item_table = obtain_item_table()
 
         # Obtain only "Objects" from Tile Set
@@ -151,7 +229,7 @@ class GameMap(Map):
             self.level_message = "Arena Level"
             self.default_tile = 1
             self.initialize_closed_map()
-            self.map = Arena()
+            self.map = create_level_generator('arena')
             self.level = 'arena'
             mob_table = {**obtain_mob_table("resinfaire_mobs"), **obtain_mob_table("yendor_1_mobs"), **obtain_mob_table("yendor_2_mobs")}
             # for mob, stats in mob_table.items():
@@ -163,7 +241,7 @@ class GameMap(Map):
             self.level_message = "You begin your journey to the Castle of Yendor.\n\nThe tales of its plagued forest, massacred-crazed townsfolk and corrupt King perplex you.\n\nIt's time to find out what happened."
             self.default_tile = 13
             self.initialize_closed_map()
-            self.map = ResinFaireForest()
+            self.map = create_level_generator('resinfaire')
             self.level = 'resinfaire'
             mob_table = obtain_mob_table("resinfaire_mobs")
             map_width = 45
@@ -173,7 +251,7 @@ class GameMap(Map):
             self.level_message = "As you continue through Resinfaire Forest, you begin notice the normal denizens look slightly warped.\n\n\"What must've happened?\"\n-you wonder.\n\nYou step forward cautiously\n\nIt's time to get revenge.."
             self.default_tile = 13
             self.initialize_closed_map()
-            self.map = ResinFaireForest()
+            self.map = create_level_generator('resinfaire')
             self.level = 'resinfaire'
             mob_table = obtain_mob_table("resinfaire_mobs")
             item_table = obtain_item_table()
@@ -183,7 +261,7 @@ class GameMap(Map):
             self.level_message = "You see a village in the distance.\n\nIt's time to get revenge."
             self.default_tile = 13
             self.initialize_closed_map()
-            self.map = ResinFaireForest()
+            self.map = create_level_generator('resinfaire')
             self.level = 'resinfaire'
             mob_table = obtain_mob_table("resinfaire_mobs")
             item_table = obtain_item_table()
@@ -193,7 +271,7 @@ class GameMap(Map):
             self.level_message = "You enter Resinfaire Castle\n\nYou feel darkness envelops you as you hear faint voices and make out figures in the distance. They haven't noticed your arrival yet.\n\nIt's time to get revenge."
             self.default_tile = 52
             self.initialize_closed_map()
-            self.map = YendorCastleOuter()
+            self.map = create_level_generator('yendor_outer')
             self.level = 'yendor castle inner'
             mob_table = obtain_mob_table("yendor_1_mobs")
             item_table = obtain_item_table()
@@ -203,7 +281,7 @@ class GameMap(Map):
             self.level_message = "You feel the eyes of the entire castle, are fastened on you.\n\nYou peer into the darkness ready for the onslaught of corrupted knights coming your way.\n\nIt's time to get revenge."
             self.default_tile = 52
             self.initialize_closed_map()
-            self.map = YendorCastleInner()
+            self.map = create_level_generator('yendor_inner')
             self.level = 'yendor castle inner'
             mob_table = obtain_mob_table("yendor_2_mobs")
             item_table = obtain_item_table()
@@ -213,12 +291,13 @@ class GameMap(Map):
             self.level_message = "The journey continues. You clench your weapon tightly and trudge forward."
             self.default_tile = 1
             self.initialize_closed_map()
-            self.map = choice(LEVEL_GENERATION)()
+            self.map = create_level_generator(rng.choice(LEVEL_GENERATION))
             self.level = 'Dungeon'
 
         print('\n\nGeneration Type for Dungeon Level %s: %s' % (self.dungeon_level, self.map.__class__))
         self.map.generate_level(self, self.dungeon_level, max_rooms, room_min_size, room_max_size, map_width,
-                                map_height, player, entities, particles, particle_systems, item_table, mob_table)
+                                map_height, player, entities, particles, particle_systems, item_table, mob_table,
+                                rng=rng)
 
         # If any Other Entities Escaped to the Next Level, Add them and Find a Suitable Place
         if self.next_floor_entities:
@@ -236,9 +315,9 @@ class GameMap(Map):
         # for entity in entities:
         #     print(entity.json_index, entity.name)
         #     try:
-        #         map_print[entity.position.y][entity.position.x] = chr(MOBS.get("%s" % entity.json_index).get("char"))
+        #         map_print[entity.position.y][entity.position.x] = chr(obtain_mob_table().get("%s" % entity.json_index).get("char"))
         #     except:
-        #         map_print[entity.position.y][entity.position.x] = chr(ITEMS.get("%s" % entity.json_index).get("char"))
+        #         map_print[entity.position.y][entity.position.x] = chr(obtain_item_table().get("%s" % entity.json_index).get("char"))
 
         # # Map Object Entities
         # for entity in self.map_objects:
@@ -269,28 +348,30 @@ class GameMap(Map):
 
     def next_floor(self, player, message_log, constants):
         # Player Advances to the Next Floor
+        entities, particles, particle_systems = self.generate_next_floor(player, constants)
+        self.announce_floor(player, message_log)
+        return entities, particles, particle_systems
+
+    def generate_next_floor(self, player, constants):
+        # Build the Next Floor in Place, Only Reads the Player's Position (FloorPregenerator Runs this in a Worker)
         self.dungeon_level += 1
-        entities = [player]
-        particles = []
+        entities = self.track_entities([player])
+        particles = ParticleStore()
         particle_systems = []
         self.player = player
         self.encounters = []
         self.rooms = []
         self.entrances = []
-        self.map_objects = []
-        for y in range(self.height):
-            for x in range(self.width):
-                self.walkable[y][x] = False
-                self.transparent[y][x] = True
-                self.fov[y][x] = True
-                self.explored[y][x] = False
+        self.map_objects = EntityList()
+        self.fill_layers(walkable=False, transparent=True, fov=True, explored=False)
 
         print('Advancing for to next level.', self.level)
         self.make_map(constants['max_rooms'], constants['room_min_size'], constants['room_max_size'],
                       constants['map_width'], constants['map_height'], player, entities, particles, particle_systems,
                       self.encounters, self.level)
+        return entities, particles, particle_systems
 
-
+    def announce_floor(self, player, message_log):
         message_log.add_message(Message('You advance to the next level: Dungeon Level %s!' % self.dungeon_level,
                                         libtcod.light_violet))
 
@@ -306,7 +387,6 @@ class GameMap(Map):
         else:
             message_log.add_message(Message('You take take a breather before trudging on.', libtcod.light_green))
         player.fighter.heal(player.fighter.max_hp)
-        return entities, particles, particle_systems
 
     def obtain_open_floor(self, points):
         # print('obtain_open_floor', points)
@@ -363,8 +443,4 @@ class GameMap(Map):
         return (None, None)
 
     def obtain_map_objects(self, x, y):
-        for map_object in self.map_objects:
-            if (map_object.position.x, map_object.position.y) == (x, y):
-                return map_object
-
-        return None
\ No newline at end of file
+        return self.map_object_index.first_at(x, y)
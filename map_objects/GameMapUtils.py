@@ -3,19 +3,16 @@ import numpy as np
 
 from loader_functions import JsonReader
 
-IMPACT_TECH = JsonReader.obtain_json_data("impact_tech")
 
-
-def get_blocking_entity_at_location(entities, destination_x, destination_y):
+def get_blocking_entity_at_location(entity_index, destination_x, destination_y):
     # Check if Entity is "Blocking" at X, Y Location Specified
-    for entity in entities:
-        if entity.blocks and entity.position.x == destination_x and entity.position.y == destination_y:
-            return entity
+    for entity in entity_index.blocking_at(destination_x, destination_y):
+        return entity
 
     return None
 
 
-def get_blocking_entities_at_location(entities, target_x, target_y, origin_x, origin_y, technique_name=None):
+def get_blocking_entities_at_location(entity_index, target_x, target_y, origin_x, origin_y, technique_name=None):
     # print('\nget_blocking_entities_at_location')
     opposite_x = target_x - origin_x
     opposite_y = target_y - origin_y
@@ -36,7 +33,7 @@ def get_blocking_entities_at_location(entities, target_x, target_y, origin_x, or
 
     """
     if technique_name:
-        technique_dict = IMPACT_TECH.get(technique_name)
+        technique_dict = JsonReader.obtain_json_data("impact_tech").get(technique_name)
 
 
         diagonal_vars = {(-1, -1): 3, (1, -1): 2, (-1, 1): 4, (1, 1): 1}
@@ -93,16 +90,20 @@ def get_blocking_entities_at_location(entities, target_x, target_y, origin_x, or
     # Check if Entity is "Blocking" at X, Y Location Specified
     main_target = []
     targetable_entities = []
-    for entity in entities:
 
-        # Place Main Target to front
-        if entity.blocks and (entity.position.x, entity.position.y) == (target_x, target_y) and entity.name != "Player":
+    # Place Main Target to front
+    for entity in entity_index.blocking_at(target_x, target_y):
+        if entity.name != "Player":
             main_target = [entity]
+
+    for (x, y) in list(targetable_positions):
+        if (x, y) == (target_x, target_y):
             continue
 
-        if entity.blocks and (entity.position.x, entity.position.y) in targetable_positions:
-            targetable_entities.append(entity)
-            targetable_positions.remove((entity.position.x, entity.position.y))
+        blocking_entities = entity_index.blocking_at(x, y)
+        if blocking_entities and blocking_entities[0] not in targetable_entities:
+            targetable_entities.append(blocking_entities[0])
+            targetable_positions.remove((x, y))
 
     # if not main_target:
     #     return [], targetable_positions
@@ -114,9 +115,35 @@ def get_blocking_entities_at_location(entities, target_x, target_y, origin_x, or
     return main_target + targetable_entities, targetable_positions
 
 
-def get_map_object_at_location(map_objects, destination_x, destination_y):
+def get_map_object_at_location(map_object_index, destination_x, destination_y):
     # Check if Object is "Blocking" at X, Y Location Specified
-    for map_object in map_objects:
-        if map_object.position.x == destination_x and map_object.position.y == destination_y:
-            return map_object
-    return None
+    return map_object_index.first_at(destination_x, destination_y)
+
+
+def get_closest_visible_enemy(entity_index, entity, player):
+    """
+    Closest hostile AI (or the player) that "entity" can see within its fov_range, as (distance, target).
+    Only the spatial regions around "entity" are visited and factions are filtered with a hostile set lookup,
+    instead of checking every other entity on the map. Returns (None, None) if nothing is found.
+    """
+    hostile_factions = entity.faction.hostile_factions()
+    fov_range = entity.fighter.fov_range
+
+    closest_distance = None
+    closest_target = None
+    for other_entity in entity_index.near(entity.position.x, entity.position.y, fov_range):
+
+        # Check if AI and Enemy Faction
+        if not (other_entity.ai or other_entity is player):
+            continue
+        if other_entity.faction.faction_name not in hostile_factions:
+            continue
+
+        # Check within Distance and Entity's FOV
+        distance = int(entity.position.distance_to(other_entity.position.x, other_entity.position.y)) + 1
+        if distance <= fov_range and entity.fighter.sees(other_entity.position.x, other_entity.position.y):
+            if closest_distance is None or distance < closest_distance:
+                closest_distance = distance
+                closest_target = other_entity
+
+    return closest_distance, closest_target
@@ -0,0 +1,35 @@
+import numpy as np
+
+from map_objects.TileRegistry import TILES
+
+# propagate_property: (particle spawned on each new cell, damage to the fighter standing there, tile left behind)
+PROPAGATION_RULES = {
+    'flammable': ('fire', 25, 4),
+    'conductor': ('lightning', 40, None),
+}
+
+
+def spread_mask(burning, propagates_through, covered):
+    """
+    One step of the propagation cellular automaton over [y][x] masks: every cell cardinally adjacent to a burning cell
+    that the medium propagates through and that the particle system hasn't covered yet.
+    """
+    spread = np.zeros_like(burning)
+    spread[1:, :] |= burning[:-1, :]
+    spread[:-1, :] |= burning[1:, :]
+    spread[:, 1:] |= burning[:, :-1]
+    spread[:, :-1] |= burning[:, 1:]
+    return spread & propagates_through & ~covered
+
+
+def obtain_spread_cells(game_map, particle_system, propagate_property, xs, ys):
+    # Cells the Particles at (xs, ys) Spread to this Turn, as (xs, ys) Arrays
+    shape = game_map.tileset_tiles.shape
+    burning = np.zeros(shape, dtype=bool)
+    burning[ys, xs] = True
+
+    propagates_through = TILES.property_mask(game_map.tileset_tiles, propagate_property)
+    spread = spread_mask(burning, propagates_through, particle_system.obtain_coverage(shape))
+
+    spread_ys, spread_xs = np.nonzero(spread)
+    return spread_xs, spread_ys
@@ -0,0 +1,34 @@
+from tcod.path import AStar
+
+
+class PathfinderCache:
+    """
+    One tcod AStar per diagonal cost, built over the map's numpy tile_cost array.
+
+    AStar reads the cost array through a pointer rather than copying it, so every tile_cost write (doors, mobs
+    stepping onto a tile, ...) is seen by the next get_path without rebuilding. The graphs are only rebuilt when
+    GameMap.tile_cost itself is replaced, e.g. by initialize_open_map/initialize_closed_map.
+    """
+
+    def __init__(self):
+        self.cost = None  # the tile_cost array the pathfinders were built over
+        self.pathfinders = {}  # diagonal_cost: AStar
+
+    def obtain(self, game_map, diagonal_cost=1.41):
+        if self.cost is not game_map.tile_cost:
+            self.cost = game_map.tile_cost
+            self.pathfinders = {}
+
+        pathfinder = self.pathfinders.get(diagonal_cost)
+        if pathfinder is None:
+            pathfinder = AStar(self.cost, diagonal_cost)
+            self.pathfinders[diagonal_cost] = pathfinder
+
+        return pathfinder
+
+    def __getstate__(self):
+        # AStar wraps C data and cannot be pickled, rebuilt on first use after loading
+        return {'cost': None, 'pathfinders': {}}
+
+    def __repr__(self):
+        return "PathfinderCache pathfinders={}".format(sorted(self.pathfinders.keys()))
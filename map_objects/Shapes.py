@@ -1,5 +1,5 @@
 
-from random import choice, randint
+import random
 
 
 class SquareRoom:
@@ -41,8 +41,8 @@ class SquareRoom:
         return (self.x1 <= other_shape.x2 and self.x2 >= other_shape.x1 and
                 self.y1 <= other_shape.y2 and self.y2 >= other_shape.y1)
 
-    def obtain_point_within(self, padding=2):
-        return randint(self.x1, self.x2), randint(self.y1, self.y2)
+    def obtain_point_within(self, padding=2, rng=random):
+        return rng.randint(self.x1, self.x2), rng.randint(self.y1, self.y2)
 
     @property
     def x(self):
@@ -118,7 +118,7 @@ class Circle:
     def intersect(self, *args):
         print('%s doesn\'t have an intersect function, only intersect_point(x, y).' % self.__class__)
 
-    def obtain_point_within(self, padding=2):
+    def obtain_point_within(self, padding=2, rng=random):
         points = []
         for x in range(self.x1, self.x2):
             for y in range(self.y1, self.y2):
@@ -126,7 +126,7 @@ class Circle:
                     points.append((x, y))
 
 
-        (x, y) = choice(self.game_map.obtain_open_floor(points))
+        (x, y) = rng.choice(self.game_map.obtain_open_floor(points))
         return x, y
 
 
@@ -144,7 +144,7 @@ class PolygonRoom:
                     (sum(p[1] for p in self.corners) / len(self.corners))
                     )
 
-    def obtain_point_within(self, padding=2):
+    def obtain_point_within(self, padding=2, rng=random):
         x, y = 0, 0
         return (x, y)
 
@@ -179,8 +179,8 @@ class Cave:
     def check_point_within_room(self, x, y):
         return (x, y) in self.coords
 
-    def obtain_point_within(self, padding=2):
-        return choice(tuple(self.coords))
+    def obtain_point_within(self, padding=2, rng=random):
+        return rng.choice(tuple(self.coords))
 
     @property
     def x(self):
@@ -216,8 +216,8 @@ class BSPRoom(SquareRoom):
     def check_point_within_room(self, x, y, padding=2):
         return self.x1 + padding <= x <= self.x2 - padding and self.y1 + padding <= y <= self.y2 - padding
 
-    def obtain_point_within(self, padding=2):
-        return randint(self.x1 + padding, self.x2 - padding), randint(self.y1 + padding, self.y2 - padding)
+    def obtain_point_within(self, padding=2, rng=random):
+        return rng.randint(self.x1 + padding, self.x2 - padding), rng.randint(self.y1 + padding, self.y2 - padding)
 
     def obtain_entrances(self, game_map):
         entrances = []
@@ -0,0 +1,159 @@
+class SpatialIndex:
+    """
+    Cell -> Entity buckets, to answer "what is standing at (x, y)?" without scanning every entity.
+
+    Entities are tracked through their Position component. Once added, every change to position.x/position.y is
+    reported back here, so the buckets never go stale.
+
+    Entities are also bucketed into coarse REGION_SIZE x REGION_SIZE regions, so radius queries (see near()) only
+    visit the handful of regions overlapping the radius instead of every cell or every entity.
+    """
+    REGION_SIZE = 8
+
+    def __init__(self):
+        self.cells = {}  # (x, y): [entity, ...]
+        self.regions = {}  # (x // REGION_SIZE, y // REGION_SIZE): {entity: None, ...} (ordered set)
+
+    def add(self, entity):
+        position = entity.position
+        if not position:
+            return
+
+        # An Entity can only be Tracked by a Single Index at a Time
+        if position.spatial_index is not None:
+            position.spatial_index.remove(entity)
+
+        self.cells.setdefault((position.x, position.y), []).append(entity)
+        self._add_to_region(entity, position.x, position.y)
+        position.spatial_index = self
+
+    def remove(self, entity):
+        position = entity.position
+        if not position or position.spatial_index is not self:
+            return
+
+        self._discard(entity, position.x, position.y)
+        self._discard_from_region(entity, position.x, position.y)
+        position.spatial_index = None
+
+    def move(self, entity, old_x, old_y, new_x, new_y):
+        # Called by Position whenever a Tracked Entity Changes Coordinates
+        self._discard(entity, old_x, old_y)
+        self.cells.setdefault((new_x, new_y), []).append(entity)
+
+        if self.region_of(old_x, old_y) != self.region_of(new_x, new_y):
+            self._discard_from_region(entity, old_x, old_y)
+            self._add_to_region(entity, new_x, new_y)
+
+    def _discard(self, entity, x, y):
+        bucket = self.cells.get((x, y))
+        if bucket and entity in bucket:
+            bucket.remove(entity)
+            if not bucket:
+                del self.cells[(x, y)]
+
+    def region_of(self, x, y):
+        return x // self.REGION_SIZE, y // self.REGION_SIZE
+
+    def _add_to_region(self, entity, x, y):
+        self.regions.setdefault(self.region_of(x, y), {})[entity] = None
+
+    def _discard_from_region(self, entity, x, y):
+        region_key = self.region_of(x, y)
+        region = self.regions.get(region_key)
+        if region and entity in region:
+            del region[entity]
+            if not region:
+                del self.regions[region_key]
+
+    def at(self, x, y):
+        return self.cells.get((x, y), ())
+
+    def first_at(self, x, y):
+        bucket = self.cells.get((x, y))
+        if bucket:
+            return bucket[0]
+        return None
+
+    def blocking_at(self, x, y):
+        # "blocks" is flipped off when a mob dies, so filter on lookup rather than on insert
+        return [entity for entity in self.cells.get((x, y), ()) if entity.blocks]
+
+    def is_occupied(self, x, y):
+        return (x, y) in self.cells
+
+    def near(self, x, y, radius):
+        """
+        Yield every tracked entity in the regions overlapping the square of the given radius around (x, y).
+        This is a superset of the entities within radius, callers still check the exact distance.
+        """
+        region_x_start, region_y_start = self.region_of(x - radius, y - radius)
+        region_x_end, region_y_end = self.region_of(x + radius, y + radius)
+
+        for region_y in range(region_y_start, region_y_end + 1):
+            for region_x in range(region_x_start, region_x_end + 1):
+                region = self.regions.get((region_x, region_y))
+                if region:
+                    yield from list(region)
+
+    def clear(self):
+        for bucket in self.cells.values():
+            for entity in bucket:
+                entity.position.spatial_index = None
+        self.cells = {}
+        self.regions = {}
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self.cells.values())
+
+    def __getstate__(self):
+        # Indexes are rebuilt from their EntityList on load, never saved
+        return {'cells': {}, 'regions': {}}
+
+    def __repr__(self):
+        return "SpatialIndex cells={} entities={}".format(len(self.cells), len(self))
+
+
+class EntityList(list):
+    """
+    List of Entities that keeps a SpatialIndex in sync with whatever is added to or removed from it.
+    Drop-in replacement for the plain lists passed around as "entities" and "game_map.map_objects".
+    """
+
+    def __init__(self, entities=(), spatial_index=None):
+        super(EntityList, self).__init__()
+        self.spatial_index = spatial_index if spatial_index is not None else SpatialIndex()
+        self.extend(entities)
+
+    def append(self, entity):
+        super(EntityList, self).append(entity)
+        self.spatial_index.add(entity)
+
+    def extend(self, entities):
+        for entity in entities:
+            self.append(entity)
+
+    def insert(self, index, entity):
+        super(EntityList, self).insert(index, entity)
+        self.spatial_index.add(entity)
+
+    def remove(self, entity):
+        super(EntityList, self).remove(entity)
+        self.spatial_index.remove(entity)
+
+    def pop(self, index=-1):
+        entity = super(EntityList, self).pop(index)
+        self.spatial_index.remove(entity)
+        return entity
+
+    def clear(self):
+        super(EntityList, self).clear()
+        self.spatial_index.clear()
+
+    def __iadd__(self, entities):
+        self.extend(entities)
+        return self
+
+    def __reduce__(self):
+        # Rebuild a fresh SpatialIndex when unpickled instead of restoring a stale one
+        return self.__class__, (list(self),)
@@ -0,0 +1,91 @@
+import numpy as np
+
+from loader_functions.JsonReader import obtain_tile_set
+
+
+class TileRegistry:
+    """
+    tile_set.json compiled into dense numpy lookup tables indexed by integer tile id.
+
+    Hot paths read TILES.walkable[tile] (or TILES.walkable[game_map.tileset_tiles] for a whole map at once) instead
+    of formatting the id into a string and going through TILE_SET.get('%s' % tile).get('walkable').
+    The raw json entry is still available through stats() for the rarely used fields (names, interact functions).
+    refresh() recompiles the tables in place when tile_set.json has been edited, so TILES never has to be re-imported.
+    """
+
+    def __init__(self, tile_set):
+        self.compile(tile_set)
+
+    def compile(self, tile_set):
+        self.tile_set = tile_set
+        size = max(int(tile_id) for tile_id in tile_set) + 1
+
+        self.walkable = np.zeros(size, dtype=bool)
+        self.transparent = np.zeros(size, dtype=bool)
+        self.fov = np.zeros(size, dtype=bool)
+        self.tile_cost = np.zeros(size, dtype=np.int32)
+        self.color = np.zeros((size, 3), dtype=np.uint8)
+        self.fg_color = np.full((size, 3), 255, dtype=np.uint8)  # tcod.white when a tile has no fg_color
+        self.has_fg_color = np.zeros(size, dtype=bool)
+        self.glyph = np.zeros(size, dtype=np.int32)  # unicode codepoint of the tile's glyph
+        self.properties = np.zeros(size, dtype=np.uint32)  # bitmask, see property_bit()
+        self.property_bits = {}  # property name: bit
+
+        for tile_id, stats in tile_set.items():
+            index = int(tile_id)
+            self.walkable[index] = stats.get('walkable', False)
+            self.transparent[index] = stats.get('transparent', False)
+            self.fov[index] = stats.get('fov', False)
+            self.tile_cost[index] = stats.get('tile_cost', 0)
+            self.color[index] = stats.get('color', (0, 0, 0))
+
+            if 'fg_color' in stats:
+                self.fg_color[index] = stats.get('fg_color')
+                self.has_fg_color[index] = True
+
+            if stats.get('glyph'):
+                self.glyph[index] = ord(stats.get('glyph'))
+
+            for tile_property in stats.get('properties', []):
+                if tile_property:
+                    self.properties[index] |= self.property_bit(tile_property)
+
+        # Darkened Palettes for Explored Tiles Outside FOV, Same Math as tcod.color_lerp(color, black, 0.75)
+        self.dark_color = (self.color * 0.25).astype(np.uint8)
+        self.dark_fg_color = (self.fg_color * 0.25).astype(np.uint8)
+
+    def refresh(self):
+        # The AssetRegistry Hands Back a New Table only when tile_set.json was Re-Parsed, Returns True if Recompiled
+        tile_set = obtain_tile_set()
+        if tile_set is self.tile_set:
+            return False
+        self.compile(tile_set)
+        return True
+
+    def property_bit(self, tile_property):
+        if tile_property not in self.property_bits:
+            self.property_bits[tile_property] = 1 << len(self.property_bits)
+        return self.property_bits[tile_property]
+
+    def has_property(self, tile_id, tile_property):
+        bit = self.property_bits.get(tile_property)
+        return bit is not None and bool(self.properties[tile_id] & bit)
+
+    def property_mask(self, tiles, tile_property):
+        # Boolean Array the Shape of "tiles", True where the Tile has the Property
+        bit = self.property_bits.get(tile_property)
+        if bit is None:
+            return np.zeros(np.shape(tiles), dtype=bool)
+        return (self.properties[tiles] & bit) != 0
+
+    def stats(self, tile_id):
+        return self.tile_set.get('%s' % tile_id)
+
+    def __len__(self):
+        return len(self.walkable)
+
+    def __repr__(self):
+        return "TileRegistry tiles={} properties={}".format(len(self), list(self.property_bits))
+
+
+TILES = TileRegistry(obtain_tile_set())